@@ -0,0 +1,57 @@
+import argparse
+import time
+
+import numpy as np
+
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.dataset import Dataset
+from neuralogic.nn.module import GCNConv
+from neuralogic.nn.optim import SGD
+
+
+def skewed_graphs(graphs: int, min_nodes: int, max_nodes: int, degree: int, dim: int, seed: int) -> Dataset:
+    rng = np.random.default_rng(seed)
+    dataset = Dataset()
+
+    for _ in range(graphs):
+        nodes = int(np.exp(rng.uniform(np.log(min_nodes), np.log(max_nodes))))
+        edge_index = rng.integers(0, nodes, size=(2, nodes * degree)).tolist()
+        example = [R.edge(int(u), int(v)) for u, v in zip(*edge_index)]
+        example.extend(R.feature(i)[rng.random(dim).tolist()] for i in range(nodes))
+
+        dataset.add(R.predict[float(rng.random())], example)
+    return dataset
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-graphs", nargs="?", help="number of graphs", type=int, default=64)
+    parser.add_argument("-min_nodes", nargs="?", help="minimal number of nodes per graph", type=int, default=10)
+    parser.add_argument("-max_nodes", nargs="?", help="maximal number of nodes per graph", type=int, default=2000)
+    parser.add_argument("-degree", nargs="?", help="mean node degree", type=int, default=4)
+    parser.add_argument("-dim", nargs="?", help="feature dimension", type=int, default=8)
+    parser.add_argument("-batch_size", nargs="?", help="mini-batch size", type=int, default=8)
+    parser.add_argument("-threads", nargs="?", help="number of training threads", type=int, default=None)
+    parser.add_argument("-epochs", nargs="?", help="number of epochs", type=int, default=5)
+    parser.add_argument("-seed", nargs="?", help="random seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    model = Model()
+    model.add_module(GCNConv(args.dim, args.dim, "h", "feature", "edge"))
+    model.add_rule(R.predict[1, args.dim] <= R.h(V.X))
+    model.build(Settings(optimizer=SGD(0.01)))
+
+    graphs = skewed_graphs(args.graphs, args.min_nodes, args.max_nodes, args.degree, args.dim, args.seed)
+    dataset = model.build_dataset(graphs, batch_size=args.batch_size)
+
+    print(f"{'batching':>10} {'utilization':>12} {'per epoch [s]':>14}")
+
+    for name, balance in [("in order", False), ("bucketed", True)]:
+        scheduled, schedule = dataset.schedule(args.threads, balance=balance, seed=args.seed)
+        model.train_epochs(scheduled, 1)
+
+        start = time.perf_counter()
+        model.train_epochs(scheduled, args.epochs)
+        print(f"{name:>10} {schedule.utilization:>12.1%} {(time.perf_counter() - start) / args.epochs:>14.3f}")
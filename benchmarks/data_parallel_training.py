@@ -0,0 +1,51 @@
+import argparse
+import time
+
+from benchmarks.helpers import random_graphs
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.nn.module import GCNConv
+from neuralogic.nn.optim import SGD
+from neuralogic.nn.trainer import DataParallel
+
+
+def train(model: Model, dataset, workers: int, epochs: int, sync_every: int) -> tuple[float, float]:
+    if workers == 1:
+        start = time.perf_counter()
+        losses = model.train_epochs(dataset, epochs).losses
+        return (time.perf_counter() - start) / epochs, losses[-1]
+
+    with DataParallel(model, dataset, workers, sync_every=sync_every) as data_parallel:
+        start = time.perf_counter()
+        losses = [data_parallel.train_epoch() for _ in range(epochs)]
+        return (time.perf_counter() - start) / epochs, losses[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-workers", nargs="*", help="numbers of worker processes", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("-graphs", nargs="?", help="number of graphs", type=int, default=400)
+    parser.add_argument("-nodes", nargs="?", help="number of nodes per graph", type=int, default=100)
+    parser.add_argument("-edges", nargs="?", help="number of edges per graph", type=int, default=400)
+    parser.add_argument("-dim", nargs="?", help="feature dimension", type=int, default=16)
+    parser.add_argument("-epochs", nargs="?", help="number of epochs", type=int, default=10)
+    parser.add_argument("-sync_every", nargs="?", help="mini-batch steps between weight averaging", type=int, default=1)
+    parser.add_argument("-seed", nargs="?", help="random seed", type=int, default=0)
+
+    args = parser.parse_args()
+    dataset = random_graphs(args.graphs, args.nodes, args.edges, args.dim, args.seed)
+
+    print(f"{'workers':>8} {'per epoch [s]':>14} {'speedup':>8} {'loss':>10}")
+    baseline = None
+
+    for workers in args.workers:
+        model = Model()
+        model.add_module(GCNConv(args.dim, args.dim, "h", "feature", "edge"))
+        model.add_rule(R.predict[1, args.dim] <= R.h(V.X))
+        model.build(Settings(optimizer=SGD(0.01)))
+
+        built = model.build_dataset(dataset)
+        elapsed, loss = train(model, built, workers, args.epochs, args.sync_every)
+        baseline = baseline or elapsed
+
+        print(f"{workers:>8} {elapsed:>14.3f} {baseline / elapsed:>8.2f} {loss:>10.4f}")
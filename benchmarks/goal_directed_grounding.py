@@ -0,0 +1,59 @@
+import argparse
+import random
+import time
+
+from neuralogic.core import Model, R, V
+
+
+def transport_network(lines: int, stations: int, seed: int) -> list:
+    """Returns facts of a network of lines, each connecting a sequence of stations, with random interchanges"""
+    rng = random.Random(seed)
+    facts = []
+
+    for line in range(lines):
+        for station in range(stations - 1):
+            facts.append(R.connected(f"s{line}_{station}", f"s{line}_{station + 1}"))
+
+        other = rng.randrange(lines)
+        facts.append(R.connected(f"s{line}_{stations - 1}", f"s{other}_{rng.randrange(stations)}"))
+    return facts
+
+
+def evaluate(model: Model, query, examples: list, goal_directed: bool) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    results = model.query(query, examples, goal_directed=goal_directed)
+    elapsed = time.perf_counter() - start
+
+    grounded_model = model.goal_directed(query) if goal_directed else model
+    atoms = grounded_model.derivable_queries(examples)
+
+    return elapsed, len(atoms), len(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-lines", nargs="?", help="number of lines", type=int, default=20)
+    parser.add_argument("-stations", nargs="?", help="number of stations per line", type=int, default=20)
+    parser.add_argument("-seed", nargs="?", help="random seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    model = Model()
+    model.add_rules(
+        [
+            R.reachable(V.X, V.Y) <= R.connected(V.X, V.Y),
+            R.reachable(V.X, V.Y) <= (R.connected(V.X, V.Z), R.reachable(V.Z, V.Y)),
+        ]
+    )
+
+    examples = transport_network(args.lines, args.stations, args.seed)
+    query = R.reachable(f"s0_{args.stations // 2}", f"s{args.lines - 1}_0")
+
+    print(f"{len(examples)} facts, query {query}")
+    print(f"{'mode':>14} {'time [s]':>10} {'grounded atoms':>16} {'results':>8}")
+
+    for goal_directed in [False, True]:
+        elapsed, atoms, results = evaluate(model, query, examples, goal_directed)
+        mode = "goal-directed" if goal_directed else "full"
+        print(f"{mode:>14} {elapsed:>10.3f} {atoms:>16} {results:>8}")
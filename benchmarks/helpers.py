@@ -1,5 +1,10 @@
 import dataclasses
 
+import numpy as np
+
+from neuralogic.core import R
+from neuralogic.dataset import Dataset
+
 
 @dataclasses.dataclass
 class Task:
@@ -8,3 +13,16 @@ class Task:
     activation: str = "sigmoid"
     loss: str = "crossentropy"
     task: str = "classification"
+
+
+def random_graphs(graphs: int, nodes: int, edges: int, dim: int, seed: int, labels: bool = True) -> Dataset:
+    rng = np.random.default_rng(seed)
+    dataset = Dataset()
+
+    for _ in range(graphs):
+        edge_index = rng.integers(0, nodes, size=(2, edges)).tolist()
+        example = [R.edge(int(u), int(v)) for u, v in zip(*edge_index)]
+        example.extend(R.feature(i)[rng.random(dim).tolist()] for i in range(nodes))
+
+        dataset.add(R.predict[float(rng.random())] if labels else R.predict, example)
+    return dataset
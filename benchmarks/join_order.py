@@ -0,0 +1,55 @@
+import argparse
+import time
+
+from benchmarks.helpers import random_graphs
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.dataset import Dataset
+from neuralogic.nn.module import GATv2Conv, GCNConv, GINConv, ResGatedGraphConv, SAGEConv, TAGConv
+
+MODULES = {
+    "gcn": lambda dim: GCNConv(dim, dim, "h", "feature", "edge"),
+    "gsage": lambda dim: SAGEConv(dim, dim, "h", "feature", "edge"),
+    "gin": lambda dim: GINConv(dim, dim, "h", "feature", "edge"),
+    "gatv2": lambda dim: GATv2Conv(dim, dim, "h", "feature", "edge"),
+    "res_gated": lambda dim: ResGatedGraphConv(dim, dim, "h", "feature", "edge"),
+    "tag": lambda dim: TAGConv(dim, dim, "h", "feature", "edge"),
+}
+
+
+def evaluate(name: str, dataset: Dataset, dim: int, planned: bool) -> tuple[str, float, int]:
+    model = Model()
+    model.add_module(MODULES[name](dim))
+    model.add_rule(R.predict[1, dim] <= R.h(V.X))
+
+    settings = Settings()
+    changes = model.plan_joins(dataset, settings) if planned else []
+    # The join work of the backend is estimated by the (budgeted) Python join of the explain-plan
+    report = model.explain_grounding(dataset, sample_size=3)
+    substitutions = f"{report.estimate()['substitutions']:.0f}{'+' if report.truncated else ''}"
+
+    model.build(settings)
+
+    start = time.perf_counter()
+    model.ground(dataset)
+    return substitutions, time.perf_counter() - start, len(changes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-modules", nargs="*", help="GNN modules", type=str, default=list(MODULES.keys()))
+    parser.add_argument("-graphs", nargs="?", help="number of graphs", type=int, default=50)
+    parser.add_argument("-nodes", nargs="?", help="number of nodes per graph", type=int, default=200)
+    parser.add_argument("-edges", nargs="?", help="number of edges per graph", type=int, default=800)
+    parser.add_argument("-dim", nargs="?", help="feature dimension", type=int, default=8)
+    parser.add_argument("-seed", nargs="?", help="random seed", type=int, default=0)
+
+    args = parser.parse_args()
+    dataset = random_graphs(args.graphs, args.nodes, args.edges, args.dim, args.seed, labels=False)
+
+    print(f"{'module':>10} {'planner':>8} {'reordered':>10} {'substitutions':>14} {'grounding [s]':>14}")
+
+    for name in args.modules:
+        for planned in [False, True]:
+            substitutions, elapsed, reordered = evaluate(name, dataset, args.dim, planned)
+            print(f"{name:>10} {'on' if planned else 'off':>8} {reordered:>10} {substitutions:>14} {elapsed:>14.3f}")
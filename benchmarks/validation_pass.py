@@ -0,0 +1,47 @@
+import argparse
+import time
+
+from benchmarks.helpers import random_graphs
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.nn.module import GCNConv
+from neuralogic.nn.optim import Adam
+
+
+def train_then_restore(model: Model, dataset) -> None:
+    state = model.state_dict()
+    model.train(dataset, epochs=1)
+    model.load_state_dict(state)
+
+
+def forward_only(model: Model, dataset) -> None:
+    model.evaluate(dataset)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-graphs", nargs="?", help="number of validation graphs", type=int, default=100)
+    parser.add_argument("-nodes", nargs="?", help="number of nodes per graph", type=int, default=100)
+    parser.add_argument("-edges", nargs="?", help="number of edges per graph", type=int, default=400)
+    parser.add_argument("-dim", nargs="?", help="feature dimension", type=int, default=16)
+    parser.add_argument("-epochs", nargs="?", help="number of validation passes", type=int, default=10)
+    parser.add_argument("-seed", nargs="?", help="random seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    model = Model()
+    model.add_module(GCNConv(args.dim, args.dim, "h", "feature", "edge"))
+    model.add_rule(R.predict[1, args.dim] <= R.h(V.X))
+    model.build(Settings(optimizer=Adam(0.01)))
+
+    dataset = model.build_dataset(random_graphs(args.graphs, args.nodes, args.edges, args.dim, args.seed))
+
+    print(f"{'validation':>18} {'per epoch [s]':>14}")
+
+    for name, validate in [("train-then-restore", train_then_restore), ("forward-only", forward_only)]:
+        validate(model, dataset)
+
+        start = time.perf_counter()
+        for _ in range(args.epochs):
+            validate(model, dataset)
+        print(f"{name:>18} {(time.perf_counter() - start) / args.epochs:>14.3f}")
@@ -3,6 +3,7 @@ from neuralogic.exceptions import (
     BackendError,
     ConfigurationError,
     DatasetError,
+    GroundingLimitError,
     ModelError,
     NeuraLogicError,
 )
@@ -47,6 +48,7 @@ __all__ = [
     "NeuraLogicError",
     "ModelError",
     "DatasetError",
+    "GroundingLimitError",
     "BackendError",
     "ConfigurationError",
 ]
@@ -4,6 +4,7 @@ from neuralogic.core.constructs.function import Aggregation, Combination, F, Tra
 from neuralogic.core.constructs.metadata import Metadata
 from neuralogic.core.constructs.rule import Rule, RuleBody
 from neuralogic.core.enums import Grounder
+from neuralogic.core.inference import InferenceSession
 from neuralogic.core.model import Model
 from neuralogic.core.settings import Settings, SettingsProxy
 
@@ -18,6 +19,7 @@ __all__ = [
     "Rule",
     "RuleBody",
     "Model",
+    "InferenceSession",
     "BuiltDataset",
     "GroundedDataset",
     "Transformation",
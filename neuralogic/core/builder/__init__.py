@@ -1,7 +1,16 @@
+from neuralogic.core.builder.batching import (
+    BatchSchedule,
+    BatchStatistics,
+    batch_statistics,
+    schedule_batches,
+    shuffle_batches,
+)
 from neuralogic.core.builder.builder import Builder
+from neuralogic.core.builder.cache import SampleCache, TemplateCache
 from neuralogic.core.builder.components import Atom, Grounding, NeuralSample, Neuron, NeuronType
-from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset
+from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset, LazyGroundedDataset
 from neuralogic.core.builder.dataset_builder import DatasetBuilder
+from neuralogic.core.builder.prefetch import Prefetcher, PrefetchStatistics
 
 __all__ = [
     "Builder",
@@ -13,4 +22,14 @@ __all__ = [
     "NeuronType",
     "BuiltDataset",
     "GroundedDataset",
+    "LazyGroundedDataset",
+    "SampleCache",
+    "TemplateCache",
+    "Prefetcher",
+    "PrefetchStatistics",
+    "BatchSchedule",
+    "BatchStatistics",
+    "batch_statistics",
+    "schedule_batches",
+    "shuffle_batches",
 ]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import heapq
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class BatchStatistics:
+    """
+    The estimated thread utilization of one mini-batch processed in parallel. Samples of the mini-batch are assumed to
+    be processed by ``threads`` threads, each taking the largest remaining sample when it finishes (work stealing), with
+    the work of a sample proportional to its number of neurons.
+
+    Attributes
+    ----------
+    samples : int
+        The number of samples in the mini-batch.
+    work : float
+        The total work (the number of neurons) of the samples.
+    makespan : float
+        The estimated work of the busiest thread - the time until the whole mini-batch is processed.
+    threads : int
+        The number of threads the mini-batch can occupy (at most the number of samples).
+    utilization : float
+        The estimated fraction of time the threads are busy (``work / (threads * makespan)``).
+    """
+
+    samples: int
+    work: float
+    makespan: float
+    threads: int
+    utilization: float
+
+
+@dataclass
+class BatchSchedule:
+    """
+    The order of samples forming mini-batches and the estimated thread utilization of each mini-batch.
+
+    Attributes
+    ----------
+    order : list[int]
+        The indices of samples in the scheduled order - consecutive runs of ``batch_size`` samples form mini-batches.
+    batches : list[BatchStatistics]
+        The statistics of each mini-batch.
+    """
+
+    order: list[int] = field(default_factory=list)
+    batches: list[BatchStatistics] = field(default_factory=list)
+
+    @property
+    def utilization(self) -> float:
+        """The estimated thread utilization of all mini-batches (the total work over the total thread time)."""
+        thread_time = sum(batch.threads * batch.makespan for batch in self.batches)
+        return sum(batch.work for batch in self.batches) / thread_time if thread_time > 0 else 1.0
+
+    @property
+    def makespan(self) -> float:
+        """The estimated work of the busiest threads summed over all mini-batches (processed one after another)."""
+        return sum(batch.makespan for batch in self.batches)
+
+    def __str__(self) -> str:
+        utilizations = [batch.utilization for batch in self.batches]
+        return (
+            f"{len(self.batches)} mini-batches, thread utilization {self.utilization:.1%} "
+            f"(min {min(utilizations, default=1.0):.1%}, makespan {self.makespan:g} neurons)"
+        )
+
+
+def batch_statistics(work: Sequence[float], threads: int) -> BatchStatistics:
+    """
+    Estimates the thread utilization of one mini-batch - samples are taken by idle threads from the largest one (the
+    longest-processing-time-first schedule of work stealing threads).
+
+    Parameters
+    ----------
+    work : Sequence[float]
+        The work (the number of neurons) of each sample of the mini-batch.
+    threads : int
+        The number of threads.
+
+    Returns
+    -------
+    BatchStatistics
+        The statistics of the mini-batch.
+    """
+    if threads < 1:
+        raise ValueError(f"The number of threads has to be positive, got {threads}")
+
+    threads = max(1, min(threads, len(work)))
+    loads = [0.0] * threads
+
+    for sample_work in sorted(work, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + sample_work)
+
+    total = float(sum(work))
+    makespan = max(loads)
+    utilization = total / (threads * makespan) if makespan > 0 else 1.0
+
+    return BatchStatistics(len(work), total, makespan, threads, utilization)
+
+
+def schedule_batches(
+    work: Sequence[float],
+    batch_size: int,
+    threads: int | None = None,
+    *,
+    balance: bool = True,
+    seed: int | None = None,
+) -> BatchSchedule:
+    """
+    Orders samples into mini-batches of samples of similar sizes (size-aware bucketing), so threads processing a
+    mini-batch in parallel finish at about the same time instead of waiting for the largest sample. Samples are sorted
+    by their work and split into mini-batches of ``batch_size`` samples, and the order of the mini-batches is shuffled.
+
+    Parameters
+    ----------
+    work : Sequence[float]
+        The work (the number of neurons) of each sample.
+    batch_size : int
+        The number of samples in one mini-batch.
+    threads : int, optional
+        The number of threads processing a mini-batch. Default: None (the number of CPUs).
+    balance : bool
+        Whether to reorder the samples. If False, the statistics of mini-batches in the given order are returned.
+        Default: True.
+    seed : int, optional
+        The seed of shuffling of the mini-batches. Default: None (the mini-batches are ordered from the largest).
+
+    Returns
+    -------
+    BatchSchedule
+        The schedule of the samples.
+    """
+    if batch_size < 1:
+        raise ValueError(f"Batch size has to be positive, got {batch_size}")
+
+    threads = threads or os.cpu_count() or 1
+    order = list(range(len(work)))
+
+    if balance:
+        order.sort(key=lambda index: work[index], reverse=True)
+
+    schedule = BatchSchedule(
+        order,
+        [
+            batch_statistics([work[index] for index in order[i : i + batch_size]], threads)
+            for i in range(0, len(order), batch_size)
+        ],
+    )
+
+    if balance and seed is not None:
+        return shuffle_batches(schedule, batch_size, seed)[0]
+    return schedule
+
+
+def shuffle_batches(schedule: BatchSchedule, batch_size: int, seed: int) -> tuple[BatchSchedule, list[int]]:
+    """
+    Shuffles the order of mini-batches of a schedule - samples of each mini-batch stay together, so the statistics of
+    the mini-batches do not have to be estimated again.
+
+    Parameters
+    ----------
+    schedule : BatchSchedule
+        The schedule to shuffle.
+    batch_size : int
+        The number of samples in one mini-batch.
+    seed : int
+        The seed of shuffling of the mini-batches.
+
+    Returns
+    -------
+    tuple[BatchSchedule, list[int]]
+        The shuffled schedule and the permutation of the mini-batches (indices of the mini-batches of ``schedule``).
+    """
+    permutation = np.random.default_rng(seed).permutation(len(schedule.batches)).tolist()
+    order = [index for batch in permutation for index in schedule.order[batch * batch_size : (batch + 1) * batch_size]]
+
+    return BatchSchedule(order, [schedule.batches[batch] for batch in permutation]), permutation
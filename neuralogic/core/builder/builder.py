@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Any
 
 import jpype
@@ -26,6 +27,57 @@ def stream_to_list(stream: Any) -> list:
     return list(stream.collect(jpype.JClass("java.util.stream.Collectors").toList()))
 
 
+def iterator_to_stream(iterator: Iterator[Any]) -> Any:
+    """
+    Wraps a Python iterator into a sequential Java stream. Items are pulled from the iterator lazily, only when
+    the stream is consumed by the backend.
+
+    Parameters
+    ----------
+    iterator : Iterator[Any]
+        The Python iterator of Java objects.
+
+    Returns
+    -------
+    Any
+        The Java stream.
+    """
+
+    @jpype.JImplements(jpype.JClass("java.util.Iterator"))
+    class JavaIterator:
+        def __init__(self, python_iterator: Iterator[Any]):
+            self.python_iterator = python_iterator
+            self.next_item = None
+            self.has_next_item = None
+
+        @jpype.JOverride
+        def hasNext(self) -> bool:
+            if self.has_next_item is None:
+                try:
+                    self.next_item = next(self.python_iterator)
+                    self.has_next_item = True
+                except StopIteration:
+                    self.has_next_item = False
+            return self.has_next_item
+
+        @jpype.JOverride
+        def next(self) -> Any:
+            if not self.hasNext():
+                raise jpype.JClass("java.util.NoSuchElementException")()
+
+            item = self.next_item
+            self.next_item = None
+            self.has_next_item = None
+            return item
+
+    spliterators = jpype.JClass("java.util.Spliterators")
+    spliterator = spliterators.spliteratorUnknownSize(
+        JavaIterator(iterator), jpype.JClass("java.util.Spliterator").ORDERED
+    )
+
+    return jpype.JClass("java.util.stream.StreamSupport").stream(spliterator, False)
+
+
 class Builder:
     """
     Builder is responsible for grounding, neuralizing, and building models from models and sources.
@@ -136,13 +188,40 @@ class Builder:
         with tqdm(total=len(logic_samples), desc="Grounding", unit=" samples", dynamic_ncols=True) as pbar:
             return self._ground(parsed_model, None, logic_samples, self._callback(pbar))
 
-    def _ground(
-        self, parsed_model: Any, sources: Sources | None, logic_samples: list[Any] | None, callback: Any
+    def ground_from_logic_sample_iterator(
+        self, parsed_model: Any, logic_samples: Iterator[Any], progress: bool, length: int | None = None
     ) -> Any:
+        """
+        Grounds the model from logic samples produced lazily by an iterator. The samples are pulled from the iterator
+        only as the backend consumes them, so they never have to be held in a Python list.
+
+        Parameters
+        ----------
+        parsed_model : Any
+            The parsed model.
+        logic_samples : Iterator[Any]
+            The iterator of logic samples.
+        progress : bool
+            Whether to show progress.
+        length : int, optional
+            The expected number of samples (used only for the progress bar). Default: None.
+
+        Returns
+        -------
+        Any
+            The grounded logic samples.
+        """
+        if not progress:
+            return self._ground(parsed_model, None, iterator_to_stream(logic_samples), None)
+        with tqdm(total=length, desc="Grounding", unit=" samples", dynamic_ncols=True) as pbar:
+            return self._ground(parsed_model, None, iterator_to_stream(logic_samples), self._callback(pbar))
+
+    def _ground(self, parsed_model: Any, sources: Sources | None, logic_samples: Any, callback: Any) -> Any:
         if sources is not None:
             ground_pipeline = self.example_builder.buildGroundings(parsed_model, sources.sources, callback)
         else:
-            logic_samples = jpype.java.util.ArrayList(logic_samples).stream()
+            if isinstance(logic_samples, list):
+                logic_samples = jpype.java.util.ArrayList(logic_samples).stream()
             ground_pipeline = self.example_builder.buildGroundings(parsed_model, logic_samples, callback)
 
         ground_pipeline.execute(None if sources is None else sources.sources)
@@ -175,6 +254,51 @@ class Builder:
         with tqdm(total=length, desc="Building", unit=" samples", dynamic_ncols=True) as pbar:
             return self._neuralize(groundings, self._callback(pbar))
 
+    def neuralize_in_chunks(
+        self, groundings: Any, chunk_size: int, progress: bool, length: int | None = None
+    ) -> Iterator[list[NeuralSample]]:
+        """
+        Neuralizes the grounding samples in chunks. Groundings are pulled from the backend collection (or stream) only
+        when the chunk is requested, and each chunk is neuralized by a separate pipeline. The groundings of a chunk are
+        released before the chunk is yielded, unless they are still referenced by the collection (e.g., of an eagerly
+        grounded dataset).
+
+        Parameters
+        ----------
+        groundings : Any
+            The logic groundings to neuralize (a backend collection or stream).
+        chunk_size : int
+            The maximum number of samples in one chunk.
+        progress : bool
+            Whether to show progress.
+        length : int, optional
+            The total number of groundings. Default: None.
+
+        Returns
+        -------
+        Iterator[list[NeuralSample]]
+            The iterator of chunks of neuralized samples.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size has to be positive, got {chunk_size}")
+
+        iterator = groundings.iterator()
+        chunk = jpype.java.util.ArrayList()
+
+        with tqdm(total=length, desc="Building", unit=" samples", dynamic_ncols=True, disable=not progress) as pbar:
+            while True:
+                while chunk.size() < chunk_size and iterator.hasNext():
+                    chunk.add(iterator.next())
+
+                if chunk.isEmpty():
+                    return
+
+                samples = self._neuralize(chunk.stream(), None)
+                pbar.update(len(samples))
+                chunk.clear()
+
+                yield samples
+
     def _neuralize(self, groundings: Any, callback: Any) -> list[NeuralSample]:
         neuralize_pipeline = self.example_builder.neuralize(groundings, callback)
         neuralize_pipeline.execute(None)
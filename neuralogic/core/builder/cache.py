@@ -0,0 +1,445 @@
+import hashlib
+import os
+import time
+import warnings
+from pathlib import Path
+from typing import Any
+
+import jpype
+import numpy as np
+
+import neuralogic.dataset as datasets
+from neuralogic.core.builder.components import NeuralSample
+from neuralogic.core.builder.serialization import (
+    deserialize_objects,
+    deserialize_samples,
+    serialize_objects,
+    serialize_samples,
+)
+from neuralogic.core.constructs.relation import TensorRelation
+from neuralogic.core.settings import SettingsProxy
+
+
+def _update_with_array(digest: Any, array: Any) -> None:
+    if array is None:
+        digest.update(b"None")
+        return
+
+    if hasattr(array, "detach"):
+        array = array.detach().cpu().numpy()
+    array = np.ascontiguousarray(array)
+
+    digest.update(f"{array.dtype}{array.shape}".encode())
+    digest.update(array.tobytes())
+
+
+def _update_with_entries(digest: Any, entries: Any) -> None:
+    if entries is None:
+        digest.update(b"None")
+        return
+
+    if not isinstance(entries, (list, tuple)):
+        entries = [entries]
+
+    for entry in entries:
+        if isinstance(entry, TensorRelation):
+            digest.update(str(entry.predicate).encode())
+            _update_with_array(digest, entry.terms)
+            _update_with_array(digest, entry.values)
+        else:
+            digest.update(str(entry).encode())
+        digest.update(b"\n")
+
+
+def dataset_fingerprint(dataset: datasets.BaseDataset) -> str:
+    """
+    Computes a content hash of the dataset.
+
+    Parameters
+    ----------
+    dataset : datasets.BaseDataset
+        The dataset to fingerprint.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the dataset content.
+    """
+    digest = hashlib.sha256(type(dataset).__name__.encode())
+
+    if isinstance(dataset, datasets.Dataset):
+        for sample in dataset.samples:
+            _update_with_entries(digest, sample.query)
+            digest.update(b"|")
+            _update_with_entries(digest, sample.example)
+            digest.update(b";")
+
+        for example in dataset._examples:
+            _update_with_entries(digest, example)
+        for query in dataset._queries:
+            _update_with_entries(digest, query)
+    elif isinstance(dataset, datasets.TensorDataset):
+        digest.update(
+            str(
+                (
+                    dataset.one_hot_encode_labels,
+                    dataset.one_hot_decode_features,
+                    dataset.one_hot_decode_edge_features,
+                    dataset.number_of_classes,
+                    dataset.feature_name,
+                    dataset.edge_name,
+                    dataset.output_name,
+                )
+            ).encode()
+        )
+
+        for data in dataset.data:
+            for array in (data.x, data.edge_index, data.y, data.edge_attr, data.y_mask):
+                _update_with_array(digest, array)
+    elif isinstance(dataset, datasets.FileDataset):
+        for file in (dataset.examples_file, dataset.queries_file):
+            if file is None:
+                digest.update(b"None")
+                continue
+
+            with open(file, "rb") as fp:
+                for chunk in iter(lambda: fp.read(1 << 20), b""):
+                    digest.update(chunk)
+    elif isinstance(dataset, datasets.ConvertibleDataset):
+        return dataset_fingerprint(dataset.to_dataset())
+    else:
+        raise NotImplementedError
+
+    return digest.hexdigest()
+
+
+FINGERPRINTED_SETTINGS = (
+    "iso_value_compression",
+    "chain_pruning",
+    "prune_only_identities",
+    "grounder",
+    "relation_transformation",
+    "relation_combination",
+    "rule_transformation",
+    "rule_combination",
+    "rule_aggregation",
+    "default_fact_value",
+    "error_function",
+    "initializer",
+    "initializer_const",
+    "initializer_uniform_scale",
+    "lean_build",
+)
+
+
+def settings_fingerprint(settings: SettingsProxy) -> str:
+    """
+    Computes a hash of the settings that affect grounding and neuralization - the settings listed in
+    ``FINGERPRINTED_SETTINGS`` and every backend setting set by its key (``settings[key] = value``, see
+    ``SettingsProxy.kw_params``). The optimizer is not hashed, as it affects only training.
+
+    Parameters
+    ----------
+    settings : SettingsProxy
+        The settings proxy.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the settings.
+    """
+    values = [f"{name}={getattr(settings, name)}" for name in FINGERPRINTED_SETTINGS]
+    values.extend(f"{key}={value}" for key, value in sorted(settings.kw_params.items()))
+
+    return hashlib.sha256(" ".join(values).encode()).hexdigest()
+
+
+class _FileCache:
+    """Base of the persistent on-disk caches - stores entries as files and evicts them by age and by size."""
+
+    suffix = ".cache"
+
+    def __init__(self, cache_dir: str | Path, *, max_size: int | None = None, max_age: float | None = None):
+        """
+        Parameters
+        ----------
+        cache_dir : str | Path
+            The directory to store the cache entries in.
+        max_size : int, optional
+            The maximum total size of the cache (in bytes). Default: None (unlimited).
+        max_age : float, optional
+            The maximum age of an entry (in seconds). Default: None (unlimited).
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.max_age = max_age
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Removes the entry stored under the key, or all entries if the key is None.
+
+        Parameters
+        ----------
+        key : str, optional
+            The cache key. Default: None.
+        """
+        paths = self._entries() if key is None else [self._path(key)]
+
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Evicts entries exceeding the maximum age and the least recently used entries exceeding the maximum size."""
+        if self.max_age is None and self.max_size is None:
+            return
+
+        now = time.time()
+        entries = []
+
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        if self.max_size is None:
+            return
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def size(self) -> int:
+        """Returns the total size of the cache (in bytes)."""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _read(self, key: str) -> bytes | None:
+        self.evict()
+
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _touch(self, key: str) -> None:
+        path = self._path(key)
+        os.utime(path, (time.time(), path.stat().st_mtime))
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def _entries(self) -> list[Path]:
+        return list(self.cache_dir.glob(f"*{self.suffix}"))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+
+class SampleCache(_FileCache):
+    """
+    SampleCache is a persistent on-disk cache of built (grounded and neuralized) samples. Entries are keyed by the
+    fingerprint of the template, the settings, and the dataset.
+
+    Entries older than ``max_age`` are evicted, and when the total size of the cache exceeds ``max_size``, the least
+    recently used entries are evicted.
+    """
+
+    suffix = ".samples"
+
+    def key(
+        self,
+        template_fingerprint: str,
+        settings: SettingsProxy,
+        dataset: datasets.BaseDataset,
+        **options: Any,
+    ) -> str:
+        """
+        Computes the cache key.
+
+        Parameters
+        ----------
+        template_fingerprint : str
+            The fingerprint of the template (see :meth:`Model.fingerprint`).
+        settings : SettingsProxy
+            The settings used for building.
+        dataset : datasets.BaseDataset
+            The dataset to build.
+        options : Any
+            Additional build options affecting the result (e.g., ``learnable_facts``).
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        parts = [
+            template_fingerprint,
+            settings_fingerprint(settings),
+            dataset_fingerprint(dataset),
+            *(f"{name}={value}" for name, value in sorted(options.items())),
+        ]
+
+        return hashlib.sha256(" ".join(parts).encode()).hexdigest()
+
+    def load(self, key: str, weights: Any) -> list[NeuralSample] | None:
+        """
+        Loads samples stored under the key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        weights : Any
+            The template weights of the model the samples are loaded into.
+
+        Returns
+        -------
+        list[NeuralSample] | None
+            The loaded samples, or None on a cache miss.
+        """
+        data = self._read(key)
+        if data is None:
+            return None
+
+        try:
+            samples = deserialize_samples(data, weights)
+        except jpype.JException as e:
+            warnings.warn(f"Cannot load cached samples {self._path(key)}, invalidating the entry: {e}")
+            self.invalidate(key)
+            return None
+
+        self._touch(key)
+        return samples
+
+    def store(self, key: str, samples: list[NeuralSample], weights: Any) -> bool:
+        """
+        Stores samples under the key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        samples : list[NeuralSample]
+            The samples to store.
+        weights : Any
+            The template weights referenced by the samples.
+
+        Returns
+        -------
+        bool
+            Whether the samples have been stored.
+        """
+        try:
+            data = serialize_samples(samples, weights)
+        except jpype.JException as e:
+            warnings.warn(f"Cannot serialize samples into the cache: {e}")
+            return False
+
+        self._write(key, data)
+        return True
+
+
+class TemplateCache(_FileCache):
+    """
+    TemplateCache is a persistent on-disk cache of compiled templates (parsed templates with processed metadata), so
+    that new processes load the template instead of converting every rule or parsing the model file again. Entries are
+    keyed by the fingerprint of the template and the settings.
+
+    Entries older than ``max_age`` are evicted, and when the total size of the cache exceeds ``max_size``, the least
+    recently used entries are evicted.
+    """
+
+    suffix = ".template"
+
+    def key(self, template_fingerprint: str, settings: SettingsProxy) -> str:
+        """
+        Computes the cache key.
+
+        Parameters
+        ----------
+        template_fingerprint : str
+            The fingerprint of the template (see :meth:`Model.fingerprint`).
+        settings : SettingsProxy
+            The settings used for compiling the template.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        parts = [template_fingerprint, settings_fingerprint(settings)]
+        return hashlib.sha256(" ".join(parts).encode()).hexdigest()
+
+    def load(self, key: str) -> Any | None:
+        """
+        Loads the compiled template stored under the key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Any | None
+            The compiled (Java) template, or None on a cache miss.
+        """
+        data = self._read(key)
+        if data is None:
+            return None
+
+        try:
+            (template,) = deserialize_objects(data)
+        except jpype.JException as e:
+            warnings.warn(f"Cannot load cached template {self._path(key)}, invalidating the entry: {e}")
+            self.invalidate(key)
+            return None
+
+        self._touch(key)
+        return template
+
+    def store(self, key: str, template: Any) -> bool:
+        """
+        Stores the compiled template under the key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        template : Any
+            The compiled (Java) template.
+
+        Returns
+        -------
+        bool
+            Whether the template has been stored.
+        """
+        try:
+            data = serialize_objects([template])
+        except jpype.JException as e:
+            warnings.warn(f"Cannot serialize the template into the cache: {e}")
+            return False
+
+        self._write(key, data)
+        return True
@@ -106,6 +106,11 @@ class NeuralSample:
             self._neurons = self._get_neurons()
         return self._neurons
 
+    @property
+    def neuron_count(self) -> int:
+        """The number of neurons of the neural network of the sample."""
+        return int(self._java_sample.query.evidence.allNeuronsTopologic.size())
+
     @property
     def target(self) -> float | list | np.ndarray:
         from neuralogic.core.constructs.java_objects import ValueFactory
@@ -349,6 +354,35 @@ class Grounding:
             self._atoms = self._get_atoms()
         return self._atoms
 
+    @property
+    def atom_count(self) -> int:
+        """The number of ground atoms, counted from sizes of the backend collections (without converting atoms)."""
+        ground_template = self._grounding.groundingWrap.getGroundTemplate()
+
+        return int(
+            ground_template.derivedGroundFacts.size()
+            + ground_template.groundFacts.size()
+            + ground_template.templateFacts.size()
+        )
+
+    def rule_groundings(self) -> dict[str, int]:
+        """
+        Returns the number of groundings of each template rule, counted from sizes of the backend collections of
+        ground rules.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of groundings of each rule (by the rule string).
+        """
+        counts: dict[str, int] = {}
+
+        for head_rules in self._grounding.groundingWrap.getGroundTemplate().groundRules.values():
+            for entry in head_rules.entrySet():
+                rule = str(entry.getKey().weightedRule)
+                counts[rule] = counts.get(rule, 0) + int(entry.getValue().size())
+        return counts
+
     def get_atoms(self, literal: Any) -> list[Atom]:
         """
         Returns a list of grounded atoms matching the provided literal.
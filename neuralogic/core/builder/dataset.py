@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
+import jpype
+
+from neuralogic.core.builder.batching import BatchSchedule, schedule_batches, shuffle_batches
 from neuralogic.core.builder.components import Grounding, NeuralSample
+from neuralogic.core.builder.parallel import next_neuron_index, next_sample_id, offset_neuron_indices
+from neuralogic.core.grounding.incremental import DatasetSource, FactChanges
+from neuralogic.core.grounding.limits import GroundingDiagnostics
+from neuralogic.exceptions import DatasetError
 
 if TYPE_CHECKING:
     from neuralogic.core.builder import Builder
@@ -11,11 +20,13 @@ if TYPE_CHECKING:
 class BuiltDataset:
     """BuiltDataset represents an already built dataset - that is, a dataset that has been grounded and neuralized."""
 
-    __slots__ = "_samples", "_batch_size"
+    __slots__ = "_samples", "_batch_size", "_source", "_java_samples"
 
-    def __init__(self, samples: list[NeuralSample], batch_size: int):
+    def __init__(self, samples: list[NeuralSample], batch_size: int, source: DatasetSource | None = None):
         self._samples = samples
         self._batch_size = batch_size
+        self._source = source
+        self._java_samples = None
 
     def __len__(self):
         return len(self._samples)
@@ -26,16 +37,160 @@ class BuiltDataset:
     def __iter__(self):
         return iter(self._samples)
 
+    def _get_java_samples(self) -> Any:
+        """Returns the Java list of the samples passed to the backend - created once and reused across epochs."""
+        if self._java_samples is None:
+            self._java_samples = jpype.java.util.ArrayList([sample._java_sample for sample in self._samples])
+        return self._java_samples
+
+    def schedule(
+        self, threads: int | None = None, *, balance: bool = True, seed: int | None = None
+    ) -> tuple[BuiltDataset, BatchSchedule]:
+        """Returns the dataset with samples ordered into mini-batches of samples with similar numbers of neurons, so
+        threads of parallel mini-batch training finish at about the same time (see
+        :py:func:`~neuralogic.core.builder.batching.schedule_batches`), and the estimated thread utilization of each
+        mini-batch.
+
+        Parameters
+        ----------
+        threads : int, optional
+            The number of threads training a mini-batch. Default: None (the number of CPUs).
+        balance : bool
+            Whether to reorder the samples. If False, the dataset is returned as it is with the estimated utilization
+            of its mini-batches. Default: True.
+        seed : int, optional
+            The seed of shuffling of the mini-batches. Default: None (the mini-batches are ordered from the largest).
+
+        Returns
+        -------
+        tuple[BuiltDataset, BatchSchedule]
+            The scheduled dataset and the schedule.
+        """
+        work = [sample.neuron_count for sample in self._samples]
+        schedule = schedule_batches(work, self._batch_size, threads, balance=balance, seed=seed)
+
+        if not balance:
+            return self, schedule
+        return BuiltDataset([self._samples[index] for index in schedule.order], self._batch_size), schedule
+
+    def epoch_schedules(
+        self, threads: int | None = None, *, seed: int | None = None
+    ) -> Iterator[tuple[BuiltDataset, BatchSchedule]]:
+        """Yields the dataset scheduled as by :meth:`schedule` for every epoch. The samples are measured and bucketed
+        into mini-batches only once, and the Java lists of the mini-batches are created only once too - every epoch,
+        only the order of the mini-batches is shuffled.
+
+        Parameters
+        ----------
+        threads : int, optional
+            The number of threads training a mini-batch. Default: None (the number of CPUs).
+        seed : int, optional
+            The seed of shuffling of the mini-batches of the first epoch, incremented every epoch. Default: None (the
+            mini-batches are ordered from the largest in every epoch).
+
+        Returns
+        -------
+        Iterator[tuple[BuiltDataset, BatchSchedule]]
+            The infinite iterator of the scheduled datasets and the schedules.
+        """
+        scheduled, schedule = self.schedule(threads)
+
+        if seed is None:
+            while True:
+                yield scheduled, schedule
+
+        java_samples = scheduled._get_java_samples()
+        java_batches = [
+            java_samples.subList(i, min(i + self._batch_size, len(scheduled)))
+            for i in range(0, len(scheduled), self._batch_size)
+        ]
+
+        for epoch_seed in itertools.count(seed):
+            epoch_schedule, permutation = shuffle_batches(schedule, self._batch_size, epoch_seed)
+            epoch_dataset = BuiltDataset([self._samples[index] for index in epoch_schedule.order], self._batch_size)
+            epoch_dataset._java_samples = jpype.java.util.ArrayList(len(epoch_dataset))
+
+            for batch in permutation:
+                epoch_dataset._java_samples.addAll(java_batches[batch])
+            yield epoch_dataset, epoch_schedule
+
+    def update(
+        self, added_facts: FactChanges = None, removed_facts: FactChanges = None, *, progress: bool = False
+    ) -> BuiltDataset:
+        """Returns the dataset with changed facts. Only samples the changed facts can reach (samples of changed
+        examples with queries depending on changed predicates) are re-grounded and re-neuralized, all other samples
+        are reused.
+
+        Parameters
+        ----------
+        added_facts : FactChanges
+            Facts to add to all examples, or a dictionary mapping indices of examples (in the order of their first
+            occurrence in the dataset) to facts to add. Default: None.
+        removed_facts : FactChanges
+            Facts to remove from all examples (matched by predicates and terms, regardless of values), or a dictionary
+            mapping indices of examples to facts to remove. Default: None.
+        progress : bool
+            Whether to show progress. Default: False.
+
+        Returns
+        -------
+        BuiltDataset
+            The updated dataset.
+        """
+        source, rebuild = _get_source(self._source).update(added_facts, removed_facts)
+        samples = list(self._samples)
+
+        if rebuild:
+            dataset_builder = source.dataset_builder
+            first_sample_id = dataset_builder.first_sample_id
+
+            # The rebuilt samples continue the sample IDs and neuron indices of the reused samples, so they do not
+            # collide (as shards built in worker processes)
+            dataset_builder.first_sample_id = next_sample_id(samples)
+
+            try:
+                built = dataset_builder.build_dataset(
+                    source.dataset(rebuild),
+                    source.settings.copy(),
+                    batch_size=self._batch_size,
+                    learnable_facts=source.learnable_facts,
+                    progress=progress,
+                )
+            finally:
+                dataset_builder.first_sample_id = first_sample_id
+
+            if len(built) != len(rebuild):
+                raise DatasetError("Updated samples cannot be aligned with the dataset samples")
+
+            offset_neuron_indices(list(built), next_neuron_index(samples))
+
+            for index, sample in zip(rebuild, built):
+                samples[index] = sample
+        return BuiltDataset(samples, self._batch_size, source)
+
 
 class GroundedDataset:
     """GroundedDataset represents grounded examples that are not neuralized yet."""
 
-    __slots__ = "_groundings", "_groundings_list", "_builder"
+    __slots__ = "_groundings", "_groundings_list", "_builder", "_source", "_diagnostics"
 
-    def __init__(self, groundings, builder: Builder):
+    def __init__(
+        self,
+        groundings,
+        builder: Builder,
+        source: DatasetSource | None = None,
+        diagnostics: GroundingDiagnostics | None = None,
+    ):
         self._builder = builder
         self._groundings = groundings
         self._groundings_list = [Grounding(g) for g in self._groundings]
+        self._source = source
+        self._diagnostics = diagnostics
+
+    @property
+    def diagnostics(self) -> GroundingDiagnostics | None:
+        """The diagnostics of grounding with limits, or None if the dataset was grounded without limits."""
+        return self._diagnostics
 
     def __getitem__(self, item) -> Grounding:
         return self._groundings_list[item]
@@ -46,5 +201,125 @@ class GroundedDataset:
     def __iter__(self):
         return iter(self._groundings_list)
 
-    def neuralize(self, *, batch_size: int = 1, progress: bool = False) -> BuiltDataset:
-        return BuiltDataset(self._builder.neuralize(self._groundings.stream(), progress, len(self)), batch_size)
+    def neuralize(
+        self, *, batch_size: int = 1, progress: bool = False, chunk_size: int | None = None
+    ) -> BuiltDataset | Iterator[BuiltDataset]:
+        """Neuralizes the groundings.
+
+        Parameters
+        ----------
+        batch_size : int
+            The batch size. Default: 1.
+        progress : bool
+            Whether to show progress. Default: False.
+        chunk_size : int, optional
+            If set, the groundings are neuralized in chunks of at most ``chunk_size`` samples, and an iterator of built
+            datasets (chunks) is returned. The grounded dataset keeps all its groundings, so chunking bounds only
+            the memory of the neuralization - to bound the memory of grounding too, build the dataset with
+            ``chunk_size`` or ground it with ``lazy=True``. Default: None.
+
+        Returns
+        -------
+        BuiltDataset | Iterator[BuiltDataset]
+            The built dataset, or the iterator of built datasets if ``chunk_size`` is set.
+        """
+        if chunk_size is not None:
+            return (
+                BuiltDataset(samples, batch_size)
+                for samples in self._builder.neuralize_in_chunks(self._groundings, chunk_size, progress, len(self))
+            )
+
+        samples = self._builder.neuralize(self._groundings.stream(), progress, len(self))
+        return BuiltDataset(samples, batch_size, self._source if len(samples) == len(self) else None)
+
+    def update(self, added_facts: FactChanges = None, removed_facts: FactChanges = None) -> GroundedDataset:
+        """Returns the dataset with changed facts. Only samples the changed facts can reach are re-grounded,
+        all other groundings are reused. See :meth:`BuiltDataset.update`.
+
+        Parameters
+        ----------
+        added_facts : FactChanges
+            Facts to add to all examples, or a dictionary mapping indices of examples to facts to add. Default: None.
+        removed_facts : FactChanges
+            Facts to remove from all examples, or a dictionary mapping indices of examples to facts to remove.
+            Default: None.
+
+        Returns
+        -------
+        GroundedDataset
+            The updated dataset.
+        """
+        source, rebuild = _get_source(self._source).update(added_facts, removed_facts)
+        groundings = [grounding._grounding for grounding in self._groundings_list]
+        builder = self._builder
+
+        if rebuild:
+            grounded = source.dataset_builder.ground_dataset(
+                source.dataset(rebuild), source.settings.copy(), learnable_facts=source.learnable_facts
+            )
+
+            if len(grounded) != len(rebuild):
+                raise DatasetError("Updated groundings cannot be aligned with the dataset samples")
+
+            for index, grounding in zip(rebuild, grounded):
+                groundings[index] = grounding._grounding
+            builder = grounded._builder
+        return GroundedDataset(jpype.java.util.ArrayList(groundings), builder, source)
+
+
+class LazyGroundedDataset:
+    """
+    LazyGroundedDataset represents grounded examples streamed from the backend. Groundings are produced only as the
+    dataset is consumed, each grounding is wrapped into a :py:class:`~neuralogic.core.builder.components.Grounding`
+    only on access, and the dataset can be neuralized in chunks of bounded size. The dataset can be consumed only once.
+    """
+
+    __slots__ = "_groundings", "_builder", "_consumed"
+
+    def __init__(self, groundings: Any, builder: Builder):
+        self._groundings = groundings
+        self._builder = builder
+        self._consumed = False
+
+    def __iter__(self) -> Iterator[Grounding]:
+        for grounding in self._iterable().iterator():
+            yield Grounding(grounding)
+
+    def neuralize(
+        self, *, batch_size: int = 1, chunk_size: int = 1024, progress: bool = False
+    ) -> Iterator[BuiltDataset]:
+        """Neuralizes the groundings in chunks. Groundings of each chunk are pulled from the backend only when
+        the chunk is requested and are released once the chunk is neuralized.
+
+        Parameters
+        ----------
+        batch_size : int
+            The batch size. Default: 1.
+        chunk_size : int
+            The maximum number of samples in one chunk. Default: 1024.
+        progress : bool
+            Whether to show progress. Default: False.
+
+        Returns
+        -------
+        Iterator[BuiltDataset]
+            The iterator of built datasets (chunks).
+        """
+        for samples in self._builder.neuralize_in_chunks(self._iterable(), chunk_size, progress):
+            yield BuiltDataset(samples, batch_size)
+
+    def _iterable(self) -> Any:
+        if self._consumed:
+            raise DatasetError("LazyGroundedDataset has already been consumed")
+
+        self._consumed = True
+        return self._groundings
+
+
+def _get_source(source: DatasetSource | None) -> DatasetSource:
+    if source is None:
+        raise DatasetError(
+            "The dataset cannot be updated incrementally - it has to be built with updatable=True from a Dataset of "
+            "samples with ground queries"
+        )
+    return source
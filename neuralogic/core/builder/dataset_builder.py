@@ -1,19 +1,40 @@
-from collections.abc import Iterable
-from typing import Any
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import jpype
 
 import neuralogic.dataset as datasets
+import neuralogic.setup as setup
 from neuralogic.core.builder.builder import Builder
-from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset
+from neuralogic.core.builder.cache import SampleCache
+from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset, LazyGroundedDataset
+from neuralogic.core.builder.parallel import (
+    GroundingWorker,
+    ShardTask,
+    build_shards_in_workers,
+    example_groups,
+    offset_neuron_indices,
+    shard_samples,
+)
+from neuralogic.core.builder.prefetch import Prefetcher
+from neuralogic.core.builder.serialization import deserialize_samples
 from neuralogic.core.constructs.java_objects import JavaFactory
 from neuralogic.core.constructs.relation import BaseRelation, WeightedRelation
 from neuralogic.core.constructs.rule import Rule
-from neuralogic.core.settings import SettingsProxy
+from neuralogic.core.grounding.incremental import DatasetSource
+from neuralogic.core.grounding.limits import GroundingLimits, apply_limits
+from neuralogic.core.settings import Settings, SettingsProxy
 from neuralogic.core.sources import Sources
-from neuralogic.exceptions import DatasetError
+from neuralogic.exceptions import BackendError, DatasetError
 from neuralogic.setup import initialize, is_initialized
 
+if TYPE_CHECKING:
+    from neuralogic.core.model import Model
+
 ModelEntries = BaseRelation | WeightedRelation | Rule
 
 
@@ -57,7 +78,7 @@ class DatasetBuilder:
     DatasetBuilder is responsible for grounding and neuralizing datasets.
     """
 
-    def __init__(self, parsed_model: Any, java_factory: JavaFactory):
+    def __init__(self, parsed_model: Any, java_factory: JavaFactory, model: Model | None = None):
         """
         Parameters
         ----------
@@ -65,12 +86,15 @@ class DatasetBuilder:
             The parsed model.
         java_factory : JavaFactory
             The java factory.
+        model : Model, optional
+            The model the parsed model has been created from. Default: None.
         """
         if not is_initialized():
             initialize()
 
         self.java_factory = java_factory
         self.parsed_model = parsed_model
+        self.model = model
 
         self.grounding_mode = jpype.JClass("cz.cvut.fel.ida.setup.Settings").GroundingMode
         self.logic_sample = jpype.JClass("cz.cvut.fel.ida.logic.constructs.example.LogicSample")
@@ -78,6 +102,9 @@ class DatasetBuilder:
         self.examples_builder = jpype.JClass("cz.cvut.fel.ida.logic.constructs.building.ExamplesBuilder")
         self.queries_builder = jpype.JClass("cz.cvut.fel.ida.logic.constructs.building.QueriesBuilder")
 
+        # The IDs of built samples start at this offset (shards built in worker processes continue the IDs)
+        self.first_sample_id = 0
+
         self.query_counter = 0
         self.examples_counter = 0
 
@@ -188,6 +215,50 @@ class DatasetBuilder:
             self.examples_counter += 1
         return logic_samples, examples_queries
 
+    def build_tensor_samples(
+        self,
+        dataset: datasets.TensorDataset,
+        examples_builder: Any,
+        query_builder: Any,
+        learnable_facts: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily builds logic samples straight from the arrays of a tensor dataset, one graph at a time, without
+        materializing Python relations or intermediate lists of examples and queries.
+
+        Parameters
+        ----------
+        dataset : datasets.TensorDataset
+            The tensor dataset to build.
+        examples_builder : Any
+            The examples builder.
+        query_builder : Any
+            The query builder.
+        learnable_facts : bool
+            Whether facts are learnable. Default: False.
+
+        Returns
+        -------
+        Iterator[Any]
+            The iterator of built logic samples.
+        """
+        examples_weight_factory = self.java_factory.get_new_weight_factory()
+        queries_weight_factory = self.java_factory.get_new_weight_factory()
+
+        for queries, example in dataset.tensor_forms():
+            weight_factory = self.java_factory.weight_factory
+
+            try:
+                self.java_factory.weight_factory = examples_weight_factory
+                examples, _ = self.build_examples([example], examples_builder, learnable_facts)
+
+                self.java_factory.weight_factory = queries_weight_factory
+                queries, _ = self.build_queries([queries], query_builder)
+            finally:
+                self.java_factory.weight_factory = weight_factory
+
+            yield from DatasetBuilder.merge_queries_with_examples(queries, examples, True, False)
+
     def ground_dataset(
         self,
         dataset: datasets.BaseDataset,
@@ -197,7 +268,10 @@ class DatasetBuilder:
         learnable_facts: bool = False,
         progress: bool = False,
         raw_groundings: bool = False,
-    ) -> GroundedDataset | Any:
+        lazy: bool = False,
+        limits: GroundingLimits | None = None,
+        updatable: bool = False,
+    ) -> GroundedDataset | LazyGroundedDataset | Any:
         """Grounds the dataset.
 
         Parameters
@@ -214,13 +288,29 @@ class DatasetBuilder:
             Whether to show progress. Default: False.
         raw_groundings : bool
             Whether to return raw groundings. Default: False.
+        lazy : bool
+            Whether to return a :py:class:`LazyGroundedDataset` that keeps the backend stream of groundings instead
+            of collecting them. The progress is not shown for lazy grounding. Default: False.
+        limits : GroundingLimits, optional
+            The limits of the grounding cost. Examples are first grounded one by one in a killable worker process,
+            examples exceeding per-sample limits are handled according to the limits policy, grounding stops once
+            a per-dataset limit is exceeded, and only the kept examples are then grounded in this process
+            (see :py:class:`~neuralogic.core.grounding.limits.GroundingLimits`). The diagnostics are available as
+            :py:attr:`GroundedDataset.diagnostics`. Requires a dataset of samples and cannot be combined with
+            ``raw_groundings`` or ``lazy``. Default: None (no limits).
+        updatable : bool
+            Whether the grounded dataset keeps its source samples, so it can be updated incrementally (see
+            :meth:`GroundedDataset.update`). Default: False.
 
         Returns
         -------
-        GroundedDataset | Any
+        GroundedDataset | LazyGroundedDataset | Any
             The grounded dataset or raw groundings.
         """
-        if isinstance(dataset, datasets.ConvertibleDataset):
+        if limits is not None and (raw_groundings or lazy):
+            raise ValueError("Grounding limits cannot be combined with raw or lazy groundings")
+
+        if isinstance(dataset, datasets.ConvertibleDataset) and not isinstance(dataset, datasets.TensorDataset):
             return self.ground_dataset(
                 dataset.to_dataset(),
                 settings,
@@ -228,17 +318,22 @@ class DatasetBuilder:
                 learnable_facts=learnable_facts,
                 progress=progress,
                 raw_groundings=raw_groundings,
+                lazy=lazy,
+                limits=limits,
+                updatable=updatable,
             )
 
-        if batch_size > 1:
-            settings.settings.minibatchSize = batch_size
-            settings.settings.parallelTraining = True
+        if limits is not None:
+            return self._ground_with_limits(dataset, settings, batch_size, learnable_facts, progress, limits, updatable)
+
+        progress = progress and not lazy
 
+        DatasetBuilder.setup_batch_size(settings, batch_size)
         builder = Builder(settings)
 
         if isinstance(dataset, datasets.Dataset):
-            self.examples_counter = 0
-            self.query_counter = 0
+            self.examples_counter = self.first_sample_id
+            self.query_counter = self.first_sample_id
 
             weight_factory = self.java_factory.weight_factory
 
@@ -275,6 +370,27 @@ class DatasetBuilder:
             groundings = builder.ground_from_logic_samples(self.parsed_model, logic_samples, progress)
 
             self.java_factory.weight_factory = weight_factory
+        elif isinstance(dataset, datasets.TensorDataset):
+            self.examples_counter = self.first_sample_id
+            self.query_counter = self.first_sample_id
+
+            examples_builder = self.examples_builder(settings.settings)
+            query_builder = self.queries_builder(settings.settings)
+            query_builder.setFactoriesFrom(examples_builder)
+
+            grounding_mode = self.grounding_mode.GLOBAL if len(dataset.data) == 1 else self.grounding_mode.INDEPENDENT
+            settings.settings.groundingMode = grounding_mode
+            settings.settings.infer()
+            settings._setup_random_generator()
+
+            builder.settings.settings.oneQueryPerExample = all(
+                data.y_mask is None or len(data.y_mask) <= 1 for data in dataset.data
+            )
+
+            logic_samples = self.build_tensor_samples(dataset, examples_builder, query_builder, learnable_facts)
+            groundings = builder.ground_from_logic_sample_iterator(
+                self.parsed_model, logic_samples, progress, len(dataset.data)
+            )
         elif isinstance(dataset, datasets.FileDataset):
             if dataset.queries_file is None and dataset.examples_file is None:
                 raise ValueError("To build FileDataset provide either queries or examples")
@@ -292,25 +408,98 @@ class DatasetBuilder:
 
         if raw_groundings:
             return groundings
+        if lazy:
+            return LazyGroundedDataset(groundings, builder)
         if progress:
-            return GroundedDataset(groundings, builder)
+            grounded_dataset = GroundedDataset(groundings, builder)
+        else:
+            grounded_dataset = GroundedDataset(groundings.collect(builder.collectors.toList()), builder)
 
-        return GroundedDataset(groundings.collect(builder.collectors.toList()), builder)
+        if updatable:
+            grounded_dataset._source = DatasetSource.from_dataset(
+                dataset, self, settings, learnable_facts, len(grounded_dataset)
+            )
+        return grounded_dataset
+
+    def _ground_with_limits(
+        self,
+        dataset: datasets.BaseDataset,
+        settings: SettingsProxy,
+        batch_size: int,
+        learnable_facts: bool,
+        progress: bool,
+        limits: GroundingLimits,
+        updatable: bool,
+    ) -> GroundedDataset:
+        if self.model is None:
+            raise DatasetError("Grounding limits require the dataset builder to be created by a model")
+
+        if isinstance(dataset, datasets.TensorDataset):
+            dataset = dataset.to_dataset(tensor_form=True)
+
+        if not isinstance(dataset, datasets.Dataset) or len(dataset._examples) != 0 or len(dataset._queries) != 0:
+            raise DatasetError("Grounding limits require a dataset of samples")
+
+        build_settings = self.model._build_settings or Settings()
+        template_cache = self.model._template_cache
+
+        task = ShardTask(
+            index=0,
+            first_sample_id=self.first_sample_id,
+            seed=setup._seed,
+            model_file=self.model._model_file,
+            template_cache=str(template_cache.cache_dir) if template_cache is not None else None,
+            entries=list(self.model),
+            settings_params=build_settings.params,
+            settings_kw_params=build_settings.kw_params,
+            samples=dataset.samples,
+            learnable_facts=learnable_facts,
+        )
+
+        kept, diagnostics = apply_limits(GroundingWorker(task, limits.max_memory), limits)
+
+        if len(diagnostics.violations) != 0:
+            warnings.warn(f"Grounding limits exceeded: {diagnostics}")
+
+        groups = example_groups(dataset.samples)
+        samples = [sample for index in kept for sample in groups[index]]
+
+        if len(samples) == 0:
+            DatasetBuilder.setup_batch_size(settings, batch_size)
+            return GroundedDataset(jpype.java.util.ArrayList(), Builder(settings), diagnostics=diagnostics)
+
+        # The kept examples are known to be within the limits, so they are grounded in this process
+        grounded_dataset = self.ground_dataset(
+            datasets.Dataset(samples),
+            settings,
+            batch_size=batch_size,
+            learnable_facts=learnable_facts,
+            progress=progress,
+            updatable=updatable and len(samples) == len(dataset.samples),
+        )
+        grounded_dataset._diagnostics = diagnostics
+        return grounded_dataset
 
     def build_dataset(
         self,
-        dataset: datasets.BaseDataset | GroundedDataset,
+        dataset: datasets.BaseDataset | GroundedDataset | LazyGroundedDataset,
         settings: SettingsProxy,
         *,
         batch_size: int = 1,
         learnable_facts: bool = False,
         progress: bool = False,
-    ) -> BuiltDataset:
+        cache_dir: str | Path | SampleCache | None = None,
+        workers: int = 1,
+        chunk_size: int | None = None,
+        limits: GroundingLimits | None = None,
+        prefetch: int = 0,
+        updatable: bool = False,
+    ) -> BuiltDataset | Iterator[BuiltDataset]:
         """Builds the dataset (does grounding and neuralization).
 
         Parameters
         ----------
-        dataset : datasets.BaseDataset | GroundedDataset
+        dataset : datasets.BaseDataset | GroundedDataset | LazyGroundedDataset
             The dataset to build.
         settings : SettingsProxy
             The settings proxy.
@@ -320,13 +509,109 @@ class DatasetBuilder:
             Whether facts are learnable. Default: False.
         progress : bool
             Whether to show progress. Default: False.
+        cache_dir : str | Path | SampleCache, optional
+            The directory (or the cache) to load the built samples from, or to store them into on a cache miss.
+            Default: None (no caching).
+        workers : int
+            The number of worker processes (each running its own JVM) to shard the building across. The built samples
+            are assembled in the same order as with serial building. Default: 1 (build in this process).
+        chunk_size : int, optional
+            If set, the dataset is grounded lazily and neuralized in chunks of at most ``chunk_size`` samples, and an
+            iterator of built datasets (chunks) is returned. Cannot be combined with ``cache_dir`` or ``workers``.
+            Default: None.
+        limits : GroundingLimits, optional
+            The limits of the grounding cost (see :meth:`ground_dataset`). Cannot be combined with ``cache_dir``,
+            ``workers``, or ``chunk_size``. Default: None (no limits).
+        prefetch : int
+            The number of chunks grounded and neuralized ahead in a background thread while the current chunk is
+            consumed (see :py:class:`~neuralogic.core.builder.prefetch.Prefetcher`). Requires ``chunk_size``.
+            Default: 0 (no prefetching).
+        updatable : bool
+            Whether the built dataset keeps its source samples, so it can be updated incrementally (see
+            :meth:`BuiltDataset.update`). Cannot be combined with ``chunk_size``. Default: False.
 
         Returns
         -------
-        BuiltDataset
-            The built dataset.
+        BuiltDataset | Iterator[BuiltDataset]
+            The built dataset, or the iterator of built datasets if ``chunk_size`` is set.
         """
-        if not isinstance(dataset, GroundedDataset):
+        if updatable and chunk_size is not None:
+            raise ValueError("Chunked building cannot produce updatable datasets")
+
+        if prefetch > 0:
+            if chunk_size is None:
+                raise ValueError("Prefetching requires chunked building (chunk_size)")
+
+            chunks = self.build_dataset(
+                dataset,
+                settings,
+                batch_size=batch_size,
+                learnable_facts=learnable_facts,
+                progress=progress,
+                cache_dir=cache_dir,
+                workers=workers,
+                chunk_size=chunk_size,
+                limits=limits,
+            )
+            return Prefetcher(chunks, prefetch)
+
+        if chunk_size is not None and (cache_dir is not None or workers > 1):
+            raise ValueError("Chunked building cannot be combined with caching or parallel building")
+
+        if limits is not None and not isinstance(dataset, (GroundedDataset, LazyGroundedDataset)):
+            if cache_dir is not None or workers > 1 or chunk_size is not None:
+                raise ValueError("Grounding limits cannot be combined with caching, parallel, or chunked building")
+
+            dataset = self.ground_dataset(
+                dataset,
+                settings,
+                batch_size=batch_size,
+                learnable_facts=learnable_facts,
+                limits=limits,
+                updatable=updatable,
+            )
+
+        if isinstance(dataset, GroundedDataset):
+            return dataset.neuralize(batch_size=batch_size, progress=progress, chunk_size=chunk_size)
+
+        if chunk_size is not None and not isinstance(dataset, LazyGroundedDataset):
+            dataset = self.ground_dataset(
+                dataset, settings, batch_size=batch_size, learnable_facts=learnable_facts, lazy=True
+            )
+
+        if isinstance(dataset, LazyGroundedDataset):
+            chunks = dataset.neuralize(batch_size=batch_size, chunk_size=chunk_size or 1024, progress=progress)
+
+            if chunk_size is not None:
+                return chunks
+            return BuiltDataset([sample for chunk in chunks for sample in chunk], batch_size)
+
+        if isinstance(dataset, datasets.ConvertibleDataset) and not isinstance(dataset, datasets.TensorDataset):
+            dataset = dataset.to_dataset()
+
+        cache, cache_key = None, None
+
+        if cache_dir is not None:
+            if self.model is None:
+                raise DatasetError("Caching of built samples requires the dataset builder to be created by a model")
+
+            cache = cache_dir if isinstance(cache_dir, SampleCache) else SampleCache(cache_dir)
+            cache_key = cache.key(self.model.fingerprint(), settings, dataset, learnable_facts=learnable_facts)
+            samples = cache.load(cache_key, self.parsed_model.getAllWeights())
+
+            if samples is not None:
+                DatasetBuilder.setup_batch_size(settings, batch_size)
+                return BuiltDataset(
+                    samples, batch_size, self._source(dataset, settings, learnable_facts, samples, updatable)
+                )
+
+        samples = None
+
+        if workers > 1:
+            samples = self.build_samples_in_workers(dataset, workers, learnable_facts)
+            DatasetBuilder.setup_batch_size(settings, batch_size)
+
+        if samples is None:
             groundings = self.ground_dataset(
                 dataset,
                 settings,
@@ -336,8 +621,115 @@ class DatasetBuilder:
             )
 
             samples = Builder(settings).neuralize(groundings, progress, None)
-            return BuiltDataset(samples, batch_size)
-        return dataset.neuralize(batch_size=batch_size, progress=progress)
+
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, samples, self.parsed_model.getAllWeights())
+
+        return BuiltDataset(samples, batch_size, self._source(dataset, settings, learnable_facts, samples, updatable))
+
+    def _source(
+        self,
+        dataset: datasets.BaseDataset,
+        settings: SettingsProxy,
+        learnable_facts: bool,
+        samples: list[Any],
+        updatable: bool,
+    ) -> DatasetSource | None:
+        if not updatable:
+            return None
+        return DatasetSource.from_dataset(dataset, self, settings, learnable_facts, len(samples))
+
+    def build_samples_in_workers(
+        self, dataset: datasets.BaseDataset, workers: int, learnable_facts: bool = False
+    ) -> list[Any] | None:
+        """
+        Builds the dataset in a pool of worker processes. The samples are split into contiguous shards, each worker
+        builds its shard with the worker's own copy of the model, and the serialized samples are linked back to the
+        weights of this model. Sample IDs and neuron indices of the shards are offset, so they do not collide after
+        merging.
+
+        Parameters
+        ----------
+        dataset : datasets.BaseDataset
+            The dataset to build.
+        workers : int
+            The number of worker processes.
+        learnable_facts : bool
+            Whether facts are learnable. Default: False.
+
+        Returns
+        -------
+        list[Any] | None
+            The built neural samples, or None if the dataset cannot be split (it has only one example, or it has
+            examples and queries added separately) or the samples built in workers cannot be serialized.
+        """
+        if self.model is None:
+            raise DatasetError("Parallel building requires the dataset builder to be created by a model")
+
+        if learnable_facts:
+            raise DatasetError("Parallel building does not support learnable facts")
+
+        if isinstance(dataset, datasets.TensorDataset):
+            # Facts stay in array blocks, so they are pickled compactly and converted in bulk by the workers
+            dataset = dataset.to_dataset(tensor_form=True)
+        elif isinstance(dataset, datasets.ConvertibleDataset):
+            dataset = dataset.to_dataset()
+
+        if not isinstance(dataset, datasets.Dataset):
+            raise NotImplementedError(f"Parallel building is not supported for {type(dataset).__name__}")
+
+        if len(dataset._examples) != 0 or len(dataset._queries) != 0:
+            return None
+
+        # Each shard has to contain at least two examples to be grounded in the same (independent) mode
+        shards = shard_samples(dataset.samples, workers, min_examples=2)
+
+        if len(shards) < 2:
+            return None
+
+        settings = self.model._build_settings or Settings()
+        template_cache = self.model._template_cache
+
+        first_sample_ids = [0]
+        for shard in shards[:-1]:
+            first_sample_ids.append(first_sample_ids[-1] + len({id(sample.example) for sample in shard}))
+
+        tasks = [
+            ShardTask(
+                index=index,
+                first_sample_id=first_sample_ids[index],
+                seed=setup._seed + index,
+                model_file=self.model._model_file,
+                template_cache=str(template_cache.cache_dir) if template_cache is not None else None,
+                entries=list(self.model),
+                settings_params=settings.params,
+                settings_kw_params=settings.kw_params,
+                samples=shard,
+            )
+            for index, shard in enumerate(shards)
+        ]
+
+        try:
+            shards_data = build_shards_in_workers(tasks, len(tasks))
+        except BackendError as e:
+            warnings.warn(f"Cannot build the dataset in workers, building serially: {e}")
+            return None
+
+        weights = self.parsed_model.getAllWeights()
+        samples = []
+        first_neuron_index = 0
+
+        for data in shards_data:
+            built_shard = deserialize_samples(data, weights)
+            first_neuron_index = offset_neuron_indices(built_shard, first_neuron_index)
+            samples.extend(built_shard)
+        return samples
+
+    @staticmethod
+    def setup_batch_size(settings: SettingsProxy, batch_size: int) -> None:
+        if batch_size > 1:
+            settings.settings.minibatchSize = batch_size
+            settings.settings.parallelTraining = True
 
     @staticmethod
     def merge_queries_with_examples(
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import jpype
+
+import neuralogic.setup as setup
+from neuralogic.dataset.logic import Sample
+from neuralogic.exceptions import BackendError
+
+if TYPE_CHECKING:
+    from neuralogic.core.grounding.limits import GroundingMeasurement
+    from neuralogic.core.model import Model
+
+
+@dataclass
+class ShardTask:
+    """A picklable description of a shard built by a worker process."""
+
+    index: int
+    first_sample_id: int
+    seed: int
+    model_file: str | None
+    template_cache: str | None
+    entries: list[Any]
+    settings_params: dict[str, Any]
+    settings_kw_params: dict[str, Any]
+    samples: list[Sample]
+    learnable_facts: bool = False
+
+
+def example_groups(samples: list[Sample]) -> list[list[Sample]]:
+    """
+    Groups samples by their examples (by identity), in the order of the first occurrence of the examples - the order
+    in which the examples are grounded.
+
+    Parameters
+    ----------
+    samples : list[Sample]
+        The samples to group.
+
+    Returns
+    -------
+    list[list[Sample]]
+        The samples of each example.
+    """
+    groups: dict[int, list[Sample]] = {}
+
+    for sample in samples:
+        groups.setdefault(id(sample.example), []).append(sample)
+    return list(groups.values())
+
+
+def shard_samples(samples: list[Sample], shards: int, min_examples: int = 1) -> list[list[Sample]]:
+    """
+    Splits samples into at most ``shards`` contiguous shards of similar size. Samples sharing the same example
+    (by identity) always end up in the same shard, and concatenating the shards yields the samples in the same order
+    the serial build processes them (grouped by examples in the order of their first occurrence).
+
+    Parameters
+    ----------
+    samples : list[Sample]
+        The samples to split.
+    shards : int
+        The maximum number of shards.
+    min_examples : int
+        The minimum number of distinct examples in one shard. Default: 1.
+
+    Returns
+    -------
+    list[list[Sample]]
+        The list of shards.
+    """
+    ordered_groups = example_groups(samples)
+    shards = max(1, min(shards, len(ordered_groups) // max(1, min_examples)))
+
+    result = []
+    start = 0
+
+    for i in range(shards):
+        end = ((i + 1) * len(ordered_groups)) // shards
+        result.append([sample for group in ordered_groups[start:end] for sample in group])
+        start = end
+    return result
+
+
+def _initialize_worker(jvm_options: list[str], jvm_params: dict[str, Any], max_memory_size: int | None) -> None:
+    setup.set_jvm_options(jvm_options)
+    setup.jvm_params.update(jvm_params)
+
+    setup.initialize(max_memory_size=max_memory_size, started_check=False)
+
+
+def _build_model(task: ShardTask) -> Model:
+    from neuralogic.core.model import Model
+    from neuralogic.core.settings import Settings
+
+    setup.manual_seed(task.seed)
+
+    settings = Settings(**task.settings_params)
+    for key, value in task.settings_kw_params.items():
+        settings[key] = value
+
+    model = Model(model_file=task.model_file, template_cache=task.template_cache)
+    model.add_rules(task.entries)
+    model.build(settings)
+    model._dataset_builder.first_sample_id = task.first_sample_id
+    return model
+
+
+def _build_shard(task: ShardTask) -> bytes:
+    from neuralogic.core.builder.serialization import serialize_samples
+    from neuralogic.dataset import Dataset
+
+    model = _build_model(task)
+    built_dataset = model.build_dataset(Dataset(task.samples))
+
+    try:
+        return serialize_samples(list(built_dataset), model._parsed_model.getAllWeights())
+    except jpype.JException as e:
+        # Java exceptions cannot be passed to the parent process
+        raise BackendError(f"Cannot serialize samples of shard {task.index}: {e}") from None
+
+
+def offset_neuron_indices(samples: list[Any], offset: int) -> int:
+    """
+    Offsets indices of neurons of samples built in one worker process, so they do not collide with indices of neurons
+    built in other workers (each worker indexes its neurons from zero). Neurons shared by multiple samples are offset
+    only once.
+
+    Parameters
+    ----------
+    samples : list[Any]
+        The neural samples of one shard.
+    offset : int
+        The offset of the indices.
+
+    Returns
+    -------
+    int
+        The first index not used by the offset neurons (the offset of the next shard).
+    """
+    offset_neurons = jpype.java.util.Collections.newSetFromMap(jpype.java.util.IdentityHashMap())
+    next_index = offset
+
+    for sample in samples:
+        for neuron in sample._java_sample.query.evidence.allNeuronsTopologic:
+            if offset_neurons.add(neuron):
+                neuron.index += offset
+                next_index = max(next_index, neuron.index + 1)
+    return next_index
+
+
+def next_neuron_index(samples: list[Any]) -> int:
+    """
+    Returns the first neuron index not used by neurons of the samples.
+
+    Parameters
+    ----------
+    samples : list[Any]
+        The neural samples.
+
+    Returns
+    -------
+    int
+        The first unused neuron index.
+    """
+    next_index = 0
+
+    for sample in samples:
+        for neuron in sample._java_sample.query.evidence.allNeuronsTopologic:
+            next_index = max(next_index, neuron.index + 1)
+    return next_index
+
+
+def next_sample_id(samples: list[Any]) -> int:
+    """
+    Returns the first sample ID not used by the samples (IDs of samples without a numeric ID are skipped).
+
+    Parameters
+    ----------
+    samples : list[Any]
+        The neural samples.
+
+    Returns
+    -------
+    int
+        The first unused sample ID.
+    """
+    ids = (str(sample._java_sample.getId()) for sample in samples)
+    return max((int(id) + 1 for id in ids if id.isdigit()), default=0)
+
+
+def build_shards_in_workers(tasks: list[ShardTask], workers: int) -> list[bytes]:
+    """
+    Builds the shards in a pool of worker processes, each running its own JVM.
+
+    Parameters
+    ----------
+    tasks : list[ShardTask]
+        The shards to build.
+    workers : int
+        The number of worker processes.
+
+    Returns
+    -------
+    list[bytes]
+        The serialized built samples of each shard, in the order of the tasks. If samples of a shard cannot be
+        serialized, :class:`BackendError` is raised.
+    """
+    context = multiprocessing.get_context("spawn")
+    init_args = ([*setup.jvm_options], {**setup.jvm_params}, setup._max_memory_size)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_initialize_worker, initargs=init_args
+    ) as executor:
+        return list(executor.map(_build_shard, tasks))
+
+
+def _ground_examples(task: ShardTask, connection: Any, init_args: tuple) -> None:
+    from neuralogic.core.grounding.limits import measure_groundings
+    from neuralogic.dataset import Dataset
+
+    try:
+        _initialize_worker(*init_args)
+        model = _build_model(task)
+    except Exception as e:
+        connection.send(BackendError(f"Cannot start the grounding worker: {e}"))
+        return
+
+    # The worker is ready - its start is not counted into the grounding time
+    connection.send(None)
+    out_of_memory = jpype.JClass("java.lang.OutOfMemoryError")
+
+    for samples in example_groups(task.samples):
+        started = time.perf_counter()
+
+        try:
+            grounded = model.ground(Dataset(samples), learnable_facts=task.learnable_facts)
+            measurement = measure_groundings(grounded, time.perf_counter() - started)
+        except out_of_memory:
+            connection.send(MemoryError())
+            return
+        except Exception as e:
+            # Java exceptions cannot be passed to the parent process
+            connection.send(BackendError(f"Cannot ground an example in the grounding worker: {e}"))
+            return
+
+        # Only the measurement is sent, the groundings are released
+        del grounded
+        connection.send(measurement)
+
+
+class GroundingWorker:
+    """
+    Grounds examples of a task one by one in a spawned worker process running its own JVM, and measures each example
+    without keeping its groundings. Unlike a grounding in the backend of this process, the worker can be killed - if
+    an example is not grounded within the timeout or the worker runs out of memory, the worker is killed (which
+    releases the memory and the CPU of the grounding), and the next example is grounded by a new worker.
+    """
+
+    def __init__(
+        self,
+        task: ShardTask,
+        max_memory_size: int | None = None,
+        target: Callable[[ShardTask, Any, tuple], None] = _ground_examples,
+    ):
+        """
+        Parameters
+        ----------
+        task : ShardTask
+            The model and the samples to ground.
+        max_memory_size : int, optional
+            The maximum heap size (in gigabytes) of the worker JVM. Default: None (the heap size of this process).
+        target : Callable[[ShardTask, Any, tuple], None]
+            The function run by the worker process. Default: grounding and measuring the examples.
+        """
+        self._task = task
+        self._groups = example_groups(task.samples)
+        self._init_args = (
+            [*setup.jvm_options],
+            {**setup.jvm_params},
+            max_memory_size if max_memory_size is not None else setup._max_memory_size,
+        )
+        self._target = target
+        self._position = 0
+        self._process = None
+        self._connection = None
+
+    def next(self, timeout: float | None) -> GroundingMeasurement:
+        """Returns the measurement of the next example. Raises ``StopIteration`` if all examples are measured,
+        ``TimeoutError`` if the example is not grounded within the timeout, and ``MemoryError`` if the worker runs out
+        of memory - the example is then dropped and the next call continues with the next example.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time (in seconds) of waiting for the example. Default: None (no timeout).
+
+        Returns
+        -------
+        GroundingMeasurement
+            The measurement of the example.
+        """
+        if self._position >= len(self._groups):
+            raise StopIteration
+
+        if self._process is None:
+            self._start()
+
+        try:
+            if not self._connection.poll(timeout):
+                raise TimeoutError
+            result = self._connection.recv()
+        except (TimeoutError, EOFError) as e:
+            # The worker is killed or has died (e.g., the JVM has crashed out of memory)
+            self.close()
+            self._position += 1
+            raise (e if isinstance(e, TimeoutError) else MemoryError()) from None
+
+        if isinstance(result, BaseException):
+            self.close()
+            self._position += 1
+            raise result
+
+        self._position += 1
+        return result
+
+    def close(self) -> None:
+        """Kills the worker."""
+        if self._process is None:
+            return
+
+        self._connection.close()
+        self._process.kill()
+        self._process.join()
+        self._process, self._connection = None, None
+
+    def _start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        connection, worker_connection = context.Pipe(duplex=False)
+
+        samples = [sample for group in self._groups[self._position :] for sample in group]
+        task = dataclasses.replace(self._task, samples=samples)
+
+        self._process = context.Process(target=self._target, args=(task, worker_connection, self._init_args))
+        self._process.start()
+        self._connection = connection
+        worker_connection.close()
+
+        try:
+            ready = connection.recv()
+        except EOFError:
+            ready = BackendError("The grounding worker has exited before it started")
+
+        if ready is not None:
+            self.close()
+            raise ready
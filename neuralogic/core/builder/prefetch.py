@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+_DONE = object()
+
+
+@dataclass
+class PrefetchStatistics:
+    """
+    The statistics of a prefetching pipeline stage.
+
+    Attributes
+    ----------
+    produced : int
+        The number of items produced (e.g., built chunks).
+    consumed : int
+        The number of items consumed.
+    production_time : float
+        The time (in seconds) spent producing items.
+    producer_stall : float
+        The time (in seconds) the producer waited for a free slot in the full queue.
+    consumer_stall : float
+        The time (in seconds) the consumer waited for an item from the empty queue.
+    """
+
+    produced: int = 0
+    consumed: int = 0
+    production_time: float = 0.0
+    producer_stall: float = 0.0
+    consumer_stall: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Produced {self.produced} items in {self.production_time:.2f} s, consumed {self.consumed}; "
+            f"producer stalled {self.producer_stall:.2f} s, consumer stalled {self.consumer_stall:.2f} s"
+        )
+
+
+class Prefetcher(Iterator[Any]):
+    """
+    Prefetcher consumes an iterable in a background thread and buffers up to ``buffer_size`` items in a bounded queue,
+    so the next items (e.g., chunks of a dataset being grounded and neuralized) are produced while the current item is
+    processed (e.g., trained on). The producer blocks when the queue is full, and errors of the producer are raised in
+    the consumer. A prefetcher that is not consumed to the end has to be closed (see :meth:`close`).
+    """
+
+    def __init__(self, iterable: Iterable[Any], buffer_size: int = 1):
+        """
+        Parameters
+        ----------
+        iterable : Iterable[Any]
+            The iterable to prefetch.
+        buffer_size : int
+            The maximum number of prefetched items waiting for the consumer. Default: 1.
+        """
+        if buffer_size < 1:
+            raise ValueError(f"Buffer size has to be positive, got {buffer_size}")
+
+        self.statistics = PrefetchStatistics()
+
+        self._iterator = iter(iterable)
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._stopped = threading.Event()
+        self._finished = False
+
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> Prefetcher:
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+
+        start = time.perf_counter()
+        status, item = self._queue.get()
+        self.statistics.consumer_stall += time.perf_counter() - start
+
+        if status is _DONE:
+            self._finished = True
+            self._thread.join()
+
+            if item is not None:
+                raise item
+            raise StopIteration
+
+        self.statistics.consumed += 1
+        return item
+
+    def close(self) -> None:
+        """Stops the producer and releases the prefetched items."""
+        self._stopped.set()
+        self._finished = True
+
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.01)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+    def _produce(self) -> None:
+        error = None
+
+        try:
+            while not self._stopped.is_set():
+                start = time.perf_counter()
+
+                try:
+                    item = next(self._iterator)
+                except StopIteration:
+                    break
+
+                self.statistics.production_time += time.perf_counter() - start
+                self.statistics.produced += 1
+
+                if not self._put((None, item)):
+                    return
+        except Exception as e:
+            error = e
+
+        self._put((_DONE, error))
+
+    def _put(self, entry: tuple[Any, Any]) -> bool:
+        start = time.perf_counter()
+
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(entry, timeout=0.01)
+                self.statistics.producer_stall += time.perf_counter() - start
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __enter__(self) -> Prefetcher:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,101 @@
+from typing import Any
+
+import jpype
+
+from neuralogic.core.builder.components import NeuralSample
+
+
+def serialize_objects(objects: list[Any]) -> bytes:
+    """
+    Serializes Java objects into bytes (via Java serialization). The objects are written as one object graph,
+    so references shared between them are preserved.
+
+    Parameters
+    ----------
+    objects : list[Any]
+        The Java objects to serialize.
+
+    Returns
+    -------
+    bytes
+        The serialized objects.
+    """
+    byte_stream = jpype.java.io.ByteArrayOutputStream()
+    object_stream = jpype.java.io.ObjectOutputStream(byte_stream)
+
+    object_stream.writeObject(jpype.java.util.ArrayList(objects))
+    object_stream.close()
+
+    return bytes(memoryview(byte_stream.toByteArray()))
+
+
+def deserialize_objects(data: bytes) -> list[Any]:
+    """
+    Deserializes Java objects serialized by :func:`serialize_objects`.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized objects.
+
+    Returns
+    -------
+    list[Any]
+        The deserialized Java objects.
+    """
+    byte_stream = jpype.java.io.ByteArrayInputStream(jpype.JArray(jpype.JByte)(data))
+    object_stream = jpype.java.io.ObjectInputStream(byte_stream)
+
+    objects = object_stream.readObject()
+    object_stream.close()
+
+    return list(objects)
+
+
+def serialize_samples(samples: list[NeuralSample], weights: Any) -> bytes:
+    """
+    Serializes neural samples together with the template weights they reference.
+
+    Parameters
+    ----------
+    samples : list[NeuralSample]
+        The neural samples to serialize.
+    weights : Any
+        The template weights (e.g., ``parsed_model.getAllWeights()``).
+
+    Returns
+    -------
+    bytes
+        The serialized samples.
+    """
+    java_samples = jpype.java.util.ArrayList([sample._java_sample for sample in samples])
+    return serialize_objects([jpype.java.util.ArrayList(weights), java_samples])
+
+
+def deserialize_samples(data: bytes, weights: Any) -> list[NeuralSample]:
+    """
+    Deserializes neural samples serialized by :func:`serialize_samples` and links them to the passed template
+    weights - the deserialized copies of weights share values with the weights of the same index.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized samples.
+    weights : Any
+        The template weights of the model the samples are loaded into.
+
+    Returns
+    -------
+    list[NeuralSample]
+        The deserialized neural samples.
+    """
+    serialized_weights, java_samples = deserialize_objects(data)
+    weights_by_index = {int(weight.index): weight for weight in weights}
+
+    for weight in serialized_weights:
+        model_weight = weights_by_index.get(int(weight.index))
+
+        if model_weight is not None:
+            weight.value = model_weight.value
+
+    return [NeuralSample(sample) for sample in java_samples]
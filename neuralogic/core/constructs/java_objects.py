@@ -47,12 +47,102 @@ class ValueFactory:
         float | list | np.ndarray
             The Python representation of the value.
         """
+        array = ValueFactory.to_numpy(value)
+
+        if array.ndim == 0:
+            return float(array)
+        return array.tolist()
+
+    @staticmethod
+    def to_numpy(value: Any) -> np.ndarray:
+        """
+        Converts a Java Value object to a numpy array in one primitive ``double[]`` transfer.
+
+        Parameters
+        ----------
+        value : Any
+            The Java Value object to convert.
+
+        Returns
+        -------
+        np.ndarray
+            The ``float64`` array - of shape ``()`` for scalars, ``(n,)`` for vectors, and ``(rows, cols)`` for
+            matrices.
+        """
         size = list(value.size())
         if len(size) == 0 or size[0] == 0:
-            return float(value.get(0))
+            return np.array(float(value.get(0)))
+
+        array = np.array(memoryview(value.getAsArray()), dtype=np.float64)
+
         if len(size) == 2 and size[1] != 1:
-            return np.array(memoryview(value.getAsArray())).reshape(size).tolist()
-        return np.array(memoryview(value.getAsArray())).tolist()
+            return array.reshape(size)
+        return array
+
+    @staticmethod
+    def stack(values: Any) -> np.ndarray:
+        """
+        Stacks Java Value objects of the same shape into one preallocated ``float64`` array. The shape is read from
+        the first value only, and each value is copied in one primitive ``double[]`` transfer.
+
+        Parameters
+        ----------
+        values : Any
+            The (Java or Python) collection of Java Value objects.
+
+        Returns
+        -------
+        np.ndarray
+            The array of shape ``(len(values), *value_shape)``.
+        """
+        if len(values) == 0:
+            return np.empty((0,), dtype=np.float64)
+
+        shape = ValueFactory.to_numpy(values[0]).shape
+        output = np.empty((len(values), *shape), dtype=np.float64)
+
+        if len(shape) == 0:
+            for i, value in enumerate(values):
+                output[i] = value.get(0)
+            return output
+
+        rows = output.reshape(len(values), -1)
+
+        for i, value in enumerate(values):
+            rows[i] = memoryview(value.getAsArray())
+        return output
+
+    @staticmethod
+    def set_value(value: Any, data: Any) -> None:
+        """
+        Writes data into the Java Value object in place. Vector data are written in one primitive array transfer
+        (one transfer per row for matrices) instead of one call per element.
+
+        Parameters
+        ----------
+        value : Any
+            The Java Value object to write into.
+        data : Any
+            The data to write - a scalar, a (nested) list, a numpy array, or a tensor of the shape of the value.
+        """
+        if hasattr(data, "detach"):
+            data = data.detach().cpu().numpy()
+        array = np.ascontiguousarray(data, dtype=np.float64)
+
+        if array.ndim == 0:
+            value.set(0, float(array))
+            return
+
+        values = getattr(value, "values", None)
+
+        if isinstance(values, jpype.JArray(jpype.JDouble)):
+            values[:] = array.reshape(-1)
+        elif isinstance(values, jpype.JArray(jpype.JDouble, 2)):
+            for row, row_data in zip(values, array.reshape(len(values), -1)):
+                row[:] = row_data
+        else:
+            for i, element in enumerate(array.reshape(-1).tolist()):
+                value.set(i, element)
 
     def get_value(self, weight: Any) -> tuple[bool, Any]:
         """
@@ -90,10 +180,21 @@ class ValueFactory:
                 )
             return False, value
 
+        if hasattr(weight, "detach"):
+            weight = weight.detach().cpu().numpy()
+
         if isinstance(weight, (Sequence, np.ndarray, Iterable)):
             if len(weight) == 0:
                 raise NotImplementedError
 
+            try:
+                array = np.asarray(weight, dtype=np.float64)
+            except (TypeError, ValueError):
+                array = None
+
+            if array is not None and array.ndim in (1, 2):
+                return True, self.get_array_value(array)
+
             if isinstance(weight[0], (float, int)) or np.ndim(weight[0]) == 0:
                 vector = [float(w) for w in weight]
                 return True, self.vector_value(vector)
@@ -112,6 +213,142 @@ class ValueFactory:
 
         raise ValueError(f"Cannot create weight from type {type(weight)}, value {weight}")
 
+    def get_array_value(self, array: np.ndarray) -> Any:
+        """
+        Converts a one- or two-dimensional array to a Java Value object, handing the data over to the backend
+        in bulk (as a primitive ``double[]``) instead of element by element.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Array of shape ``(n,)`` (column vector), ``(1, n)`` (row vector), or ``(rows, cols)`` (matrix).
+
+        Returns
+        -------
+        Any
+            The Java Value object.
+        """
+        array = np.ascontiguousarray(array, dtype=np.float64)
+
+        if array.ndim == 1:
+            return self.vector_value(jpype.JArray(jpype.JDouble)(array))
+
+        if len(array) == 1:
+            value = self.vector_value(jpype.JArray(jpype.JDouble)(array[0]))
+            value.rowOrientation = True
+            return value
+
+        value = self.matrix_value(*array.shape)
+        ValueFactory.set_value(value, array)
+        return value
+
+    def get_values(self, values: np.ndarray) -> list[Any]:
+        """
+        Converts an array of values into a list of Java Value objects. Vector values are handed over to the backend
+        in one primitive ``double[][]`` transfer instead of element by element.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of shape ``(n,)`` (scalar values) or ``(n, dim)`` (vector values).
+
+        Returns
+        -------
+        list[Any]
+            The list of ``n`` Java Value objects.
+        """
+        if values.ndim == 1:
+            return [self.scalar_value(value) for value in values.tolist()]
+
+        rows = jpype.JArray(jpype.JDouble, 2)(np.ascontiguousarray(values.reshape(len(values), -1), dtype=np.float64))
+        return [self.vector_value(row) for row in rows]
+
+
+_MISSING = object()
+
+
+class InternCache:
+    """
+    A bounded mapping interning Python keys (terms, predicates) to the Java objects constructed for them, so repeated
+    conversions cost a dictionary lookup instead of calls across the JPype boundary. When the cache is full, the oldest
+    entry is evicted. Hits and misses of lookups are counted.
+    """
+
+    __slots__ = "max_size", "hits", "misses", "_entries"
+
+    def __init__(self, max_size: int | None = 1 << 20):
+        """
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum number of entries, ``0`` disables interning. Default: ``2 ** 20`` (None for unbounded).
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Any, Any] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the object interned under the key (and counts a hit), or the default (and counts a miss).
+
+        Parameters
+        ----------
+        key : Any
+            The key.
+        default : Any
+            The value returned on a miss. Default: None.
+
+        Returns
+        -------
+        Any
+            The interned object, or the default.
+        """
+        value = self._entries.get(key, _MISSING)
+
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Interns the object under the key, evicting the oldest entry if the cache is full.
+
+        Parameters
+        ----------
+        key : Any
+            The key.
+        value : Any
+            The object to intern.
+        """
+        if self.max_size is not None and len(self._entries) >= self.max_size:
+            if self.max_size <= 0:
+                return
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = value
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits to all lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups != 0 else 0.0
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return f"InternCache(size={len(self)}, max_size={self.max_size}, hits={self.hits}, misses={self.misses})"
+
 
 def _is_body_flat(body: FContainer) -> bool:
     if not isinstance(body.function, CombinationFunction):
@@ -131,17 +368,30 @@ def _flatten_rule_body(body: Iterable[Any], metadata: Metadata | None) -> Any:
 class JavaFactory:
     """
     Factory for converting high-level Python logic constructs (Atoms, Rules, etc.) into their corresponding Java objects.
-    It maintains internal factories for predicates, constants, and weights.
+    It maintains internal factories for predicates, constants, and weights. Converted constants and predicates are
+    interned (see :class:`InternCache`), so each distinct term and predicate is constructed only once per factory.
     """
 
-    def __init__(self, settings: SettingsProxy | None = None):
+    def __init__(
+        self,
+        settings: SettingsProxy | None = None,
+        *,
+        intern_size: int | None = 1 << 20,
+        lean_build: bool | None = None,
+    ):
         """
         Parameters
         ----------
         settings : SettingsProxy, optional
             The settings proxy used for configuring the Java factories. If None, a default SettingsProxy is created.
+        intern_size : int, optional
+            The maximum number of interned terms and of interned predicates, ``0`` disables interning.
+            Default: ``2 ** 20`` (None for unbounded).
+        lean_build : bool, optional
+            Whether to omit human-readable strings of converted rules and relations. The strings of template rules
+            can be restored later (see :meth:`restore_debug_strings`). Default: None (``settings.lean_build``).
         """
-        from neuralogic.core.constructs.relation import WeightedRelation
+        from neuralogic.core.constructs.relation import TensorRelation, WeightedRelation
         from neuralogic.core.constructs.rule import Rule
 
         if not is_initialized():
@@ -153,10 +403,13 @@ class JavaFactory:
             settings = Settings().create_proxy()
 
         self.settings = settings
+        self.lean_build = settings.lean_build if lean_build is None else lean_build
+        self._lean_rules: list[tuple[Any, Any]] = []
 
         self.value_factory = ValueFactory()
 
         self.weighted_atom_type = WeightedRelation
+        self.tensor_relation_type = TensorRelation
         self.rule_type = Rule
 
         self.predicate_metadata = jpype.JClass("cz.cvut.fel.ida.logic.constructs.template.metadata.PredicateMetadata")
@@ -177,6 +430,9 @@ class JavaFactory:
         self.predicate_factory = self.builder.predicateFactory
         self.weight_factory = self.builder.weightFactory
 
+        self.term_cache = InternCache(intern_size)
+        self.predicate_cache = InternCache(intern_size)
+
         self.lifted_example = jpype.JClass("cz.cvut.fel.ida.logic.constructs.example.LiftedExample")
         self.valued_fact = jpype.JClass("cz.cvut.fel.ida.logic.constructs.example.ValuedFact")
 
@@ -221,20 +477,63 @@ class JavaFactory:
                 return variable_factory.construct(term.name)
             return variable_factory.construct(term.name, term.type)
         if isinstance(term, Constant):
-            if term.type is None:
-                return self.constant_factory.construct(term.name)
-            return self.constant_factory.construct(term.name, term.type)
+            return self.get_constant(term.name, term.type)
 
+        if isinstance(term, str):
+            key = term
+        elif isinstance(term, (int, float)):
+            # Numbers with equal hashes but different string forms (e.g., 1, 1.0, and True) are keyed by their types
+            key = (type(term), term)
+        else:
+            raise ValueError(f"Invalid term {term}")
+
+        constant = self.term_cache.get(key, _MISSING)
+
+        if constant is _MISSING:
+            constant = self._construct_term(term)
+            self.term_cache.put(key, constant)
+
+        if constant is None:
+            return variable_factory.construct(term)
+        return constant
+
+    def get_constant(self, name: str, term_type: str | None = None) -> Any:
+        """
+        Converts a constant name to a Java constant.
+
+        Parameters
+        ----------
+        name : str
+            The name of the constant.
+        term_type : str, optional
+            The type of the constant. Default: None.
+
+        Returns
+        -------
+        Any
+            The Java constant object.
+        """
+        key = (Constant, name, term_type)
+        constant = self.term_cache.get(key)
+
+        if constant is None:
+            if term_type is None:
+                constant = self.constant_factory.construct(name)
+            else:
+                constant = self.constant_factory.construct(name, term_type)
+            self.term_cache.put(key, constant)
+        return constant
+
+    def _construct_term(self, term: Any) -> Any:
+        # Returns the Java constant of the term, or None for string variables (constructed per variable factory)
         if isinstance(term, str):
             if term[0].islower() or term.isnumeric():
                 return self.constant_factory.construct(term)
             elif term[0].isupper():
-                return variable_factory.construct(term)
+                return None
             else:
                 raise ValueError(f"Invalid term {term}")
-        if isinstance(term, (int, float)):
-            return self.constant_factory.construct(str(term))
-        raise ValueError(f"Invalid term {term}")
+        return self.constant_factory.construct(str(term))
 
     def atom_to_clause(self, atom: Any) -> Any:
         """
@@ -324,7 +623,9 @@ class JavaFactory:
             java_relation = relation_class(predicate, j_term_list, relation.negated, transformation_function, weight)
         else:
             java_relation = relation_class(predicate, j_term_list, relation.negated, weight)
-        java_relation.originalString = relation.to_str()
+
+        if not self.lean_build:
+            java_relation.originalString = relation.to_str()
 
         return java_relation
 
@@ -438,11 +739,80 @@ class JavaFactory:
     def get_conjunction(
         self, relations: Iterable[Any], variable_factory: Any, default_weight: Any = None, is_example: bool = False
     ) -> Any:
-        valued_facts = [
-            self.get_valued_fact(relation, variable_factory, default_weight, is_example) for relation in relations
-        ]
+        valued_facts = []
+
+        for relation in relations:
+            if isinstance(relation, self.tensor_relation_type):
+                valued_facts.extend(self.get_tensor_facts(relation, is_example))
+            else:
+                valued_facts.append(self.get_valued_fact(relation, variable_factory, default_weight, is_example))
         return self.conjunction(jpype.java.util.ArrayList(valued_facts))
 
+    def get_tensor_facts(self, relation: Any, is_example: bool = True) -> list[Any]:
+        """
+        Converts a TensorRelation into a list of Java ValuedFacts in bulk. The predicate is constructed once,
+        each distinct term and each distinct value of fixed facts is converted only once, and vector values are
+        transferred as one primitive array. Learnable facts get a weight each.
+
+        Parameters
+        ----------
+        relation : TensorRelation
+            The tensor relation to convert.
+        is_example : bool
+            Whether the facts are part of an example (fixed) or learnable. Default: True.
+
+        Returns
+        -------
+        list[Any]
+            The list of Java ValuedFact objects, one per fact.
+        """
+        if len(relation) == 0:
+            return []
+
+        predicate = self.get_predicate(relation.predicate)
+        name = relation.predicate.to_str()
+
+        unique_terms, term_index = np.unique(relation.terms, return_inverse=True)
+        constants = [self.get_constant(str(term)) for term in unique_terms.tolist()]
+        term_index = term_index.reshape(relation.terms.shape).T.tolist()
+        term_names = [] if self.lean_build else [str(term) for term in unique_terms.tolist()]
+
+        if relation.values is None and is_example:
+            value_index = [0] * len(relation)
+            unique_values = np.ones(1, dtype=np.float64)
+        elif relation.values is None:
+            # Learnable facts have a weight each, even if they share the initial value
+            value_index = list(range(len(relation)))
+            unique_values = np.ones(len(relation), dtype=np.float64)
+        elif is_example:
+            unique_values, value_index = np.unique(relation.values, axis=0, return_inverse=True)
+            value_index = value_index.reshape(-1).tolist()
+        else:
+            unique_values, value_index = relation.values, list(range(len(relation)))
+
+        values = self.value_factory.get_values(unique_values)
+        value_strings = [] if self.lean_build else [str(value) for value in unique_values.tolist()]
+
+        if is_example:
+            weights = [self.weight_factory.construct(value, True, True) for value in values]
+        else:
+            weights = [self.weight_factory.construct(value, False, True) for value in values]
+
+        array_list = jpype.java.util.ArrayList
+        value_format = "<{}>" if is_example else "{}"
+        valued_facts = []
+
+        for terms, value in zip(term_index, value_index):
+            java_relation = self.valued_fact(
+                predicate, array_list([constants[i] for i in terms]), False, weights[value]
+            )
+
+            if not self.lean_build:
+                terms_string = ", ".join(term_names[i] for i in terms)
+                java_relation.originalString = f"{value_format.format(value_strings[value])} {name}({terms_string})"
+            valued_facts.append(java_relation)
+        return valued_facts
+
     def get_predicate_metadata_pair(self, predicate_metadata: Any) -> Any:
         return self.pair(
             self.get_predicate(predicate_metadata.predicate),
@@ -478,7 +848,9 @@ class JavaFactory:
             The Java WeightedRule object.
         """
         java_rule = self.weighted_rule()
-        java_rule.setOriginalString(str(rule))
+
+        if not self.lean_build:
+            java_rule.setOriginalString(str(rule))
 
         variable_factory = self.get_variable_factory()
 
@@ -557,8 +929,35 @@ class JavaFactory:
 
         return java_rule
 
+    def defer_debug_string(self, java_rule: Any, rule: Any) -> None:
+        """Keeps a template rule converted in the lean build mode, so that the human-readable string of the Java rule
+        can be restored later (see :meth:`restore_debug_strings`). Rules of examples are not kept - the factory lives
+        as long as the model, and the kept rules would grow with every built dataset.
+
+        Parameters
+        ----------
+        java_rule : Any
+            The converted Java rule.
+        rule : Any
+            The Python rule.
+        """
+        if self.lean_build:
+            self._lean_rules.append((java_rule, rule))
+
+    def restore_debug_strings(self) -> None:
+        """Sets the human-readable strings of template rules converted in the lean build mode (e.g., before drawing)."""
+        for java_rule, rule in self._lean_rules:
+            java_rule.setOriginalString(str(rule))
+        self._lean_rules.clear()
+
     def get_predicate(self, predicate: Any) -> Any:
-        return self.predicate_factory.construct(predicate.name, predicate.arity, predicate.special, predicate.hidden)
+        key = (predicate.name, predicate.arity, predicate.special, predicate.hidden)
+        java_predicate = self.predicate_cache.get(key)
+
+        if java_predicate is None:
+            java_predicate = self.predicate_factory.construct(*key)
+            self.predicate_cache.put(key, java_predicate)
+        return java_predicate
 
     def get_weight(self, weight: Any, name: str | None, fixed: bool) -> Any:
         initialized, value = self.value_factory.get_value(weight)
@@ -285,3 +285,72 @@ class WeightedRelation(BaseRelation):
         relation.negated = self.negated
 
         return relation
+
+
+class TensorRelation:
+    """
+    Represents a block of fixed facts of a single predicate stored as arrays - e.g., ``edge_index`` with ``edge_attr``.
+    The facts are converted to the backend in bulk instead of one relation at a time.
+    """
+
+    __slots__ = "predicate", "terms", "values"
+
+    def __init__(self, name: str, terms: Any, values: Any = None):
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the predicate.
+        terms : Any
+            Integer terms of the facts - an array of shape ``(arity, n)`` (one column per fact, as in ``edge_index``)
+            or ``(n,)`` for unary facts.
+        values : Any, optional
+            Values of the facts - an array of shape ``(n,)`` for scalar values or ``(n, dim)`` for vector values.
+            If None, all facts have the value ``1``. Default: None.
+        """
+        from neuralogic.dataset.tensor import Data
+
+        terms = Data._to_numpy(terms)
+
+        if terms.ndim == 1:
+            terms = terms.reshape(1, -1)
+        if terms.ndim != 2:
+            raise ValueError(f"Terms of tensor relation {name} must be of shape (arity, n), got {terms.shape}")
+
+        if values is not None:
+            values = Data._to_numpy(values).astype(np.float64, copy=False)
+
+            if len(values) != terms.shape[1]:
+                raise ValueError(
+                    f"Number of values ({len(values)}) of tensor relation {name} doesn't match "
+                    f"the number of facts ({terms.shape[1]})"
+                )
+
+        self.predicate = Predicate(name, terms.shape[0])
+        self.terms = terms
+        self.values = values
+
+    def __len__(self) -> int:
+        return self.terms.shape[1]
+
+    def to_relations(self) -> list[WeightedRelation]:
+        """Expands the tensor relation into a list of fixed weighted relations.
+
+        Returns
+        -------
+        list[WeightedRelation]
+            The list of relations, one per fact.
+        """
+        relation = factories.Relation.get(self.predicate.to_str())
+        values = [1] * len(self) if self.values is None else self.values
+
+        return [relation(terms)[value].fixed() for terms, value in zip(self.terms.T.tolist(), values)]
+
+    def to_str(self, end=False) -> str:
+        return "\n".join(relation.to_str(end) for relation in self.to_relations())
+
+    def __str__(self) -> str:
+        return f"{self.predicate} x {len(self)}"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -90,3 +90,26 @@ class Constant:
 
     def __lt__(self, other: Any) -> bool:
         return str(self).__lt__(str(other))
+
+
+def is_variable(term: Any) -> bool:
+    """
+    Returns whether the term is a variable - a :class:`Variable` or a string starting with an uppercase letter.
+
+    Parameters
+    ----------
+    term : Any
+        The term.
+
+    Returns
+    -------
+    bool
+        Whether the term is a variable.
+    """
+    if isinstance(term, Variable):
+        return True
+    if isinstance(term, Constant):
+        return False
+
+    term = str(term)
+    return len(term) != 0 and term[0] == term[0].upper() and term[0] != term[0].lower()
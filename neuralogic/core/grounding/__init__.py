@@ -0,0 +1,29 @@
+from neuralogic.core.grounding.dependency import DependencyGraph, PredicateKey, predicate_key
+from neuralogic.core.grounding.explain import GroundingReport, RuleProfile, profile_rules
+from neuralogic.core.grounding.limits import (
+    GroundingDiagnostics,
+    GroundingLimits,
+    GroundingMeasurement,
+    LimitViolation,
+)
+from neuralogic.core.grounding.magic import magic_sets
+from neuralogic.core.grounding.planner import FactStatistics, plan_joins
+from neuralogic.core.grounding.pruning import PruningReport, prune_entries
+
+__all__ = [
+    "DependencyGraph",
+    "FactStatistics",
+    "GroundingDiagnostics",
+    "GroundingLimits",
+    "GroundingMeasurement",
+    "GroundingReport",
+    "LimitViolation",
+    "PredicateKey",
+    "PruningReport",
+    "RuleProfile",
+    "magic_sets",
+    "plan_joins",
+    "predicate_key",
+    "profile_rules",
+    "prune_entries",
+]
@@ -0,0 +1,151 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from neuralogic.core.constructs.function.function_container import FContainer
+from neuralogic.core.constructs.predicate import Predicate
+from neuralogic.core.constructs.relation import BaseRelation, TensorRelation
+from neuralogic.core.constructs.rule import Rule
+
+PredicateKey = tuple[str, int]
+
+
+def predicate_key(predicate: Predicate) -> PredicateKey:
+    """
+    Returns the key identifying the predicate in the dependency graph. The key ignores whether the predicate is
+    hidden, as hidden and visible predicates of the same name and arity match in the backend.
+
+    Parameters
+    ----------
+    predicate : Predicate
+        The predicate.
+
+    Returns
+    -------
+    PredicateKey
+        The pair of the predicate name and arity.
+    """
+    return predicate.name, predicate.arity
+
+
+def body_relations(body: Any) -> Iterator[BaseRelation]:
+    """
+    Yields all relations in the rule body, including relations nested in function containers.
+
+    Parameters
+    ----------
+    body : Any
+        The rule body (a list of body items or a function container).
+
+    Returns
+    -------
+    Iterator[BaseRelation]
+        The iterator of body relations.
+    """
+    if isinstance(body, BaseRelation):
+        yield body
+    elif isinstance(body, FContainer):
+        yield from body_relations(body.nodes)
+    elif isinstance(body, Iterable) and not isinstance(body, str):
+        for item in body:
+            yield from body_relations(item)
+
+
+def fact_predicate_keys(facts: Iterable[Any]) -> set[PredicateKey]:
+    """
+    Returns keys of predicates of the passed facts.
+
+    Parameters
+    ----------
+    facts : Iterable[Any]
+        The facts (relations or tensor relations).
+
+    Returns
+    -------
+    set[PredicateKey]
+        The set of predicate keys.
+    """
+    return {predicate_key(fact.predicate) for fact in facts if isinstance(fact, (BaseRelation, TensorRelation))}
+
+
+class DependencyGraph:
+    """
+    DependencyGraph is the predicate dependency graph of a template - edges lead from predicates in rule bodies to
+    predicates in rule heads. Special (builtin) predicates are not part of the graph.
+    """
+
+    def __init__(self, entries: Iterable[Any] = ()):
+        """
+        Parameters
+        ----------
+        entries : Iterable[Any]
+            The template entries (rules, relations, metadata). Only rules introduce dependencies.
+        """
+        self.dependents: dict[PredicateKey, set[PredicateKey]] = {}
+        self.dependencies: dict[PredicateKey, set[PredicateKey]] = {}
+
+        for entry in entries:
+            if isinstance(entry, Rule):
+                self.add_rule(entry)
+
+    def add_rule(self, rule: Rule) -> None:
+        """Adds dependencies of the rule head on the rule body predicates.
+
+        Parameters
+        ----------
+        rule : Rule
+            The rule to add.
+        """
+        head = predicate_key(rule.head.predicate)
+        self.dependencies.setdefault(head, set())
+
+        for relation in body_relations(rule.body):
+            if relation.predicate.special:
+                continue
+
+            key = predicate_key(relation.predicate)
+
+            self.dependencies[head].add(key)
+            self.dependents.setdefault(key, set()).add(head)
+
+    def reachable_from(self, predicates: Iterable[PredicateKey]) -> set[PredicateKey]:
+        """Returns predicates whose groundings can change when facts of the passed predicates change (including
+        the passed predicates).
+
+        Parameters
+        ----------
+        predicates : Iterable[PredicateKey]
+            The changed predicates.
+
+        Returns
+        -------
+        set[PredicateKey]
+            The set of reachable predicates.
+        """
+        return DependencyGraph._closure(predicates, self.dependents)
+
+    def required_by(self, predicates: Iterable[PredicateKey]) -> set[PredicateKey]:
+        """Returns predicates the passed predicates (transitively) depend on (including the passed predicates).
+
+        Parameters
+        ----------
+        predicates : Iterable[PredicateKey]
+            The queried predicates.
+
+        Returns
+        -------
+        set[PredicateKey]
+            The set of required predicates.
+        """
+        return DependencyGraph._closure(predicates, self.dependencies)
+
+    @staticmethod
+    def _closure(predicates: Iterable[PredicateKey], edges: dict[PredicateKey, set[PredicateKey]]) -> set[PredicateKey]:
+        visited = set(predicates)
+        stack = list(visited)
+
+        while stack:
+            for key in edges.get(stack.pop(), ()):
+                if key not in visited:
+                    visited.add(key)
+                    stack.append(key)
+        return visited
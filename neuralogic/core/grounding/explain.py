@@ -0,0 +1,341 @@
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from neuralogic.core.constructs.relation import BaseRelation
+from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.constructs.term import is_variable
+from neuralogic.core.grounding.dependency import PredicateKey, body_relations, predicate_key
+
+Facts = dict[PredicateKey, list[tuple[str, ...]]]
+
+
+@dataclass
+class RuleProfile:
+    """
+    The grounding cost of one rule - summed over the profiled examples.
+
+    The substitutions, peak size, and time are measured by joining the body in Python (an estimate of the join work
+    of the backend grounder, which does not report it). The groundings are counted by the backend when the profile
+    is created by :meth:`~neuralogic.core.model.Model.explain_grounding`.
+
+    Attributes
+    ----------
+    rule : str
+        The rule.
+    substitutions : int
+        The number of body substitutions tried (candidate facts matched against partial substitutions).
+    groundings : int
+        The number of groundings (complete body substitutions) produced.
+    peak_size : int
+        The peak number of partial substitutions after joining any body relation (the maximum over examples).
+    time : float
+        The time (in seconds) spent joining the body in Python.
+    truncated : bool
+        Whether the join was aborted by the substitution or time budget - the substitutions, the peak size, and the
+        groundings joined in Python are then lower bounds.
+    """
+
+    rule: str
+    substitutions: int = 0
+    groundings: int = 0
+    peak_size: int = 0
+    time: float = 0.0
+    truncated: bool = False
+
+    def add(self, other: "RuleProfile") -> None:
+        self.substitutions += other.substitutions
+        self.groundings += other.groundings
+        self.peak_size = max(self.peak_size, other.peak_size)
+        self.time += other.time
+        self.truncated = self.truncated or other.truncated
+
+
+@dataclass
+class GroundingReport:
+    """
+    The explain-plan of grounding - per-rule costs on the profiled examples and their extrapolation to the whole
+    dataset.
+
+    Attributes
+    ----------
+    rules : list[RuleProfile]
+        The profiles of rules in the order of the template.
+    profiled_examples : int
+        The number of profiled examples.
+    total_examples : int
+        The number of examples in the whole dataset.
+    grounding_time : float
+        The time (in seconds) the backend spent grounding the profiled examples.
+    """
+
+    rules: list[RuleProfile] = field(default_factory=list)
+    profiled_examples: int = 0
+    total_examples: int = 0
+    grounding_time: float = 0.0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether profiling of any rule was aborted by the budget (the report is partial)."""
+        return any(rule.truncated for rule in self.rules)
+
+    @property
+    def scale(self) -> float:
+        """The ratio of all examples to profiled examples."""
+        if self.profiled_examples == 0:
+            return 0.0
+        return self.total_examples / self.profiled_examples
+
+    def estimate(self) -> dict[str, float]:
+        """Returns the totals of the whole dataset, extrapolated from the profiled examples.
+
+        Returns
+        -------
+        dict[str, float]
+            The estimated total number of body substitutions, groundings, the (Python) join time, and the (backend)
+            grounding time.
+        """
+        return {
+            "substitutions": sum(rule.substitutions for rule in self.rules) * self.scale,
+            "groundings": sum(rule.groundings for rule in self.rules) * self.scale,
+            "time": sum(rule.time for rule in self.rules) * self.scale,
+            "grounding_time": self.grounding_time * self.scale,
+        }
+
+    def __str__(self) -> str:
+        header = f"{'substitutions':>14} {'groundings':>11} {'peak':>9} {'time [ms]':>10}  rule"
+        lines = [f"Profiled {self.profiled_examples} of {self.total_examples} examples", header]
+
+        for rule in sorted(self.rules, key=lambda rule: rule.substitutions, reverse=True):
+            substitutions = f"{rule.substitutions}{'+' if rule.truncated else ''}"
+            lines.append(
+                f"{substitutions:>14} {rule.groundings:>11} {rule.peak_size:>9} {rule.time * 1000:>10.2f}  {rule.rule}"
+            )
+
+        estimate = self.estimate()
+        lines.append(
+            f"Estimated for all examples: {estimate['substitutions']:.0f} substitutions, "
+            f"{estimate['groundings']:.0f} groundings, {estimate['grounding_time']:.2f} s of grounding"
+        )
+
+        if self.truncated:
+            lines.append("Profiling of rules marked with + was aborted by the budget (their costs are lower bounds)")
+        return "\n".join(lines)
+
+
+class _FactIndex:
+    __slots__ = ("_facts", "_sets", "_indices")
+
+    def __init__(self, facts: Facts):
+        self._facts = facts
+        self._sets: dict[PredicateKey, set[tuple[str, ...]]] = {}
+        self._indices: dict[tuple[PredicateKey, int], dict[str, list[tuple[str, ...]]]] = {}
+
+    def contains(self, key: PredicateKey, terms: tuple[str, ...]) -> bool:
+        if key not in self._sets:
+            self._sets[key] = set(self._facts.get(key, []))
+        return terms in self._sets[key]
+
+    def candidates(self, key: PredicateKey, bound: dict[int, str]) -> list[tuple[str, ...]]:
+        if len(bound) == 0:
+            return self._facts.get(key, [])
+
+        position, term = next(iter(bound.items()))
+        index = self._indices.get((key, position))
+
+        if index is None:
+            index = {}
+            for terms in self._facts.get(key, []):
+                index.setdefault(terms[position], []).append(terms)
+            self._indices[(key, position)] = index
+        return index.get(term, [])
+
+
+def _ground_terms(terms: list[str], substitution: dict[str, str]) -> list[str | None]:
+    return [substitution.get(term) if is_variable(term) else term for term in terms]
+
+
+def _special_holds(name: str, terms: list[str | None]) -> bool:
+    if any(term is None for term in terms):
+        return True
+    if name == "eq":
+        return terms[0] == terms[1]
+    if name == "neq":
+        return terms[0] != terms[1]
+    if name == "alldiff":
+        return len(set(terms)) == len(terms)
+    return True
+
+
+def profile_rule(
+    rule: Rule,
+    facts: Facts,
+    index: _FactIndex | None = None,
+    *,
+    max_substitutions: int | None = None,
+    deadline: float | None = None,
+) -> RuleProfile:
+    """
+    Profiles the join of the rule body over the facts, joining body relations left to right (as written).
+
+    Only ``eq``, ``neq``, and ``alldiff`` special predicates filter substitutions, other special predicates are
+    assumed to hold, so the profile is an upper bound for rules using them.
+
+    Parameters
+    ----------
+    rule : Rule
+        The rule to profile.
+    facts : Facts
+        The facts (the least model) - substitutions of each predicate.
+    index : _FactIndex, optional
+        The index of the facts, shared between rules. Default: None (a new index).
+    max_substitutions : int, optional
+        The budget of tried substitutions. Once exceeded, the join is aborted and the profile is truncated, which
+        also bounds the number of partial substitutions held in memory. Default: None (no budget).
+    deadline : float, optional
+        The :func:`time.perf_counter` time at which the join is aborted and the profile is truncated. Default: None
+        (no deadline).
+
+    Returns
+    -------
+    RuleProfile
+        The profile of the rule.
+    """
+    index = index if index is not None else _FactIndex(facts)
+    profile = RuleProfile(str(rule))
+    start = time.perf_counter()
+
+    if deadline is not None and start >= deadline:
+        profile.truncated = True
+        return profile
+
+    partial: list[dict[str, str]] = [{}]
+    profile.peak_size = 1
+
+    for literal in body_relations(rule.body):
+        terms = [str(term) for term in literal.terms]
+
+        if literal.predicate.special:
+            partial = [sub for sub in partial if _special_holds(literal.predicate.name, _ground_terms(terms, sub))]
+        elif literal.negated:
+            key = predicate_key(literal.predicate)
+            partial = [
+                sub
+                for sub in partial
+                if (ground := _ground_terms(terms, sub)).count(None) != 0 or not index.contains(key, tuple(ground))
+            ]
+        else:
+            key = predicate_key(literal.predicate)
+            extended = []
+
+            for sub in partial:
+                ground = _ground_terms(terms, sub)
+                bound = {position: term for position, term in enumerate(ground) if term is not None}
+                candidates = index.candidates(key, bound)
+                profile.substitutions += len(candidates)
+
+                if (max_substitutions is not None and profile.substitutions > max_substitutions) or (
+                    deadline is not None and time.perf_counter() >= deadline
+                ):
+                    profile.truncated = True
+                    break
+
+                for candidate in candidates:
+                    new_sub = dict(sub)
+                    for term, value in zip(terms, candidate):
+                        if is_variable(term):
+                            if new_sub.setdefault(term, value) != value:
+                                break
+                        elif term != value:
+                            break
+                    else:
+                        extended.append(new_sub)
+            partial = extended
+
+        profile.peak_size = max(profile.peak_size, len(partial))
+
+        if profile.truncated:
+            break
+
+    profile.groundings = len(partial)
+    profile.time = time.perf_counter() - start
+    return profile
+
+
+def profile_rules(
+    rules: Iterable[Any], facts: Facts, *, max_substitutions: int | None = None, max_time: float | None = None
+) -> list[RuleProfile]:
+    """
+    Profiles joins of bodies of all rules over the facts.
+
+    Parameters
+    ----------
+    rules : Iterable[Any]
+        The template entries - entries other than rules are skipped.
+    facts : Facts
+        The facts (the least model) - substitutions of each predicate.
+    max_substitutions : int, optional
+        The budget of tried substitutions of each rule (see :func:`profile_rule`). Default: None (no budget).
+    max_time : float, optional
+        The time budget (in seconds) of profiling all rules - rules not profiled within the budget are truncated.
+        Default: None (no budget).
+
+    Returns
+    -------
+    list[RuleProfile]
+        The profiles of rules in the order of the template.
+    """
+    index = _FactIndex(facts)
+    deadline = time.perf_counter() + max_time if max_time is not None else None
+
+    return [
+        profile_rule(rule, facts, index, max_substitutions=max_substitutions, deadline=deadline)
+        for rule in rules
+        if isinstance(rule, Rule)
+    ]
+
+
+def grounding_facts(groundings: Iterable[Any]) -> Facts:
+    """
+    Returns the atoms of groundings in the form used for profiling.
+
+    Parameters
+    ----------
+    groundings : Iterable[Any]
+        The groundings (:class:`~neuralogic.core.builder.components.Grounding`).
+
+    Returns
+    -------
+    Facts
+        The substitutions of each predicate.
+    """
+    facts: Facts = {}
+
+    for grounding in groundings:
+        for name, atoms in grounding.atoms.items():
+            for subs in atoms.keys():
+                facts.setdefault((name, len(subs)), []).append(subs)
+    return facts
+
+
+def relation_facts(relations: Iterable[Any]) -> Facts:
+    """
+    Returns the facts of ground relations in the form used for profiling.
+
+    Parameters
+    ----------
+    relations : Iterable[Any]
+        The relations - entries other than relations are skipped.
+
+    Returns
+    -------
+    Facts
+        The substitutions of each predicate.
+    """
+    facts: Facts = {}
+
+    for relation in relations:
+        if isinstance(relation, BaseRelation):
+            facts.setdefault(predicate_key(relation.predicate), []).append(tuple(str(t) for t in relation.terms))
+    return facts
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import neuralogic.dataset as datasets
+from neuralogic.core.constructs.relation import BaseRelation, TensorRelation
+from neuralogic.core.grounding.dependency import DependencyGraph, PredicateKey, fact_predicate_keys, predicate_key
+
+if TYPE_CHECKING:
+    from neuralogic.core.builder.dataset_builder import DatasetBuilder
+    from neuralogic.core.settings import SettingsProxy
+
+FactChanges = Iterable[Any] | dict[int, Iterable[Any]] | None
+
+
+def fact_key(relation: BaseRelation) -> tuple[PredicateKey, tuple[str, ...]]:
+    """
+    Returns the key identifying the fact regardless of its value - the predicate and the terms.
+
+    Parameters
+    ----------
+    relation : BaseRelation
+        The fact.
+
+    Returns
+    -------
+    tuple[PredicateKey, tuple[str, ...]]
+        The key of the fact.
+    """
+    return predicate_key(relation.predicate), tuple(str(term) for term in relation.terms)
+
+
+def flatten_samples(samples: list[datasets.Sample]) -> list[datasets.Sample]:
+    """
+    Splits samples into samples with one query each, ordered the same way the samples are built - grouped by examples
+    (by identity) in the order of their first occurrence.
+
+    Parameters
+    ----------
+    samples : list[datasets.Sample]
+        The samples to flatten.
+
+    Returns
+    -------
+    list[datasets.Sample]
+        The flattened samples.
+    """
+    groups: dict[int, list[datasets.Sample]] = {}
+
+    for sample in samples:
+        queries = sample.query if isinstance(sample.query, list) else [sample.query]
+        groups.setdefault(id(sample.example), []).extend(datasets.Sample(query, sample.example) for query in queries)
+
+    return [sample for group in groups.values() for sample in group]
+
+
+def apply_fact_changes(
+    example: list[Any], added_facts: list[Any], removed_facts: list[Any]
+) -> tuple[list[Any], set[PredicateKey] | None]:
+    """
+    Applies changes to a copy of the example. Facts are removed regardless of their values.
+
+    Parameters
+    ----------
+    example : list[Any]
+        The example to change.
+    added_facts : list[Any]
+        The facts to add.
+    removed_facts : list[Any]
+        The facts to remove.
+
+    Returns
+    -------
+    tuple[list[Any], set[PredicateKey] | None]
+        The changed example and the keys of the changed predicates (None if entries other than facts are added).
+    """
+    removed_keys = {fact_key(fact) for fact in removed_facts}
+    removed_predicates = {key for key, _ in removed_keys}
+
+    changed_predicates: set[PredicateKey] | None = set()
+    new_example = []
+
+    for fact in example:
+        if isinstance(fact, TensorRelation) and predicate_key(fact.predicate) in removed_predicates:
+            relations = [relation for relation in fact.to_relations() if fact_key(relation) not in removed_keys]
+
+            if len(relations) == len(fact):
+                new_example.append(fact)
+            else:
+                new_example.extend(relations)
+                changed_predicates.add(predicate_key(fact.predicate))
+        elif isinstance(fact, BaseRelation) and fact_key(fact) in removed_keys:
+            changed_predicates.add(predicate_key(fact.predicate))
+        else:
+            new_example.append(fact)
+
+    new_example.extend(added_facts)
+
+    if any(not isinstance(fact, (BaseRelation, TensorRelation)) for fact in added_facts):
+        return new_example, None
+    return new_example, changed_predicates | fact_predicate_keys(added_facts)
+
+
+def _facts_for(facts: FactChanges, index: int) -> list[Any]:
+    if facts is None:
+        return []
+    if isinstance(facts, dict):
+        return list(facts.get(index, []))
+    return list(facts)
+
+
+@dataclass
+class DatasetSource:
+    """
+    The source of a grounded or built dataset - samples with one query each, aligned with the grounded/built samples,
+    and everything needed to rebuild them.
+    """
+
+    samples: list[datasets.Sample]
+    dataset_builder: DatasetBuilder
+    settings: SettingsProxy
+    learnable_facts: bool = False
+
+    @staticmethod
+    def from_dataset(
+        dataset: datasets.BaseDataset,
+        dataset_builder: DatasetBuilder,
+        settings: SettingsProxy,
+        learnable_facts: bool,
+        size: int,
+    ) -> DatasetSource | None:
+        """
+        Creates the source of the dataset if samples built from the dataset can be aligned with the dataset samples.
+
+        Parameters
+        ----------
+        dataset : datasets.BaseDataset
+            The dataset the samples have been built from.
+        dataset_builder : DatasetBuilder
+            The dataset builder.
+        settings : SettingsProxy
+            The settings used for building.
+        learnable_facts : bool
+            Whether facts are learnable.
+        size : int
+            The number of built samples.
+
+        Returns
+        -------
+        DatasetSource | None
+            The source, or None if the dataset cannot be updated incrementally.
+        """
+        if not isinstance(dataset, datasets.Dataset) or len(dataset._examples) != 0 or len(dataset._queries) != 0:
+            return None
+
+        samples = flatten_samples(dataset.samples)
+
+        # Queries with variables can produce multiple samples - the alignment is unknown
+        if len(samples) != size:
+            return None
+        return DatasetSource(samples, dataset_builder, settings, learnable_facts)
+
+    def examples(self) -> list[list[Any]]:
+        """Returns distinct examples in the order of their first occurrence."""
+        return list({id(sample.example): sample.example for sample in self.samples}.values())
+
+    def dependency_graph(self) -> DependencyGraph | None:
+        """Returns the dependency graph of the template, or None if the template rules are not known."""
+        model = self.dataset_builder.model
+
+        if model is None or model._model_file is not None:
+            return None
+        return DependencyGraph(model)
+
+    def update(self, added_facts: FactChanges, removed_facts: FactChanges) -> tuple[DatasetSource, list[int]]:
+        """
+        Applies changes of facts to the examples and finds samples the changes can affect - samples of changed
+        examples with queries of predicates reachable from the changed predicates.
+
+        Parameters
+        ----------
+        added_facts : FactChanges
+            Facts to add to all examples, or a dictionary mapping indices of examples to facts to add.
+        removed_facts : FactChanges
+            Facts to remove from all examples, or a dictionary mapping indices of examples to facts to remove.
+
+        Returns
+        -------
+        tuple[DatasetSource, list[int]]
+            The updated source and indices of samples to rebuild.
+        """
+        # Changes of all examples are materialized once, so an iterator is not consumed by the first example
+        if added_facts is not None and not isinstance(added_facts, dict):
+            added_facts = list(added_facts)
+        if removed_facts is not None and not isinstance(removed_facts, dict):
+            removed_facts = list(removed_facts)
+
+        new_examples: dict[int, list[Any]] = {}
+        changed_predicates: dict[int, set[PredicateKey] | None] = {}
+
+        for index, example in enumerate(self.examples()):
+            added, removed = _facts_for(added_facts, index), _facts_for(removed_facts, index)
+
+            if not added and not removed:
+                continue
+
+            new_example, changed = apply_fact_changes(example, added, removed)
+
+            if changed is not None and not changed:
+                continue
+
+            new_examples[id(example)] = new_example
+            changed_predicates[id(example)] = changed
+
+        graph = self.dependency_graph() if new_examples else None
+        reachable: dict[int, set[PredicateKey] | None] = {}
+
+        samples = []
+        rebuild = []
+
+        for index, sample in enumerate(self.samples):
+            example_id = id(sample.example)
+
+            if example_id not in new_examples:
+                samples.append(sample)
+                continue
+
+            samples.append(datasets.Sample(sample.query, new_examples[example_id]))
+
+            if example_id not in reachable:
+                changed = changed_predicates[example_id]
+                reachable[example_id] = None if graph is None or changed is None else graph.reachable_from(changed)
+
+            predicates = reachable[example_id]
+            query = sample.query
+
+            if (
+                predicates is None
+                or not isinstance(query, BaseRelation)
+                or predicate_key(query.predicate) in predicates
+            ):
+                rebuild.append(index)
+
+        return DatasetSource(samples, self.dataset_builder, self.settings, self.learnable_facts), rebuild
+
+    def dataset(self, indices: list[int] | None = None) -> datasets.Dataset:
+        """Returns the dataset of samples with the passed indices (all samples if None)."""
+        if indices is None:
+            return datasets.Dataset(list(self.samples))
+        return datasets.Dataset([self.samples[index] for index in indices])
@@ -0,0 +1,316 @@
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from neuralogic.core.grounding.explain import RuleProfile
+from neuralogic.exceptions import GroundingLimitError
+
+POLICIES = ("skip", "flag", "raise")
+
+
+@dataclass
+class GroundingLimits:
+    """
+    Limits of the grounding cost. Per-sample limits are checked for every grounded example (with all its queries),
+    and the example is skipped, flagged, or an error is raised, according to the policy. Per-dataset limits abort the
+    grounding of the remaining examples once exceeded.
+
+    Examples are first grounded one by one in a worker process running its own JVM, which only measures them. A worker
+    grounding an example for too long, or running out of memory, is killed - which releases the memory and the CPU of
+    the grounding - and restarted from the next example. Only examples within the limits (and flagged examples) are
+    then grounded in this process, so a sample that blows up cannot take this process down.
+
+    Attributes
+    ----------
+    max_atoms : int, optional
+        The maximum number of ground atoms of one example. Default: None (no limit).
+    max_rule_groundings : int, optional
+        The maximum number of groundings of one rule in one example. Default: None (no limit).
+    max_time : float, optional
+        The maximum time (in seconds) of grounding one example. Default: None (no limit).
+    max_memory : int, optional
+        The maximum heap size (in gigabytes) of the worker JVM. An example the worker runs out of memory grounding
+        exceeds this limit. Default: None (the heap size of this process' JVM, see
+        :func:`~neuralogic.setup.set_max_memory_size`).
+    max_total_atoms : int, optional
+        The maximum number of ground atoms of all examples. Default: None (no limit).
+    max_total_time : float, optional
+        The maximum time (in seconds) of grounding all examples. Default: None (no limit).
+    policy : str
+        What to do with an example exceeding a per-sample limit - ``"skip"`` it, ``"flag"`` it (keep it in the
+        dataset and report it), or ``"raise"`` a :class:`~neuralogic.exceptions.GroundingLimitError`. Examples that
+        timed out or ran out of memory are never kept. When a per-dataset limit is exceeded, ``"raise"`` raises the
+        error and other policies return the examples grounded so far. Default: ``"skip"``.
+    """
+
+    max_atoms: int | None = None
+    max_rule_groundings: int | None = None
+    max_time: float | None = None
+    max_memory: int | None = None
+    max_total_atoms: int | None = None
+    max_total_time: float | None = None
+    policy: str = "skip"
+
+    def __post_init__(self):
+        if self.policy not in POLICIES:
+            raise ValueError(f"Unknown grounding limit policy {self.policy!r}, expected one of {POLICIES}")
+
+
+@dataclass
+class LimitViolation:
+    """
+    One exceeded grounding limit.
+
+    Attributes
+    ----------
+    sample : int
+        The index of the example (in the order of its first occurrence in the dataset).
+    limit : str
+        The name of the exceeded limit (an attribute of :class:`GroundingLimits`).
+    value : float
+        The measured value (infinite if the grounding worker ran out of memory).
+    bound : float
+        The value of the limit.
+    rules : list[RuleProfile]
+        The rules with the most groundings (counted by the backend) in the example.
+    """
+
+    sample: int
+    limit: str
+    value: float
+    bound: float
+    rules: list[RuleProfile] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        rules = "".join(f"\n    {rule.groundings} groundings of {rule.rule}" for rule in self.rules)
+
+        if math.isinf(self.value):
+            return f"Sample {self.sample} exceeded {self.limit} (the grounding worker ran out of memory){rules}"
+        return f"Sample {self.sample} exceeded {self.limit} ({self.value:g} > {self.bound:g}){rules}"
+
+
+@dataclass
+class GroundingDiagnostics:
+    """
+    The diagnostics of grounding with limits.
+
+    Attributes
+    ----------
+    violations : list[LimitViolation]
+        The exceeded limits.
+    skipped : list[int]
+        The indices of skipped examples.
+    flagged : list[int]
+        The indices of flagged (kept) examples.
+    aborted : bool
+        Whether grounding was aborted by a per-dataset limit.
+    grounded : int
+        The number of grounded examples (including skipped examples).
+    atoms : int
+        The total number of ground atoms.
+    time : float
+        The total time (in seconds) spent grounding.
+    """
+
+    violations: list[LimitViolation] = field(default_factory=list)
+    skipped: list[int] = field(default_factory=list)
+    flagged: list[int] = field(default_factory=list)
+    aborted: bool = False
+    grounded: int = 0
+    atoms: int = 0
+    time: float = 0.0
+
+    def __str__(self) -> str:
+        lines = [
+            f"Grounded {self.grounded} samples ({self.atoms} atoms, {self.time:.2f} s), skipped {len(self.skipped)}, "
+            f"flagged {len(self.flagged)}{', aborted' if self.aborted else ''}"
+        ]
+        lines.extend(str(violation) for violation in self.violations)
+        return "\n".join(lines)
+
+
+@dataclass
+class GroundingMeasurement:
+    """
+    The measured cost of grounding one example.
+
+    Attributes
+    ----------
+    atoms : int
+        The number of ground atoms.
+    rule_groundings : dict[str, int]
+        The number of groundings of each rule (by the rule string).
+    time : float
+        The time (in seconds) of grounding.
+    """
+
+    atoms: int
+    rule_groundings: dict[str, int]
+    time: float
+
+
+class MeasurementStream(Protocol):
+    """
+    Measurements of examples grounded one by one (see :class:`~neuralogic.core.builder.parallel.GroundingWorker`).
+    """
+
+    def next(self, timeout: float | None) -> GroundingMeasurement:
+        """Returns the measurement of the next example. Raises ``StopIteration`` if all examples are measured,
+        ``TimeoutError`` if the example is not grounded within the timeout, and ``MemoryError`` if grounding of the
+        example runs out of memory - the example is then dropped and the next call continues with the next example."""
+        ...
+
+    def close(self) -> None:
+        """Stops grounding of the remaining examples."""
+        ...
+
+
+def measure_groundings(groundings: Iterable[Any], time: float) -> GroundingMeasurement:
+    """
+    Measures the groundings of one example from sizes of the backend collections.
+
+    Parameters
+    ----------
+    groundings : Iterable[Any]
+        The groundings (:class:`~neuralogic.core.builder.components.Grounding`) of the example.
+    time : float
+        The time (in seconds) of grounding.
+
+    Returns
+    -------
+    GroundingMeasurement
+        The measurement.
+    """
+    atoms = 0
+    rule_groundings: dict[str, int] = {}
+
+    for grounding in groundings:
+        atoms += grounding.atom_count
+
+        for rule, count in grounding.rule_groundings().items():
+            rule_groundings[rule] = rule_groundings.get(rule, 0) + count
+    return GroundingMeasurement(atoms, rule_groundings, time)
+
+
+def apply_limits(
+    measurements: MeasurementStream, limits: GroundingLimits, top_rules: int = 3
+) -> tuple[list[int], GroundingDiagnostics]:
+    """
+    Checks the measurements of grounded examples against the limits. Measurements are pulled one by one, so
+    grounding of the remaining examples is not requested once a per-dataset limit is exceeded, and every example is
+    waited for at most the time remaining to the time limits.
+
+    Parameters
+    ----------
+    measurements : MeasurementStream
+        The measurements of the examples in the order of grounding.
+    limits : GroundingLimits
+        The limits.
+    top_rules : int
+        The number of rules with the most groundings reported per violation. Default: 3.
+
+    Returns
+    -------
+    tuple[list[int], GroundingDiagnostics]
+        The indices of the kept examples and the diagnostics.
+    """
+    diagnostics = GroundingDiagnostics()
+    kept = []
+
+    try:
+        while True:
+            index = diagnostics.grounded
+            timeout = _timeout(limits, diagnostics.time)
+
+            try:
+                measurement = measurements.next(timeout)
+            except StopIteration:
+                break
+            except (TimeoutError, MemoryError) as error:
+                diagnostics.grounded += 1
+                diagnostics.skipped.append(index)
+
+                if isinstance(error, MemoryError):
+                    bound = limits.max_memory if limits.max_memory is not None else math.inf
+                    diagnostics.violations.append(LimitViolation(index, "max_memory", math.inf, bound))
+                elif limits.max_time is not None and timeout == limits.max_time:
+                    diagnostics.time += timeout
+                    diagnostics.violations.append(LimitViolation(index, "max_time", timeout, limits.max_time))
+                else:
+                    diagnostics.time += timeout
+                    diagnostics.aborted = True
+                    diagnostics.violations.append(
+                        LimitViolation(index, "max_total_time", diagnostics.time, limits.max_total_time)
+                    )
+
+                if limits.policy == "raise":
+                    raise GroundingLimitError(str(diagnostics), diagnostics) from None
+                if diagnostics.aborted:
+                    break
+                continue
+
+            diagnostics.grounded += 1
+            diagnostics.atoms += measurement.atoms
+            diagnostics.time += measurement.time
+
+            measured = [
+                ("max_atoms", measurement.atoms, limits.max_atoms),
+                (
+                    "max_rule_groundings",
+                    max(measurement.rule_groundings.values(), default=0),
+                    limits.max_rule_groundings,
+                ),
+                ("max_time", measurement.time, limits.max_time),
+            ]
+            violations = [
+                LimitViolation(index, name, value, bound) for name, value, bound in measured if _exceeds(value, bound)
+            ]
+
+            if len(violations) == 0:
+                kept.append(index)
+            else:
+                top = sorted(measurement.rule_groundings.items(), key=lambda item: item[1], reverse=True)[:top_rules]
+                for violation in violations:
+                    violation.rules = [RuleProfile(rule, groundings=count) for rule, count in top]
+                diagnostics.violations.extend(violations)
+
+                if limits.policy == "raise":
+                    raise GroundingLimitError(str(diagnostics), diagnostics)
+
+                if limits.policy == "skip":
+                    diagnostics.skipped.append(index)
+                else:
+                    diagnostics.flagged.append(index)
+                    kept.append(index)
+
+            totals = [
+                ("max_total_atoms", diagnostics.atoms, limits.max_total_atoms),
+                ("max_total_time", diagnostics.time, limits.max_total_time),
+            ]
+            exceeded = [
+                LimitViolation(index, name, value, bound) for name, value, bound in totals if _exceeds(value, bound)
+            ]
+
+            if len(exceeded) != 0:
+                diagnostics.violations.extend(exceeded)
+                diagnostics.aborted = True
+
+                if limits.policy == "raise":
+                    raise GroundingLimitError(str(diagnostics), diagnostics)
+                break
+    finally:
+        measurements.close()
+    return kept, diagnostics
+
+
+def _timeout(limits: GroundingLimits, elapsed: float) -> float | None:
+    timeouts = [limits.max_time]
+
+    if limits.max_total_time is not None:
+        timeouts.append(max(0.0, limits.max_total_time - elapsed))
+    return min((timeout for timeout in timeouts if timeout is not None), default=None)
+
+
+def _exceeds(value: float, bound: float | None) -> bool:
+    return bound is not None and value > bound
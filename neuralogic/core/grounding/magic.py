@@ -0,0 +1,144 @@
+from collections.abc import Iterable
+from typing import Any
+
+from neuralogic.core.constructs.factories import R
+from neuralogic.core.constructs.function import FContainer
+from neuralogic.core.constructs.relation import BaseRelation
+from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.constructs.term import is_variable
+from neuralogic.core.grounding.dependency import PredicateKey, predicate_key
+
+MAGIC_PREFIX = "magic__"
+
+
+def adornment(terms: Iterable[Any], bound: set[str]) -> str:
+    """
+    Returns the adornment of the terms - ``b`` for each bound term (a constant or a bound variable) and ``f`` for each
+    free variable.
+
+    Parameters
+    ----------
+    terms : Iterable[Any]
+        The terms.
+    bound : set[str]
+        The names of bound variables.
+
+    Returns
+    -------
+    str
+        The adornment.
+    """
+    return "".join("f" if is_variable(term) and str(term) not in bound else "b" for term in terms)
+
+
+def magic_relation(predicate: PredicateKey, adorned: str, terms: list[Any]) -> BaseRelation:
+    """
+    Returns the magic relation of the adorned predicate over its bound terms.
+
+    Parameters
+    ----------
+    predicate : PredicateKey
+        The adorned predicate.
+    adorned : str
+        The adornment of the predicate.
+    terms : list[Any]
+        The terms of the predicate.
+
+    Returns
+    -------
+    BaseRelation
+        The magic relation.
+    """
+    name, arity = predicate
+    relation = R.get(f"{MAGIC_PREFIX}{name}_{arity}_{adorned}")
+    bound_terms = [term for term, mark in zip(terms, adorned) if mark == "b"]
+
+    if len(bound_terms) == 0:
+        return relation
+    return relation(bound_terms)
+
+
+def _plain(relation: BaseRelation) -> BaseRelation:
+    return BaseRelation(relation.predicate, relation.terms, None, relation.negated)
+
+
+def _is_derived(relation: BaseRelation, derived: set[PredicateKey]) -> bool:
+    return not relation.predicate.special and predicate_key(relation.predicate) in derived
+
+
+def magic_sets(entries: Iterable[Any], query: BaseRelation) -> list[Any] | None:
+    """
+    Rewrites the template entries for the goal-directed evaluation of the query (the magic sets transformation).
+
+    Each rule deriving a predicate reachable from the query is guarded by a magic relation collecting the bindings
+    the predicate is queried with, and magic rules propagate the bindings from rule heads to derived body relations
+    (left to right). The bottom-up grounding of the rewritten template then derives only the facts relevant to the
+    query. Predicates keep their names, so the query can be answered from the rewritten template as is. Weights,
+    functions, and metadata of rules are dropped, as the rewritten template is meant for logical queries only.
+
+    Parameters
+    ----------
+    entries : Iterable[Any]
+        The template entries (rules, facts, and predicate metadata).
+    query : BaseRelation
+        The query.
+
+    Returns
+    -------
+    list[Any] | None
+        The rewritten entries, or None if the template cannot be rewritten for the query - the query has no bound
+        terms, the query predicate is not derived by any rule, or a rule body contains a function or a negated
+        derived relation.
+    """
+    entries = list(entries)
+    rules = [entry for entry in entries if isinstance(entry, Rule)]
+
+    if any(isinstance(rule.body, FContainer) or rule._contains_function_container() for rule in rules):
+        return None
+
+    rules_by_head: dict[PredicateKey, list[Rule]] = {}
+    for rule in rules:
+        rules_by_head.setdefault(predicate_key(rule.head.predicate), []).append(rule)
+    derived = set(rules_by_head.keys())
+
+    query_key = predicate_key(query.predicate)
+    query_adornment = adornment(query.terms, set())
+
+    if query_key not in derived or "b" not in query_adornment:
+        return None
+
+    rewritten: list[Any] = [entry for entry in entries if not isinstance(entry, Rule)]
+    rewritten.append(magic_relation(query_key, query_adornment, query.terms))
+
+    pending = [(query_key, query_adornment)]
+    adorned = set(pending)
+
+    while pending:
+        head_key, head_adornment = pending.pop()
+
+        for rule in rules_by_head[head_key]:
+            head_terms = rule.head.terms
+            guard = magic_relation(head_key, head_adornment, head_terms)
+            bound = {str(term) for term, mark in zip(head_terms, head_adornment) if mark == "b"}
+
+            prefix = [guard]
+            for literal in rule.body:
+                if _is_derived(literal, derived):
+                    if literal.negated:
+                        return None
+
+                    literal_key = predicate_key(literal.predicate)
+                    literal_adornment = adornment(literal.terms, bound)
+
+                    rewritten.append(magic_relation(literal_key, literal_adornment, literal.terms) <= list(prefix))
+
+                    if (literal_key, literal_adornment) not in adorned:
+                        adorned.add((literal_key, literal_adornment))
+                        pending.append((literal_key, literal_adornment))
+
+                prefix.append(_plain(literal))
+                if not literal.negated and not literal.predicate.special:
+                    bound.update(str(term) for term in literal.terms if is_variable(term))
+
+            rewritten.append(_plain(rule.head) <= prefix)
+    return rewritten
@@ -0,0 +1,238 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from neuralogic.core.constructs.function import FContainer
+from neuralogic.core.constructs.relation import BaseRelation, TensorRelation
+from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.constructs.term import is_variable
+from neuralogic.core.grounding.dependency import PredicateKey, predicate_key
+
+ORDER_INSENSITIVE_COMBINATIONS = frozenset({"AVG", "MAX", "MIN", "SUM", "COUNT", "ELPRODUCT"})
+
+
+@dataclass
+class FactStatistics:
+    """
+    Statistics of facts per example - the mean number of facts of each predicate (the cardinality) and the mean number
+    of distinct terms at each argument position (used to estimate the selectivity of bound arguments).
+
+    Attributes
+    ----------
+    cardinality : dict[PredicateKey, float]
+        The mean number of facts of each predicate per example.
+    distinct : dict[tuple[PredicateKey, int], float]
+        The mean number of distinct terms at each argument position of each predicate per example.
+    """
+
+    cardinality: dict[PredicateKey, float] = field(default_factory=dict)
+    distinct: dict[tuple[PredicateKey, int], float] = field(default_factory=dict)
+
+    @staticmethod
+    def from_examples(examples: Iterable[Iterable[Any]], facts: Iterable[Any] = ()) -> "FactStatistics":
+        """Gathers the statistics from examples.
+
+        Parameters
+        ----------
+        examples : Iterable[Iterable[Any]]
+            The examples (lists of relations or tensor relations; other entries are skipped).
+        facts : Iterable[Any]
+            The facts shared by all examples (e.g., facts of the template). Default: ().
+
+        Returns
+        -------
+        FactStatistics
+            The statistics.
+        """
+        facts = list(facts)
+        statistics = FactStatistics()
+        count = 0
+
+        for example in examples:
+            count += 1
+            terms: dict[PredicateKey, list[np.ndarray]] = {}
+
+            for fact in [*facts, *example]:
+                if isinstance(fact, TensorRelation):
+                    terms.setdefault(predicate_key(fact.predicate), []).append(np.asarray(fact.terms).astype(str))
+                elif isinstance(fact, BaseRelation):
+                    column = np.array([str(term) for term in fact.terms], dtype=str).reshape(-1, 1)
+                    terms.setdefault(predicate_key(fact.predicate), []).append(column)
+
+            for key, columns in terms.items():
+                stacked = np.concatenate(columns, axis=1)
+                statistics.cardinality[key] = statistics.cardinality.get(key, 0.0) + stacked.shape[1]
+
+                for position in range(stacked.shape[0]):
+                    distinct = len(np.unique(stacked[position]))
+                    statistics.distinct[(key, position)] = statistics.distinct.get((key, position), 0.0) + distinct
+
+        if count != 0:
+            statistics.cardinality = {key: value / count for key, value in statistics.cardinality.items()}
+            statistics.distinct = {key: value / count for key, value in statistics.distinct.items()}
+        return statistics
+
+    def estimate(self, relation: BaseRelation, bound: set[str]) -> float:
+        """Estimates the number of facts of the relation matching one substitution of the bound variables.
+
+        Predicates without facts (derived predicates) are estimated as large as the largest known predicate.
+
+        Parameters
+        ----------
+        relation : BaseRelation
+            The relation.
+        bound : set[str]
+            The names of bound variables.
+
+        Returns
+        -------
+        float
+            The estimated number of matching facts.
+        """
+        key = predicate_key(relation.predicate)
+        default = max(self.cardinality.values(), default=1.0)
+        cardinality = self.cardinality.get(key, default)
+
+        estimate = cardinality
+        for position, term in enumerate(relation.terms):
+            if not is_variable(term) or str(term) in bound:
+                estimate /= max(1.0, self.distinct.get((key, position), cardinality))
+        return max(estimate, min(1.0, cardinality))
+
+
+def _is_barrier(relation: Any) -> bool:
+    return not isinstance(relation, BaseRelation) or relation.predicate.special or relation.negated
+
+
+def _variables(relation: BaseRelation) -> set[str]:
+    return {str(term) for term in relation.terms if term is not Ellipsis and is_variable(term)}
+
+
+def is_order_insensitive(combination: Any) -> bool:
+    """
+    Returns whether the combination of body inputs does not depend on their order.
+
+    Parameters
+    ----------
+    combination : Any
+        The combination function (or its name).
+
+    Returns
+    -------
+    bool
+        Whether the combination is order-insensitive.
+    """
+    return str(combination).upper() in ORDER_INSENSITIVE_COMBINATIONS
+
+
+def can_reorder(rule: Rule, default_combination: Any = "SUM") -> bool:
+    """
+    Returns whether the body of the rule can be reordered without changing the semantics of the rule - the body is
+    not a function container and the effective combination of body inputs does not depend on their order.
+
+    Parameters
+    ----------
+    rule : Rule
+        The rule.
+    default_combination : Any
+        The combination of rules without their own combination (``Settings.rule_combination``). Default: ``"SUM"``.
+
+    Returns
+    -------
+    bool
+        Whether the body can be reordered.
+    """
+    if isinstance(rule.body, FContainer) or rule._contains_function_container():
+        return False
+
+    combination = rule.metadata.combination if rule.metadata is not None else None
+    return is_order_insensitive(default_combination if combination is None else combination)
+
+
+def plan_body(body: list[Any], statistics: FactStatistics) -> list[Any]:
+    """
+    Orders the body relations greedily - the next relation is the one with the fewest estimated matching facts given
+    the variables bound by the previous relations. Special and negated relations are barriers - relations are
+    reordered only between them, so special relations (e.g., ``alldiff`` or ``next``) keep their positions relative to
+    other relations.
+
+    Parameters
+    ----------
+    body : list[Any]
+        The body relations.
+    statistics : FactStatistics
+        The statistics of facts.
+
+    Returns
+    -------
+    list[Any]
+        The reordered body.
+    """
+    planned: list[Any] = []
+    bound: set[str] = set()
+    segment: list[Any] = []
+
+    def flush():
+        while segment:
+            best = min(range(len(segment)), key=lambda i: (statistics.estimate(segment[i], bound), i))
+            relation = segment.pop(best)
+
+            planned.append(relation)
+            bound.update(_variables(relation))
+
+    for relation in body:
+        if _is_barrier(relation):
+            flush()
+            planned.append(relation)
+
+            if isinstance(relation, BaseRelation):
+                bound.update(_variables(relation))
+        else:
+            segment.append(relation)
+    flush()
+
+    return planned
+
+
+def plan_joins(
+    entries: Iterable[Any], statistics: FactStatistics, default_combination: Any = "SUM"
+) -> tuple[list[Any], list[tuple[Rule, Rule]]]:
+    """
+    Reorders bodies of rules to reduce intermediate substitutions of the grounding joins (see :func:`plan_body`).
+    Rules whose bodies cannot be reordered (see :func:`can_reorder`) are kept as they are.
+
+    Parameters
+    ----------
+    entries : Iterable[Any]
+        The template entries.
+    statistics : FactStatistics
+        The statistics of facts.
+    default_combination : Any
+        The combination of rules without their own combination (``Settings.rule_combination``). Default: ``"SUM"``.
+
+    Returns
+    -------
+    tuple[list[Any], list[tuple[Rule, Rule]]]
+        The entries with reordered rules and the pairs of original and reordered rules.
+    """
+    planned_entries, changes = [], []
+
+    for entry in entries:
+        if not isinstance(entry, Rule) or not can_reorder(entry, default_combination):
+            planned_entries.append(entry)
+            continue
+
+        body = plan_body(entry.body, statistics)
+
+        if all(a is b for a, b in zip(body, entry.body)):
+            planned_entries.append(entry)
+            continue
+
+        rule = Rule(entry.head, body)
+        rule.metadata = entry.metadata
+
+        planned_entries.append(rule)
+        changes.append((entry, rule))
+    return planned_entries, changes
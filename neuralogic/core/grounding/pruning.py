@@ -0,0 +1,80 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from neuralogic.core.constructs.predicate import PredicateMetadata
+from neuralogic.core.constructs.relation import BaseRelation
+from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.grounding.dependency import DependencyGraph, PredicateKey, predicate_key
+
+
+@dataclass
+class PruningReport:
+    """
+    The result of pruning a template.
+
+    Attributes
+    ----------
+    predicates : set[PredicateKey]
+        The predicates the queries (transitively) depend on.
+    removed : list[Any]
+        The removed template entries (rules, facts, and predicate metadata).
+    kept : int
+        The number of kept template entries.
+    """
+
+    predicates: set[PredicateKey] = field(default_factory=set)
+    removed: list[Any] = field(default_factory=list)
+    kept: int = 0
+
+    def __str__(self) -> str:
+        lines = [f"Removed {len(self.removed)} of {len(self.removed) + self.kept} template entries"]
+        lines.extend(f"    {entry}" for entry in self.removed)
+        return "\n".join(lines)
+
+
+def _entry_predicate(entry: Any) -> PredicateKey | None:
+    if isinstance(entry, Rule):
+        return predicate_key(entry.head.predicate)
+    if isinstance(entry, BaseRelation):
+        return predicate_key(entry.predicate)
+    if isinstance(entry, PredicateMetadata):
+        return predicate_key(entry.predicate)
+    return None
+
+
+def prune_entries(
+    entries: Iterable[Any], queries: Iterable[BaseRelation], examples: Iterable[Any] = ()
+) -> tuple[list[Any], PruningReport]:
+    """
+    Removes template entries that cannot contribute to the predicates of the queries - rules, facts, and predicate
+    metadata of predicates the queries do not (transitively) depend on.
+
+    Parameters
+    ----------
+    entries : Iterable[Any]
+        The template entries.
+    queries : Iterable[BaseRelation]
+        The queries.
+    examples : Iterable[Any]
+        The entries of examples. Rules in examples introduce dependencies on template predicates. Default: ().
+
+    Returns
+    -------
+    tuple[list[Any], PruningReport]
+        The kept entries and the report of the pruning.
+    """
+    entries = list(entries)
+    graph = DependencyGraph([*entries, *examples])
+    required = graph.required_by(predicate_key(query.predicate) for query in queries)
+
+    kept, removed = [], []
+
+    for entry in entries:
+        key = _entry_predicate(entry)
+
+        if key is None or key in required:
+            kept.append(entry)
+        else:
+            removed.append(entry)
+    return kept, PruningReport(required, removed, len(kept))
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from neuralogic.core.builder import DatasetBuilder
+from neuralogic.core.constructs.factories import R
+from neuralogic.core.constructs.java_objects import JavaFactory
+from neuralogic.core.constructs.relation import BaseRelation
+from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.constructs.term import is_variable
+from neuralogic.core.grounding.dependency import DependencyGraph, PredicateKey
+from neuralogic.core.grounding.explain import grounding_facts
+from neuralogic.core.grounding.incremental import apply_fact_changes, fact_key
+from neuralogic.core.settings import Settings
+from neuralogic.dataset import Dataset
+
+if TYPE_CHECKING:
+    from neuralogic.core.builder import GroundedDataset
+    from neuralogic.core.model import Model
+
+Substitutions = tuple[str, ...]
+
+
+def match_substitutions(terms: tuple[str, ...], substitutions: Substitutions) -> dict[str, str] | None:
+    """
+    Matches the terms of a query against the substitutions of a grounded atom.
+
+    Parameters
+    ----------
+    terms : tuple[str, ...]
+        The terms of the query.
+    substitutions : Substitutions
+        The terms of the grounded atom.
+
+    Returns
+    -------
+    dict[str, str] | None
+        The substitutions of the query variables, or None if the atom does not match the query.
+    """
+    literal_subs: dict[str, str] = {}
+
+    for term, sub in zip(terms, substitutions):
+        if is_variable(term):
+            if literal_subs.setdefault(term, sub) != sub:
+                return None
+        elif term != sub:
+            return None
+    return literal_subs
+
+
+class InferenceSession:
+    """
+    InferenceSession answers repeated queries of the model against one set of examples (a knowledge base). The
+    examples are grounded once into the least model, whose atoms are indexed by predicates and, on demand, by terms
+    at bound argument positions. Query results are memoized in an LRU cache.
+
+    Adding or removing facts regrounds the examples on the next query and evicts only memoized results of predicates
+    that depend on the changed predicates.
+    """
+
+    def __init__(self, model: Model, examples: list[BaseRelation | Rule] | None = None, *, cache_size: int = 1024):
+        """
+        Parameters
+        ----------
+        model : Model
+            The model to query.
+        examples : list[BaseRelation | Rule], optional
+            The examples (the knowledge base) to query. Default: None.
+        cache_size : int
+            The maximum number of memoized query results. Default: 1024.
+        """
+        if cache_size < 0:
+            raise ValueError(f"Cache size has to be non-negative, got {cache_size}")
+
+        self.model = model
+        self.cache_size = cache_size
+
+        self._examples: list[Any] = list(examples) if examples is not None else []
+        self._settings = Settings(iso_value_compression=False, chain_pruning=False).create_disconnected_proxy()
+        self._java_factory = JavaFactory()
+        self._dataset_builder = DatasetBuilder(
+            model._get_parsed_model(self._settings, self._java_factory), self._java_factory
+        )
+        self._graph = DependencyGraph(model._model) if model._model_file is None else None
+
+        self._atoms: dict[PredicateKey, list[Substitutions]] | None = None
+        self._term_index: dict[tuple[PredicateKey, int], dict[str, list[Substitutions]]] = {}
+        self._memo: OrderedDict[tuple[PredicateKey, tuple[str, ...]], list[dict[str, str]]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.groundings = 0
+
+    @property
+    def examples(self) -> list[Any]:
+        """The current examples (the knowledge base)."""
+        return self._examples
+
+    @property
+    def atoms(self) -> dict[PredicateKey, list[tuple[str, ...]]]:
+        """The atoms of the least model of the current examples - the substitutions of each predicate."""
+        return self._get_atoms()
+
+    def query(self, query: BaseRelation) -> list[dict] | dict:
+        """Performs the query against the current examples.
+
+        Parameters
+        ----------
+        query : BaseRelation
+            The query to perform.
+
+        Returns
+        -------
+        list[dict] | dict
+            The list of query results (substitutions), or an empty dict if there are none (the same as
+            :meth:`Model.query`).
+        """
+        key = fact_key(query)
+        results = self._memo.get(key)
+
+        if results is not None:
+            self._memo.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            results = self._evaluate(key)
+
+            if self.cache_size != 0:
+                self._memo[key] = results
+                if len(self._memo) > self.cache_size:
+                    self._memo.popitem(last=False)
+
+        if not results:
+            return {}
+        return [dict(result) for result in results]
+
+    def q(self, query: BaseRelation) -> list[dict] | dict:
+        return self.query(query)
+
+    def derivable_queries(self) -> list[BaseRelation] | dict:
+        """Returns all derivable queries for the current examples.
+
+        Returns
+        -------
+        list[BaseRelation] | dict
+            The list of derivable queries, or an empty dict if there are none (the same as
+            :meth:`Model.derivable_queries`).
+        """
+        results = [R.get(name)(subs) for (name, _), atoms in self._get_atoms().items() for subs in atoms]
+
+        if not results:
+            return {}
+        return results
+
+    def add_facts(self, facts: Iterable[BaseRelation | Rule]) -> None:
+        """Adds facts (or other example entries) to the examples.
+
+        Parameters
+        ----------
+        facts : Iterable[BaseRelation | Rule]
+            The facts to add.
+        """
+        self._update(list(facts), [])
+
+    def remove_facts(self, facts: Iterable[BaseRelation]) -> None:
+        """Removes facts from the examples, regardless of their values.
+
+        Parameters
+        ----------
+        facts : Iterable[BaseRelation]
+            The facts to remove.
+        """
+        self._update([], list(facts))
+
+    def clear_cache(self) -> None:
+        """Clears memoized query results."""
+        self._memo.clear()
+
+    def _update(self, added_facts: list[Any], removed_facts: list[Any]) -> None:
+        examples, changed = apply_fact_changes(self._examples, added_facts, removed_facts)
+
+        if changed is not None and len(changed) == 0:
+            return
+
+        self._examples = examples
+        self._atoms = None
+        self._term_index = {}
+
+        if changed is None or self._graph is None:
+            self._memo.clear()
+            return
+
+        affected = self._graph.reachable_from(changed)
+        for key in [key for key in self._memo if key[0] in affected]:
+            del self._memo[key]
+
+    def ground(self) -> dict[PredicateKey, list[Substitutions]]:
+        """Grounds the current examples (if they are not grounded yet) and returns the atoms of the least model.
+        Unlike :attr:`atoms`, errors of the grounding are raised.
+
+        Returns
+        -------
+        dict[PredicateKey, list[tuple[str, ...]]]
+            The substitutions of each predicate.
+        """
+        return self._get_atoms(strict=True)
+
+    def ground_samples(self) -> GroundedDataset:
+        """Grounds the current examples by the backend and returns the grounded samples (e.g., to count the ground
+        rules), without caching them. Errors of the grounding are raised.
+
+        Returns
+        -------
+        GroundedDataset
+            The grounded samples.
+        """
+        self.groundings += 1
+        return self._dataset_builder.ground_dataset(Dataset().add(None, self._examples), self._settings)
+
+    def _get_atoms(self, strict: bool = False) -> dict[PredicateKey, list[Substitutions]]:
+        if self._atoms is not None:
+            return self._atoms
+
+        try:
+            atoms = grounding_facts(self.ground_samples())
+        except Exception:
+            if strict:
+                raise
+            atoms = {}
+
+        self._atoms = atoms
+        return atoms
+
+    def _candidates(self, predicate: PredicateKey, terms: tuple[str, ...]) -> list[Substitutions]:
+        atoms = self._get_atoms().get(predicate, [])
+        candidates = atoms
+
+        for position, term in enumerate(terms):
+            if is_variable(term):
+                continue
+
+            index = self._term_index.get((predicate, position))
+            if index is None:
+                index = {}
+                for subs in atoms:
+                    index.setdefault(subs[position], []).append(subs)
+                self._term_index[(predicate, position)] = index
+
+            bound = index.get(term, [])
+            if len(bound) < len(candidates):
+                candidates = bound
+        return candidates
+
+    def _evaluate(self, key: tuple[PredicateKey, tuple[str, ...]]) -> list[dict[str, str]]:
+        predicate, terms = key
+        results = []
+
+        for subs in self._candidates(predicate, terms):
+            substitutions = match_substitutions(terms, subs)
+            if substitutions is not None:
+                results.append(substitutions)
+        return results
@@ -1,19 +1,34 @@
+import hashlib
 import pickle
+import time
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import jpype
 
-from neuralogic.core.builder import Builder, DatasetBuilder
+from neuralogic.core.builder import Builder, DatasetBuilder, TemplateCache
+from neuralogic.core.builder.dataset_builder import samples_to_examples_and_queries
 from neuralogic.core.constructs.factories import R
 from neuralogic.core.constructs.java_objects import JavaFactory
 from neuralogic.core.constructs.predicate import PredicateMetadata
 from neuralogic.core.constructs.relation import BaseRelation, WeightedRelation
 from neuralogic.core.constructs.rule import Rule
+from neuralogic.core.grounding import (
+    FactStatistics,
+    GroundingReport,
+    PruningReport,
+    magic_sets,
+    plan_joins,
+    profile_rules,
+    prune_entries,
+)
+from neuralogic.core.grounding.explain import grounding_facts
+from neuralogic.core.grounding.planner import is_order_insensitive
+from neuralogic.core.inference import InferenceSession
 from neuralogic.core.neural_module import NeuralModule
 from neuralogic.core.settings import Settings, SettingsProxy
-from neuralogic.dataset import Dataset
+from neuralogic.dataset import BaseDataset, ConvertibleDataset, Dataset, TensorDataset
 from neuralogic.exceptions import ModelError
 from neuralogic.nn.module.module import Module
 from neuralogic.setup import initialize, is_initialized
@@ -26,16 +41,27 @@ class Model(NeuralModule):
     Model is a collection of rules and relations that define the structure of the neural model.
     """
 
-    def __init__(self, *, model_file: str | None = None):
+    def __init__(self, *, model_file: str | None = None, template_cache: str | Path | TemplateCache | None = None):
         """
         Parameters
         ----------
         model_file : str, optional
             Path to a model file to load. Default: None.
+        template_cache : str | Path | TemplateCache, optional
+            The directory (or the :py:class:`~neuralogic.core.builder.cache.TemplateCache`) with compiled templates
+            cached across processes. The compiled template is loaded from the cache instead of converting the rules
+            (or parsing the model file) when the model content and settings match. Default: None (no cache).
         """
         super().__init__()
         self._model: list[ModelEntries] = []
         self._model_file = model_file
+        self._template_cache = (
+            TemplateCache(template_cache)
+            if template_cache is not None and not isinstance(template_cache, TemplateCache)
+            else template_cache
+        )
+        self._build_settings: Settings | None = None
+        self._planned_combination: str | None = None
 
     def add_rule(self, rule: ModelEntries) -> None:
         """Adds one rule to the model.
@@ -85,14 +111,24 @@ class Model(NeuralModule):
         Model
             The built model (self).
         """
-        java_factory = JavaFactory()
+        if self._planned_combination is not None:
+            combination = (settings or Settings()).rule_combination
+
+            if not is_order_insensitive(combination):
+                raise ModelError(
+                    f"Bodies of rules were reordered by plan_joins for the {self._planned_combination} rule "
+                    f"combination, and cannot be built with the order-sensitive {combination} rule combination"
+                )
+
+        self._build_settings = settings
         settings_proxy = settings.create_proxy() if settings is not None else Settings().create_disconnected_proxy()
+        java_factory = JavaFactory(lean_build=settings_proxy.lean_build)
 
         parsed_model = self._get_parsed_model(settings_proxy, java_factory)
         neural_model = Builder(settings_proxy).build_model(parsed_model, settings_proxy)
 
         self._initialize_neural_module(
-            DatasetBuilder(parsed_model, java_factory),
+            DatasetBuilder(parsed_model, java_factory, self),
             settings_proxy,
             neural_model,
             torch,
@@ -119,6 +155,128 @@ class Model(NeuralModule):
             deduplicated_model.append(entry)
         self._model = deduplicated_model
 
+    def prune(self, dataset: BaseDataset | Iterable[BaseRelation]) -> PruningReport:
+        """Removes rules, facts, and predicate metadata of predicates the queries of the dataset do not (transitively)
+        depend on, according to the predicate dependency graph of the model. The pruned model grounds and neuralizes
+        only the part of the template relevant to the queries.
+
+        Parameters
+        ----------
+        dataset : BaseDataset | Iterable[BaseRelation]
+            The dataset whose queries are to be answered, or the queries.
+
+        Returns
+        -------
+        PruningReport
+            The report with the removed entries.
+        """
+        if self._neural_model is not None:
+            raise ModelError("Cannot modify built model")
+
+        if self._model_file is not None:
+            raise ModelError("Models loaded from a model file cannot be pruned")
+
+        if isinstance(dataset, ConvertibleDataset):
+            dataset = dataset.to_dataset()
+
+        examples: list[Any] = []
+
+        if isinstance(dataset, Dataset):
+            queries: list[Any] = [*dataset._queries]
+
+            for sample in dataset.samples:
+                queries.append(sample.query)
+                examples.extend(sample.example)
+            for example in dataset._examples:
+                examples.extend(example)
+        elif isinstance(dataset, BaseDataset):
+            raise NotImplementedError(f"Pruning is not supported for {type(dataset).__name__}")
+        else:
+            queries = list(dataset)
+
+        queries = [query for item in queries for query in (item if isinstance(item, list) else [item])]
+
+        if any(query is None for query in queries) or len(queries) == 0:
+            raise ValueError("The model can be pruned only for datasets where every sample has a query")
+
+        self._model, report = prune_entries(self._model, queries, examples)
+        self._parsed_model = None
+
+        return report
+
+    def plan_joins(
+        self, dataset: BaseDataset | list[BaseRelation | Rule], settings: Settings | None = None
+    ) -> list[tuple[Rule, Rule]]:
+        """Reorders bodies of rules so that the grounding joins produce fewer intermediate substitutions. The order is
+        planned greedily from the per-predicate cardinality and argument selectivity of facts in the examples of the
+        dataset (see :func:`neuralogic.core.grounding.planner.plan_body`). Special and negated relations keep their
+        positions, and rules whose combination of body inputs depends on their order are left as they are.
+
+        Rules without their own combination use the rule combination of the settings the model is built with, so the
+        settings have to be passed here too - the model cannot be built with an order-sensitive rule combination once
+        such rules are reordered.
+
+        Parameters
+        ----------
+        dataset : BaseDataset | list[BaseRelation | Rule]
+            The dataset (or one example) to gather the statistics of facts from.
+        settings : Settings, optional
+            The settings the model will be built with. Default: None (the default settings).
+
+        Returns
+        -------
+        list[tuple[Rule, Rule]]
+            The pairs of original and reordered rules.
+        """
+        if self._neural_model is not None:
+            raise ModelError("Cannot modify built model")
+
+        if self._model_file is not None:
+            raise ModelError("Joins of models loaded from a model file cannot be planned")
+
+        if isinstance(dataset, TensorDataset):
+            examples: Iterable[Any] = (example for _, example in dataset.tensor_forms())
+        elif isinstance(dataset, ConvertibleDataset):
+            examples = samples_to_examples_and_queries(dataset.to_dataset().samples)[0]
+        elif isinstance(dataset, Dataset):
+            examples = list(samples_to_examples_and_queries(dataset.samples)[0]) or dataset._examples
+        elif isinstance(dataset, BaseDataset):
+            raise NotImplementedError(f"Join planning is not supported for {type(dataset).__name__}")
+        else:
+            examples = [dataset]
+
+        statistics = FactStatistics.from_examples(
+            examples, [entry for entry in self._model if not isinstance(entry, Rule)]
+        )
+        combination = (settings or Settings()).rule_combination
+        self._model, changes = plan_joins(self._model, statistics, combination)
+
+        if len(changes) != 0:
+            self._parsed_model = None
+
+        if any(rule.metadata is None or rule.metadata.combination is None for rule, _ in changes):
+            self._planned_combination = str(combination)
+        return changes
+
+    def fingerprint(self) -> str:
+        """Returns a content hash of the model - of its rules, relations, and the model file.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest of the model content.
+        """
+        digest = hashlib.sha256()
+
+        if self._model_file is not None:
+            with open(self._model_file, "rb") as fp:
+                digest.update(fp.read())
+
+        for entry in self._model:
+            digest.update(str(entry).encode())
+            digest.update(b"\n")
+        return digest.hexdigest()
+
     def _get_parsed_model(self, settings: SettingsProxy, java_factory: JavaFactory) -> Any:
         if not is_initialized():
             initialize()
@@ -126,10 +284,27 @@ class Model(NeuralModule):
         if self._parsed_model is not None:
             return self._parsed_model
 
-        if self._model_file is not None:
-            self._parsed_model = Builder(settings).build_model_from_file(settings, self._model_file)
+        if self._template_cache is None:
+            self._parsed_model = self._compile_template(settings, java_factory)
             return self._parsed_model
 
+        key = self._template_cache.key(self.fingerprint(), settings)
+        parsed_model = self._template_cache.load(key)
+
+        if parsed_model is None:
+            parsed_model = self._compile_template(settings, java_factory)
+
+            # A template loaded from the cache has no rules to restore strings of, so it is stored with the strings
+            java_factory.restore_debug_strings()
+            self._template_cache.store(key, parsed_model)
+
+        self._parsed_model = parsed_model
+        return self._parsed_model
+
+    def _compile_template(self, settings: SettingsProxy, java_factory: JavaFactory) -> Any:
+        if self._model_file is not None:
+            return Builder(settings).build_model_from_file(settings, self._model_file)
+
         predicate_metadata = []
         weighted_rules = []
         valued_facts = []
@@ -138,7 +313,9 @@ class Model(NeuralModule):
             if isinstance(rule, PredicateMetadata):
                 predicate_metadata.append(java_factory.get_predicate_metadata_pair(rule))
             elif isinstance(rule, Rule):
-                weighted_rules.append(java_factory.get_rule(rule))
+                java_rule = java_factory.get_rule(rule)
+                java_factory.defer_debug_string(java_rule, rule)
+                weighted_rules.append(java_rule)
             elif isinstance(rule, (WeightedRelation, BaseRelation)):
                 valued_facts.append(java_factory.get_valued_fact(rule, java_factory.get_variable_factory()))
 
@@ -152,9 +329,7 @@ class Model(NeuralModule):
         metadata_processor = metadata_processor(settings.settings)
 
         metadata_processor.processMetadata(model)
-        self._parsed_model = model
-
-        return self._parsed_model
+        return model
 
     def derivable_queries(self, example: list[BaseRelation | Rule] | None = None) -> list[BaseRelation] | dict:
         """Returns all derivable queries for the provided example.
@@ -191,7 +366,9 @@ class Model(NeuralModule):
             return {}
         return results
 
-    def query(self, query: BaseRelation, examples: list[BaseRelation | Rule] | None = None) -> list[dict] | dict:
+    def query(
+        self, query: BaseRelation, examples: list[BaseRelation | Rule] | None = None, *, goal_directed: bool = False
+    ) -> list[dict] | dict:
         """Performs a query on the model with the provided examples.
 
         Parameters
@@ -200,12 +377,21 @@ class Model(NeuralModule):
             The query to perform.
         examples : list[BaseRelation | Rule], optional
             The examples to use for the query. Default: None.
+        goal_directed : bool
+            Whether to ground only the part of the model relevant to the bound terms of the query
+            (see :meth:`goal_directed`). Default: False.
 
         Returns
         -------
         list[dict] | dict
             The list of query results (substitutions).
         """
+        if goal_directed:
+            model = self.goal_directed(query)
+
+            if model is not self:
+                return model.query(query, examples)
+
         settings = Settings(iso_value_compression=False, chain_pruning=False).create_disconnected_proxy()
         java_factory = JavaFactory()
 
@@ -223,8 +409,152 @@ class Model(NeuralModule):
             return {}
         return results
 
-    def q(self, query: BaseRelation, examples: list[BaseRelation | Rule] | None = None) -> list[dict] | dict:
-        return self.query(query, examples)
+    def q(
+        self, query: BaseRelation, examples: list[BaseRelation | Rule] | None = None, *, goal_directed: bool = False
+    ) -> list[dict] | dict:
+        return self.query(query, examples, goal_directed=goal_directed)
+
+    def query_many(
+        self, queries: Iterable[BaseRelation], examples: list[BaseRelation | Rule] | None = None
+    ) -> list[list[dict] | dict]:
+        """Performs multiple queries on the model with the provided examples. The examples are grounded only once
+        and all queries are answered from the one grounding (see :class:`~neuralogic.core.inference.InferenceSession`).
+
+        Parameters
+        ----------
+        queries : Iterable[BaseRelation]
+            The queries to perform.
+        examples : list[BaseRelation | Rule], optional
+            The examples to use for the queries. Default: None.
+
+        Returns
+        -------
+        list[list[dict] | dict]
+            The results of the queries in the order of the queries (the same as results of :meth:`query`).
+        """
+        queries = list(queries)
+        session = InferenceSession(self, examples, cache_size=len(queries))
+
+        return [session.query(query) for query in queries]
+
+    def goal_directed(self, query: BaseRelation) -> "Model":
+        """Returns the model rewritten for the goal-directed evaluation of the query (the magic sets transformation).
+        Grounding of the rewritten model derives only facts relevant to the bound terms of the query, instead of the
+        full closure of all rules. The rewritten model is meant for logical queries only - it has no weights.
+
+        Parameters
+        ----------
+        query : BaseRelation
+            The query with bound terms (constants).
+
+        Returns
+        -------
+        Model
+            The rewritten model, or the model itself (self) if it cannot be rewritten for the query (see
+            :func:`neuralogic.core.grounding.magic_sets`).
+        """
+        if self._model_file is not None:
+            return self
+
+        entries = magic_sets(self._model, query)
+        if entries is None:
+            return self
+
+        model = Model(template_cache=self._template_cache)
+        model.add_rules(entries)
+        return model
+
+    def explain_grounding(
+        self,
+        dataset: Dataset | list[BaseRelation | Rule],
+        *,
+        sample_size: int = 10,
+        max_substitutions: int | None = 1_000_000,
+        max_time: float | None = 10.0,
+    ) -> GroundingReport:
+        """Profiles grounding of a sample of examples of the dataset - per rule, the number of body substitutions
+        tried, groundings produced, the peak number of partial substitutions, and the time spent joining the body -
+        and extrapolates the totals to the whole dataset.
+
+        Each profiled example is grounded by the backend, which counts the groundings of each rule. The backend does
+        not report its join work, so it is estimated by joining the bodies in Python over the least model of the
+        example, relation by relation in the order they are written. The Python join is aborted by the budget, so
+        profiling a template that blows up stays bounded - the profiles of aborted rules are marked as truncated.
+        Errors of grounding a profiled example are raised (a report of zero costs would be misleading).
+
+        Parameters
+        ----------
+        dataset : Dataset | list[BaseRelation | Rule]
+            The dataset (or one example) to profile.
+        sample_size : int
+            The maximum number of (evenly spaced) examples to profile. Default: 10.
+        max_substitutions : int, optional
+            The budget of substitutions tried by the Python join of one rule in one example. Default: 1000000.
+        max_time : float, optional
+            The time budget (in seconds) of the Python joins of all rules in one example. Default: 10.
+
+        Returns
+        -------
+        GroundingReport
+            The report of the grounding costs.
+        """
+        if self._model_file is not None:
+            raise ModelError("Grounding cannot be explained for models loaded from a model file")
+
+        if sample_size < 1:
+            raise ValueError(f"Sample size has to be positive, got {sample_size}")
+
+        if isinstance(dataset, Dataset):
+            examples = list(samples_to_examples_and_queries(dataset.samples)[0]) or list(dataset._examples)
+        else:
+            examples = [dataset]
+
+        step = max(1, len(examples) // sample_size)
+        profiled = examples[::step][:sample_size]
+
+        report = GroundingReport(profiled_examples=len(profiled), total_examples=len(examples))
+
+        for example in profiled:
+            start = time.perf_counter()
+            groundings = InferenceSession(self, example, cache_size=0).ground_samples()
+            report.grounding_time += time.perf_counter() - start
+
+            rule_groundings: dict[str, int] = {}
+            for grounding in groundings:
+                for rule, count in grounding.rule_groundings().items():
+                    rule_groundings[rule] = rule_groundings.get(rule, 0) + count
+
+            profiles = profile_rules(
+                self._model, grounding_facts(groundings), max_substitutions=max_substitutions, max_time=max_time
+            )
+
+            # The groundings are counted by the backend (the Python join can be truncated)
+            for profile in profiles:
+                profile.groundings = rule_groundings.get(profile.rule, 0)
+
+            if len(report.rules) == 0:
+                report.rules = profiles
+            else:
+                for rule_profile, profile in zip(report.rules, profiles):
+                    rule_profile.add(profile)
+        return report
+
+    def session(self, examples: list[BaseRelation | Rule] | None = None, *, cache_size: int = 1024) -> InferenceSession:
+        """Creates an inference session answering repeated queries against the examples from one grounding.
+
+        Parameters
+        ----------
+        examples : list[BaseRelation | Rule], optional
+            The examples (the knowledge base) to query. Default: None.
+        cache_size : int
+            The maximum number of memoized query results. Default: 1024.
+
+        Returns
+        -------
+        InferenceSession
+            The inference session.
+        """
+        return InferenceSession(self, examples, cache_size=cache_size)
 
     def __str__(self) -> str:
         return "\n".join(str(r) for r in self._model)
@@ -268,7 +598,7 @@ class Model(NeuralModule):
         return iter(self._model)
 
     def __copy__(self) -> "Model":
-        mod = Model()
+        mod = Model(template_cache=self._template_cache)
 
         mod._model_file = self._model_file
         mod._model = [rule for rule in self._model]
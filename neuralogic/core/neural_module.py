@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Collection
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Collection
 
 import jpype
+import numpy as np
 
-from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset
+from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset, LazyGroundedDataset
 
 if TYPE_CHECKING:
     from neuralogic.core.builder import DatasetBuilder
+    from neuralogic.core.builder.cache import SampleCache
+    from neuralogic.core.grounding.limits import GroundingLimits
     from neuralogic.core.settings.settings_proxy import SettingsProxy
 from neuralogic.core.constructs.java_objects import ValueFactory
 from neuralogic.dataset import Dataset
@@ -18,6 +24,31 @@ from neuralogic.utils.visualize import draw_model
 Value = list | float
 
 
+@dataclass
+class EpochStatistics:
+    """
+    Aggregated statistics of epochs trained by :meth:`NeuralModule.train_epochs`, collected at the last epoch of each
+    stride.
+
+    Attributes
+    ----------
+    epochs : list[int]
+        The (0-indexed) epochs the statistics were collected at.
+    loss_sums : list[float]
+        The sum of errors of all samples at each collected epoch.
+    losses : list[float]
+        The mean error of samples at each collected epoch.
+    outputs : list[np.ndarray], optional
+        The outputs of samples at each collected epoch, packed into arrays of shape ``(n_samples, *output_shape)``.
+        None if outputs were not requested.
+    """
+
+    epochs: list[int] = field(default_factory=list)
+    loss_sums: list[float] = field(default_factory=list)
+    losses: list[float] = field(default_factory=list)
+    outputs: list[np.ndarray] | None = None
+
+
 class NeuralModule:
     """
     NeuralModule is the base class for all neural models.
@@ -55,7 +86,10 @@ class NeuralModule:
         batch_size: int = 1,
         learnable_facts: bool = False,
         progress: bool = False,
-    ) -> GroundedDataset:
+        lazy: bool = False,
+        limits: GroundingLimits | None = None,
+        updatable: bool = False,
+    ) -> GroundedDataset | LazyGroundedDataset:
         """Grounds the provided dataset using the model's settings.
 
         Parameters
@@ -68,10 +102,20 @@ class NeuralModule:
             Whether facts are learnable. Default: False.
         progress : bool
             Whether to show progress. Default: False.
+        lazy : bool
+            Whether to keep the groundings in the backend stream and produce them only as the dataset is consumed
+            (see :py:class:`~neuralogic.core.builder.dataset.LazyGroundedDataset`). Default: False.
+        limits : GroundingLimits, optional
+            The limits of the grounding cost per sample and per dataset
+            (see :py:class:`~neuralogic.core.grounding.limits.GroundingLimits`). The diagnostics are available as
+            ``grounded_dataset.diagnostics``. Default: None (no limits).
+        updatable : bool
+            Whether the grounded dataset can be updated incrementally
+            (see :py:meth:`~neuralogic.core.builder.dataset.GroundedDataset.update`). Default: False.
 
         Returns
         -------
-        GroundedDataset
+        GroundedDataset | LazyGroundedDataset
             The grounded dataset.
         """
         if self._dataset_builder is None or self._settings is None:
@@ -83,6 +127,9 @@ class NeuralModule:
             batch_size=batch_size,
             learnable_facts=learnable_facts,
             progress=progress,
+            lazy=lazy,
+            limits=limits,
+            updatable=updatable,
         )
 
     def build_dataset(
@@ -92,7 +139,13 @@ class NeuralModule:
         batch_size: int = 1,
         learnable_facts: bool = False,
         progress: bool = False,
-    ) -> BuiltDataset:
+        cache_dir: str | Path | SampleCache | None = None,
+        workers: int = 1,
+        chunk_size: int | None = None,
+        limits: GroundingLimits | None = None,
+        prefetch: int = 0,
+        updatable: bool = False,
+    ) -> BuiltDataset | Iterator[BuiltDataset]:
         """Builds (ground and neuralize) the provided dataset.
 
         Parameters
@@ -105,11 +158,33 @@ class NeuralModule:
             Whether facts are learnable. Default: False.
         progress : bool
             Whether to show progress. Default: False.
+        cache_dir : str | Path | SampleCache, optional
+            The directory (or the :py:class:`~neuralogic.core.builder.cache.SampleCache`) with built samples cached
+            on disk. The samples are reused when neither the model, the settings, nor the dataset has changed.
+            Default: None (no caching).
+        workers : int
+            The number of worker processes to shard the grounding and neuralization across. Each worker runs its own
+            JVM; the built samples keep the order of the serial build. Default: 1.
+        chunk_size : int, optional
+            If set, the dataset is grounded lazily and neuralized in chunks of at most ``chunk_size`` samples, releasing
+            the groundings of each chunk before the next one is built. An iterator of built datasets (chunks) is
+            returned, which can be passed directly to :meth:`train` or :meth:`test`. Default: None.
+        limits : GroundingLimits, optional
+            The limits of the grounding cost; samples exceeding per-sample limits are skipped, kept, or cause an error
+            according to the limits policy (see :py:class:`~neuralogic.core.grounding.limits.GroundingLimits`).
+            Default: None (no limits).
+        prefetch : int
+            The number of chunks built ahead in a background thread while the current chunk is trained on or tested
+            (see :py:class:`~neuralogic.core.builder.prefetch.Prefetcher`). Requires ``chunk_size``.
+            Default: 0 (no prefetching).
+        updatable : bool
+            Whether the built dataset keeps its source samples, so it can be updated incrementally
+            (see :py:meth:`~neuralogic.core.builder.dataset.BuiltDataset.update`). Default: False.
 
         Returns
         -------
-        BuiltDataset
-            The built dataset.
+        BuiltDataset | Iterator[BuiltDataset]
+            The built dataset, or the iterator of built datasets if ``chunk_size`` is set.
         """
         if self._dataset_builder is None or self._settings is None:
             raise ValueError("model is not built")
@@ -120,6 +195,12 @@ class NeuralModule:
             batch_size=batch_size,
             learnable_facts=learnable_facts,
             progress=progress,
+            cache_dir=cache_dir,
+            workers=workers,
+            chunk_size=chunk_size,
+            limits=limits,
+            prefetch=prefetch,
+            updatable=updatable,
         )
 
     def __call__(self, dataset=None):
@@ -150,7 +231,8 @@ class NeuralModule:
         Parameters
         ----------
         dataset : Any
-            The dataset to train on. Can be a Dataset, GroundedDataset, BuiltDataset, or a list of samples.
+            The dataset to train on. Can be a Dataset, GroundedDataset, BuiltDataset, a list of samples, or an iterator
+            of built datasets (chunks) - chunks are trained on one by one, for one epoch only.
         epochs : int
             The number of epochs to train. Default: 1.
 
@@ -159,6 +241,11 @@ class NeuralModule:
         Union[Tuple[Value, Value, Value], List[Tuple[Value, Value, Value]]]
             The training results (target, output, error).
         """
+        if isinstance(dataset, Iterator):
+            if epochs != 1:
+                raise ValueError("An iterator of built datasets can be trained on for one epoch only")
+            return [result for chunk in dataset for result in self.train(chunk, epochs=1)]
+
         samples, batch_size = self._dataset_to_samples(dataset)
 
         if not isinstance(samples, Collection):
@@ -169,7 +256,7 @@ class NeuralModule:
                 ValueFactory.from_java(result.errorValue()),
             )
         else:
-            sample_array = jpype.java.util.ArrayList([sample._java_sample for sample in samples])
+            sample_array = self._to_sample_array(dataset, samples)
             results = self._strategy.learnSamples(sample_array, epochs, batch_size)
             res = [
                 (
@@ -183,29 +270,165 @@ class NeuralModule:
         self._update_tensor_parameters()
         return res
 
+    def train_epochs(
+        self,
+        dataset,
+        epochs: int = 1,
+        *,
+        stride: int = 1,
+        outputs: bool = False,
+        callback: Callable[[int, EpochStatistics], bool | None] | None = None,
+    ) -> EpochStatistics:
+        """Trains the model on the provided dataset for multiple epochs, returning aggregated statistics only. The
+        samples are passed to the backend once, the backend runs ``stride`` epochs per call, and only the errors (and
+        optionally the outputs) of the last epoch of each stride are transferred, in bulk.
+
+        Parameters
+        ----------
+        dataset : Any
+            The dataset to train on. Can be a Dataset, GroundedDataset, BuiltDataset, or a list of samples.
+        epochs : int
+            The number of epochs to train. Default: 1.
+        stride : int
+            The number of epochs run by the backend between collecting statistics and calling the callback.
+            Default: 1.
+        outputs : bool
+            Whether to collect outputs of samples. Default: False.
+        callback : Callable[[int, EpochStatistics], bool | None], optional
+            Called with the (0-indexed) epoch and the statistics collected so far after each stride. Training stops
+            when the callback returns True. Default: None.
+
+        Returns
+        -------
+        EpochStatistics
+            The statistics of the collected epochs.
+        """
+        if stride < 1:
+            raise ValueError(f"The epoch stride has to be positive, got {stride}")
+
+        if isinstance(dataset, Iterator):
+            raise ValueError("An iterator of built datasets can be trained on for one epoch only, use train instead")
+
+        samples, batch_size = self._dataset_to_samples(dataset)
+
+        if not isinstance(samples, Collection):
+            samples = [samples]
+
+        sample_array = self._to_sample_array(dataset, samples)
+        statistics = EpochStatistics(outputs=[] if outputs else None)
+        epoch = 0
+
+        while epoch < epochs:
+            epoch_stride = min(stride, epochs - epoch)
+            results = self._strategy.learnSamples(sample_array, epoch_stride, batch_size)
+            epoch += epoch_stride
+
+            errors = ValueFactory.stack([result.errorValue() for result in results])
+
+            statistics.epochs.append(epoch - 1)
+            statistics.loss_sums.append(float(errors.sum()))
+            statistics.losses.append(float(errors.mean()) if errors.size != 0 else float("nan"))
+
+            if statistics.outputs is not None:
+                statistics.outputs.append(ValueFactory.stack([result.getOutput() for result in results]))
+
+            self._update_tensor_parameters()
+
+            if callback is not None and callback(epoch - 1, statistics) is True:
+                break
+        return statistics
+
     def test(self, dataset) -> Value:
         """Tests the model on the provided dataset.
 
         Parameters
         ----------
         dataset : Any
-            The dataset to test on.
+            The dataset to test on. Can also be an iterator of built datasets (chunks).
 
         Returns
         -------
         Union[Value, List[Value]]
             The test results (outputs).
         """
+        if isinstance(dataset, Iterator):
+            return [result for chunk in dataset for result in self.test(chunk)]
+
         samples, batch_size = self._dataset_to_samples(dataset)
 
         if not isinstance(samples, Collection):
             return ValueFactory.from_java(self._strategy.evaluateSample(samples._java_sample))
 
-        sample_array = jpype.java.util.ArrayList([sample._java_sample for sample in samples])
+        sample_array = self._to_sample_array(dataset, samples)
         results = self._strategy.evaluateSamples(sample_array, batch_size)
 
         return [ValueFactory.from_java(result) for result in results]
 
+    def evaluate(self, dataset) -> list[tuple[Value, Value, Value]]:
+        """Evaluates the model on the provided dataset in a forward-only pass - computes outputs and errors of
+        samples without computing gradients or updating weights (and the optimizer state).
+
+        Parameters
+        ----------
+        dataset : Any
+            The dataset to evaluate. Can be a Dataset, GroundedDataset, BuiltDataset, a list of samples, or an iterator
+            of built datasets (chunks).
+
+        Returns
+        -------
+        list[tuple[Value, Value, Value]]
+            The evaluation results (target, output, error) - in the same form as the results of :meth:`train`.
+        """
+        if isinstance(dataset, Iterator):
+            return [result for chunk in dataset for result in self.evaluate(chunk)]
+
+        samples, _ = self._dataset_to_samples(dataset)
+        sample_collection = samples if isinstance(samples, Collection) else [samples]
+
+        results = []
+        for sample in sample_collection:
+            self._trainer.invalidateSample(self._invalidation, sample._java_sample)
+            result = self._trainer.evaluateSample(self._evaluation, sample._java_sample)
+
+            results.append(
+                (
+                    ValueFactory.from_java(result.getTarget()),
+                    ValueFactory.from_java(result.getOutput()),
+                    ValueFactory.from_java(result.errorValue()),
+                )
+            )
+        return results
+
+    def predict(self, dataset, *, batch_size: int | None = None) -> np.ndarray:
+        """Evaluates the model on the provided dataset and returns all outputs in one array.
+
+        Parameters
+        ----------
+        dataset : Any
+            The dataset to evaluate. Can be a Dataset, GroundedDataset, BuiltDataset, a list of samples, or an iterator
+            of built datasets (chunks).
+        batch_size : int, optional
+            The number of samples evaluated in parallel by the backend. Default: None (the batch size of the dataset).
+
+        Returns
+        -------
+        np.ndarray
+            The ``float64`` array of outputs of shape ``(n_samples, *output_shape)``.
+        """
+        if isinstance(dataset, Iterator):
+            chunks = [self.predict(chunk, batch_size=batch_size) for chunk in dataset]
+            return np.concatenate(chunks) if chunks else np.empty((0,), dtype=np.float64)
+
+        samples, dataset_batch_size = self._dataset_to_samples(dataset)
+
+        if not isinstance(samples, Collection):
+            samples = [samples]
+
+        sample_array = self._to_sample_array(dataset, samples)
+        results = self._strategy.evaluateSamples(sample_array, batch_size or dataset_batch_size)
+
+        return ValueFactory.stack(results)
+
     def reset_parameters(self):
         self._strategy.resetParameters()
 
@@ -277,6 +500,9 @@ class NeuralModule:
     ):
         if self._dataset_builder is None or self._settings is None:
             raise ValueError("model is not built")
+
+        # Rules converted in the lean build mode get their human-readable strings only when drawn
+        self._dataset_builder.java_factory.restore_debug_strings()
         return draw_model(self, filename, show, img_type, value_detail, graphviz_path, *args, **kwargs)
 
     def _initialize_neural_module(self, dataset_builder: DatasetBuilder, settings: SettingsProxy, model, torch: bool):
@@ -320,37 +546,27 @@ class NeuralModule:
             dataset = dataset.neuralize()
             return dataset._samples, dataset._batch_size
 
+        if isinstance(dataset, LazyGroundedDataset):
+            return [sample for chunk in dataset.neuralize() for sample in chunk], 1
+
         if isinstance(dataset, BuiltDataset):
             return dataset._samples, dataset._batch_size
         return dataset, 1
 
+    @staticmethod
+    def _to_sample_array(dataset, samples) -> Any:
+        if isinstance(dataset, BuiltDataset):
+            return dataset._get_java_samples()
+        return jpype.java.util.ArrayList([sample._java_sample for sample in samples])
+
     def _sync_model(self, state_dict: dict | None = None, weights=None):
         state_dict = self.state_dict() if state_dict is None else state_dict
         weights = self._parsed_model.getAllWeights() if weights is None else weights
         weight_dict = state_dict["weights"]
 
         for weight in weights:
-            if not weight.isLearnable:
-                continue
-            weight_value = weight.value
-
-            index = weight.index
-            value = weight_dict[index]
-
-            if isinstance(value, (float, int)):
-                weight_value.set(0, float(value))
-                continue
-
-            if isinstance(value[0], (float, int)):
-                for i, val in enumerate(value):
-                    weight_value.set(i, float(val))
-                continue
-
-            cols = len(value[0])
-
-            for i, values in enumerate(value):
-                for j, val in enumerate(values):
-                    weight_value.set(i * cols + j, float(val))
+            if weight.isLearnable:
+                ValueFactory.set_value(weight.value, weight_dict[weight.index])
 
     def _backprop(self, sample, gradient):
         _, gradient_value = self._value_factory.get_value(gradient)
@@ -1,6 +1,8 @@
 import weakref
 from typing import Any
 
+from neuralogic.core.constructs.function import Combination
+from neuralogic.core.constructs.function.function import CombinationFunction
 from neuralogic.core.enums import Grounder
 from neuralogic.core.settings.settings_proxy import SettingsProxy
 from neuralogic.nn.init import Initializer, Uniform
@@ -19,6 +21,8 @@ class Settings:
         chain_pruning: bool = True,
         prune_only_identities: bool = False,
         grounder: Grounder = Grounder.BUP,
+        lean_build: bool = False,
+        rule_combination: CombinationFunction = Combination.SUM,
     ):
         self.params = locals().copy()
         self.params.pop("self")
@@ -58,6 +62,26 @@ class Settings:
     def grounder(self, grounder: Grounder):
         self._update("grounder", grounder)
 
+    @property
+    def lean_build(self) -> bool:
+        """Whether to omit human-readable strings of converted rules and relations. Only strings of template rules
+        are restored (when the model is drawn) - facts and atoms of samples and groundings built in this mode are drawn
+        in their structural form, and so are rules if the model has not been drawn before."""
+        return self.params["lean_build"]
+
+    @lean_build.setter
+    def lean_build(self, lean_build: bool):
+        self._update("lean_build", lean_build)
+
+    @property
+    def rule_combination(self) -> CombinationFunction:
+        """The combination of body inputs of rules that do not set their own combination in their metadata."""
+        return self.params["rule_combination"]
+
+    @rule_combination.setter
+    def rule_combination(self, rule_combination: CombinationFunction):
+        self._update("rule_combination", rule_combination)
+
     @property
     def optimizer(self) -> Optimizer:
         return self.params["optimizer"]
@@ -34,6 +34,8 @@ class SettingsProxy:
         chain_pruning: bool,
         prune_only_identities: bool,
         grounder: Grounder,
+        lean_build: bool = False,
+        rule_combination: CombinationFunction = Combination.SUM,
     ):
         """
         Parameters
@@ -52,12 +54,19 @@ class SettingsProxy:
             Whether to prune only identity functions.
         grounder : Grounder
             The grounding algorithm to use.
+        lean_build : bool
+            Whether to omit human-readable strings of converted rules and relations (used only for drawing and
+            debugging) to save conversion time and memory. Only strings of template rules are restored, when the model
+            is drawn - samples and groundings draw facts and atoms in their structural form. Default: False.
+        rule_combination : CombinationFunction
+            The combination of body inputs of rules that do not set their own combination. Default: SUM.
         """
         if not is_initialized():
             initialize()
 
         self.settings_class = jpype.JClass("cz.cvut.fel.ida.setup.Settings")
         self.settings = self.settings_class()
+        self.kw_params: dict[str, Any] = {}
 
         self._optimizer = optimizer
 
@@ -69,7 +78,6 @@ class SettingsProxy:
 
         self.rule_transformation = Transformation.IDENTITY
         self.relation_transformation = Transformation.IDENTITY
-        self.rule_combination = Combination.SUM
         self.relation_combination = Combination.SUM
         self.rule_aggregation = Aggregation.AVG
 
@@ -264,6 +272,21 @@ class SettingsProxy:
     def rule_aggregation(self, value: Aggregation) -> None:
         self.settings.aggNeuronAggregation = self.get_aggregation_function(value)
 
+    @property
+    def lean_build(self) -> bool:
+        """Whether to omit human-readable strings of converted rules and relations."""
+        return self._lean_build
+
+    @lean_build.setter
+    def lean_build(self, lean_build: bool) -> None:
+        self._lean_build = lean_build
+
+    @property
+    def training_threads(self) -> int:
+        """The number of threads the backend trains a mini-batch with in parallel (the common fork-join pool of
+        parallel streams and the calling thread)."""
+        return int(jpype.JClass("java.util.concurrent.ForkJoinPool").getCommonPoolParallelism()) + 1
+
     @property
     def debug_exporting(self) -> bool:
         return self.settings.debugExporting
@@ -306,10 +329,35 @@ class SettingsProxy:
 
     def __setitem__(self, key: str, value: Any) -> None:
         setattr(self.settings, key, value)
+        self.kw_params[key] = value
 
     def __getitem__(self, item: str) -> Any:
         return getattr(self.settings, item)
 
+    def copy(self) -> "SettingsProxy":
+        """Returns a proxy of a (shallow) copy of the Java settings, so settings changed while building with the copy
+        (e.g., the grounding mode) do not affect this proxy.
+
+        Returns
+        -------
+        SettingsProxy
+            The copied proxy.
+        """
+        modifier = jpype.JClass("java.lang.reflect.Modifier")
+
+        proxy = SettingsProxy.__new__(SettingsProxy)
+        proxy.__dict__.update(self.__dict__)
+        proxy.kw_params = dict(self.kw_params)
+        proxy.settings = self.settings_class()
+
+        for field in self.settings_class.class_.getDeclaredFields():
+            modifiers = field.getModifiers()
+
+            if not modifier.isStatic(modifiers) and not modifier.isFinal(modifiers):
+                field.setAccessible(True)
+                field.set(proxy.settings, field.get(self.settings))
+        return proxy
+
     def to_json(self) -> str:
         """Exports the settings to a JSON string.
 
@@ -67,7 +67,8 @@ class TorchNeuralModule:
             return
 
         for param in tensor_parameters:
-            param.data = torch.tensor(ValueFactory.from_java(param._neuralogic_weight.value))
+            value = ValueFactory.to_numpy(param._neuralogic_weight.value)
+            param.data = torch.as_tensor(value, dtype=torch.get_default_dtype())
 
     def forward(self, model: Any, samples: Any, results: Any) -> PyNeuraLogicNetworkOutput:
         """
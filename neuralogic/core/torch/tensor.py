@@ -97,20 +97,4 @@ class NeuralogicOptTensor(torch.Tensor):
         """
         Synchronizes the current tensor data back to the underlying Java weight.
         """
-        size = self.size()
-        weight_value = self._neuralogic_weight.value
-
-        if len(size) == 0:
-            weight_value.set(0, float(self))
-            return
-
-        if len(size) == 1:
-            for i, val in enumerate(self):
-                weight_value.set(i, float(val))
-            return
-
-        cols = size[0]
-
-        for i, values in enumerate(self):
-            for j, val in enumerate(values):
-                weight_value.set(i * cols + j, float(val))
+        self._neuralogic_value_factory.set_value(self._neuralogic_weight.value, self)
@@ -1,8 +1,9 @@
-from typing import Iterable, List, Sequence, Tuple, Union
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
 
 import numpy as np
 
 from neuralogic.core.constructs.factories import Relation
+from neuralogic.core.constructs.relation import TensorRelation
 from neuralogic.dataset.base import ConvertibleDataset
 from neuralogic.dataset.logic import Dataset
 
@@ -85,6 +86,12 @@ class Data:
                 query = relation[y.detach().numpy()]
         return query
 
+    @staticmethod
+    def _to_numpy(data) -> np.ndarray:
+        if hasattr(data, "detach"):
+            return data.detach().cpu().numpy()
+        return np.asarray(data)
+
     @staticmethod
     def _get_edge_rel(edge_name, u, v, w):
         return Relation.get(edge_name)(int(u), int(v))[w].fixed()
@@ -103,13 +110,7 @@ class Data:
         one_hot_decode_edge_features=False,
         max_classes=1,
     ) -> Tuple:
-        if self.y_mask is not None:
-            query = []
-
-            for i in self.y_mask:
-                query.append(Data.get_query(self.y[int(i)], output_name, one_hot_encode_labels, max_classes, int(i)))
-        else:
-            query = Data.get_query(self.y, output_name, one_hot_encode_labels, max_classes)
+        query = self.get_queries(output_name, one_hot_encode_labels, max_classes)
 
         edge_process = Data._get_edge_rel
         if one_hot_decode_edge_features:
@@ -154,6 +155,59 @@ class Data:
                     example.append(Relation.get(feature_name)(i)[weight[0] if weight.size == 1 else weight].fixed())
         return query, example
 
+    def get_queries(self, output_name: str = "predict", one_hot_encode_labels=False, max_classes=1):
+        if self.y_mask is None:
+            return Data.get_query(self.y, output_name, one_hot_encode_labels, max_classes)
+
+        return [
+            Data.get_query(self.y[int(i)], output_name, one_hot_encode_labels, max_classes, int(i)) for i in self.y_mask
+        ]
+
+    def to_tensor_form(
+        self,
+        feature_name: str = "node_feature",
+        edge_name: str = "edge",
+        output_name: str = "predict",
+        one_hot_encode_labels=False,
+        one_hot_decode_features=False,
+        one_hot_decode_edge_features=False,
+        max_classes=1,
+    ) -> Tuple:
+        """
+        Converts the data into the same facts as :py:meth:`to_logic_form`, but keeps them as
+        :py:class:`~neuralogic.core.constructs.relation.TensorRelation` blocks (one per predicate) backed by the
+        original arrays, so that they can be converted to the backend in bulk.
+        """
+        query = self.get_queries(output_name, one_hot_encode_labels, max_classes)
+        edge_index = Data._to_numpy(self.edge_index)
+
+        if self.edge_attr is None:
+            example = [TensorRelation(edge_name, edge_index)]
+        elif one_hot_decode_edge_features:
+            classes = np.argmax(Data._to_numpy(self.edge_attr), axis=-1)
+            example = [
+                TensorRelation(f"{edge_name}_{class_}", edge_index[:, classes == class_])
+                for class_ in np.unique(classes).tolist()
+            ]
+        else:
+            example = [TensorRelation(edge_name, edge_index, self.edge_attr)]
+
+        if one_hot_decode_features:
+            features = Data._to_numpy(self.x)
+            classes = np.argmax(features, axis=-1) if features.size else np.zeros(0, dtype=np.int64)
+            example.extend(
+                TensorRelation(f"{feature_name}_{class_}", np.flatnonzero(classes == class_))
+                for class_ in np.unique(classes).tolist()
+            )
+            return query, example
+
+        features = Data._to_numpy(self.x)
+        if features.ndim == 2 and features.shape[1] == 1:
+            features = features[:, 0]
+
+        example.append(TensorRelation(feature_name, np.arange(len(features)), features))
+        return query, example
+
     @staticmethod
     def from_pyg(data) -> List["Data"]:
         """
@@ -242,11 +296,37 @@ class TensorDataset(ConvertibleDataset):
     def add_data(self, data: Data):
         self.data.append(data)
 
-    def to_dataset(self) -> Dataset:
+    def tensor_forms(self) -> Iterator[Tuple]:
+        """
+        Lazily yields the tensor form (see :py:meth:`Data.to_tensor_form`) of each graph, one graph at a time.
+        """
+        for data in self.data:
+            yield data.to_tensor_form(
+                self.feature_name,
+                self.edge_name,
+                self.output_name,
+                self.one_hot_encode_labels,
+                self.one_hot_decode_features,
+                self.one_hot_decode_edge_features,
+                self.number_of_classes,
+            )
+
+    def to_dataset(self, tensor_form: bool = False) -> Dataset:
+        """
+        Converts the tensor dataset into a logic :py:class:`~neuralogic.dataset.logic.Dataset`.
+
+        Parameters
+        ----------
+        tensor_form : bool
+            Keep facts of each graph as :py:class:`~neuralogic.core.constructs.relation.TensorRelation` blocks
+            instead of individual relations. Such a dataset is converted to the backend in bulk. Default: ``False``
+        """
         dataset = Dataset()
+        to_form = Data.to_tensor_form if tensor_form else Data.to_logic_form
 
         for data in self.data:
-            query, examples = data.to_logic_form(
+            query, examples = to_form(
+                data,
                 self.feature_name,
                 self.edge_name,
                 self.output_name,
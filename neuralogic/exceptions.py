@@ -18,6 +18,14 @@ class DatasetError(NeuraLogicError):
     """Raised when dataset preparation or grounding fails."""
 
 
+class GroundingLimitError(DatasetError):
+    """Raised when grounding exceeds configured limits; ``diagnostics`` describes the exceeded limits."""
+
+    def __init__(self, message: str, diagnostics: object = None):
+        super().__init__(message)
+        self.diagnostics = diagnostics
+
+
 class BackendError(NeuraLogicError):
     """Raised when the Java backend encounters an internal error."""
 
@@ -6,10 +6,12 @@ from neuralogic.nn.trainer.callbacks import (
 )
 from neuralogic.nn.trainer.history import TrainerHistory
 from neuralogic.nn.trainer.metrics import Metric, compute_metrics
+from neuralogic.nn.trainer.parallel import DataParallel
 from neuralogic.nn.trainer.trainer import Trainer
 
 __all__ = [
     "Trainer",
+    "DataParallel",
     "TrainerHistory",
     "TrainerCallback",
     "EarlyStoppingCallback",
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from neuralogic.core.builder.batching import BatchSchedule
+from neuralogic.core.builder.prefetch import PrefetchStatistics
+
 
 @dataclass
 class TrainerHistory:
@@ -26,6 +29,12 @@ class TrainerHistory:
         Lowest validation loss observed.
     stopped_early : bool
         ``True`` if early stopping fired.
+    prefetch : list[PrefetchStatistics]
+        Per-epoch statistics of building chunks in the background
+        (empty unless trained with ``chunk_size`` and ``prefetch``).
+    batch_schedule : BatchSchedule or None
+        Mini-batches of the last epoch with their estimated thread
+        utilization (``None`` unless trained with ``balance_batches``).
     """
 
     train_losses: list[float] = field(default_factory=list)
@@ -36,3 +45,5 @@ class TrainerHistory:
     best_epoch: int = 0
     best_val_loss: float = float("inf")
     stopped_early: bool = False
+    prefetch: list[PrefetchStatistics] = field(default_factory=list)
+    batch_schedule: BatchSchedule | None = None
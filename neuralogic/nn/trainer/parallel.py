@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+import neuralogic.setup as setup
+from neuralogic.core.builder.dataset import BuiltDataset
+from neuralogic.core.neural_module import NeuralModule
+from neuralogic.exceptions import BackendError
+
+
+@dataclass
+class TrainingShard:
+    """A picklable description of a replica of the model trained by a worker process on a shard of samples."""
+
+    index: int
+    seed: int
+    model_file: str | None
+    template_cache: str | None
+    entries: list[Any]
+    settings_params: dict[str, Any]
+    settings_kw_params: dict[str, Any]
+    samples: bytes
+    batch_size: int
+
+
+def split_samples(samples: list[Any], shards: int) -> list[list[Any]]:
+    """
+    Splits samples into at most ``shards`` contiguous non-empty shards whose sizes differ by at most one.
+
+    Parameters
+    ----------
+    samples : list[Any]
+        The samples to split.
+    shards : int
+        The maximum number of shards.
+
+    Returns
+    -------
+    list[list[Any]]
+        The list of shards.
+    """
+    shards = max(1, min(shards, len(samples)))
+    return [samples[(i * len(samples)) // shards : ((i + 1) * len(samples)) // shards] for i in range(shards)]
+
+
+def average_weights(weights: list[dict[int, Any]], counts: list[int]) -> dict[int, np.ndarray]:
+    """
+    Averages weights of replicas, weighted by the numbers of samples the replicas were trained on (replicas trained on
+    no samples do not contribute).
+
+    Parameters
+    ----------
+    weights : list[dict[int, Any]]
+        The weights of each replica (``state_dict()["weights"]``).
+    counts : list[int]
+        The number of samples of each replica.
+
+    Returns
+    -------
+    dict[int, np.ndarray]
+        The averaged weights.
+    """
+    total = sum(counts)
+
+    return {
+        index: sum(
+            np.asarray(replica[index], dtype=np.float64) * (count / total) for replica, count in zip(weights, counts)
+        )
+        for index in weights[0]
+    }
+
+
+def _run_worker(connection: Any, shard: TrainingShard, init_args: tuple) -> None:
+    from neuralogic.core.builder import DatasetBuilder
+    from neuralogic.core.builder.parallel import _initialize_worker
+    from neuralogic.core.builder.serialization import deserialize_samples
+    from neuralogic.core.model import Model
+    from neuralogic.core.settings import Settings
+
+    try:
+        _initialize_worker(*init_args)
+        setup.manual_seed(shard.seed)
+
+        settings = Settings(**shard.settings_params)
+        for key, value in shard.settings_kw_params.items():
+            settings[key] = value
+
+        model = Model(model_file=shard.model_file, template_cache=shard.template_cache)
+        model.add_rules(shard.entries)
+        model.build(settings)
+
+        # The samples were built in the parent process, which configured the mini-batch training there
+        DatasetBuilder.setup_batch_size(model._settings, shard.batch_size)
+
+        samples = deserialize_samples(shard.samples, model._parsed_model.getAllWeights())
+
+        # Each mini-batch is one optimization step, its Java list of samples is reused across epochs
+        batches = [
+            BuiltDataset(samples[start : start + shard.batch_size], shard.batch_size)
+            for start in range(0, len(samples), shard.batch_size)
+        ]
+        connection.send(("ok", len(batches)))
+
+        while True:
+            command, payload = connection.recv()
+
+            if command == "stop":
+                break
+
+            weights, lr, start, steps = payload
+            model.load_state_dict({"weights": weights})
+            # The learning rate is decayed by the parent (e.g., by Trainer at the end of every epoch)
+            model._settings.optimizer.lr = lr
+
+            loss_sum, count = 0.0, 0
+            for batch in batches[start : start + steps]:
+                loss_sum += model.train_epochs(batch, 1).loss_sums[-1]
+                count += len(batch)
+
+            connection.send(("ok", (loss_sum, count, model.state_dict()["weights"])))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+class DataParallel:
+    """
+    DataParallel trains a built model in worker processes, each running its own JVM and holding a replica of the
+    weights and a shard of the samples. Replicas step through the mini-batches of their shards in lockstep, and every
+    ``sync_every`` steps (and at the end of every epoch) their weights are averaged (weighted by the numbers of samples
+    trained since the last synchronization) over local pipes and loaded into the model and all replicas.
+
+    With plain gradient descent and ``sync_every=1``, every step starts from the same weights, so averaging the
+    weights equals one step with the gradients averaged over the mini-batches of all replicas. Stateful optimizers
+    (e.g., Adam) keep their state per replica, computed from the replica's own gradients.
+
+    Every step of the replicas uses the current learning rate of the model's optimizer, so the learning rate decayed
+    in this process (e.g., by :class:`~neuralogic.nn.trainer.Trainer` at the end of every epoch) applies to the
+    replicas.
+    """
+
+    def __init__(self, module: NeuralModule, dataset: BuiltDataset, workers: int, *, sync_every: int = 1):
+        """
+        Parameters
+        ----------
+        module : NeuralModule
+            The built model (created by :class:`~neuralogic.core.model.Model`). Samples with learnable facts are not
+            supported - only template weights are averaged.
+        dataset : BuiltDataset
+            The built dataset to shard across the workers.
+        workers : int
+            The number of worker processes.
+        sync_every : int
+            The number of mini-batch steps between averaging of weights. Default: 1.
+        """
+        if sync_every < 1:
+            raise ValueError(f"The synchronization period has to be positive, got {sync_every}")
+
+        if module._dataset_builder is None or module._dataset_builder.model is None:
+            raise ValueError("Data-parallel training requires a model built by Model.build")
+
+        if module._torch_module is not None:
+            raise ValueError("Data-parallel training does not support the PyTorch backend")
+
+        self.module = module
+        self.dataset = dataset
+        self.workers = workers
+        self.sync_every = sync_every
+
+        self._connections: list[Any] = []
+        self._processes: list[Any] = []
+        self._batches: list[int] = []
+        self._weights: dict[int, Any] | None = None
+
+    @property
+    def steps_per_epoch(self) -> int:
+        """The number of mini-batch steps of one epoch (of the replica with the most mini-batches)."""
+        return max(self._batches, default=0)
+
+    def start(self) -> DataParallel:
+        """Starts the worker processes and waits until each has built its replica. If any worker fails, all started
+        workers are stopped.
+
+        Returns
+        -------
+        DataParallel
+            The started data-parallel trainer (self).
+        """
+        from neuralogic.core.builder.serialization import serialize_samples
+        from neuralogic.core.settings import Settings
+
+        model = self.module._dataset_builder.model
+        settings = model._build_settings or Settings()
+        template_cache = model._template_cache
+        weights = self.module._dataset_builder.parsed_model.getAllWeights()
+
+        context = multiprocessing.get_context("spawn")
+        init_args = ([*setup.jvm_options], {**setup.jvm_params}, setup._max_memory_size)
+
+        try:
+            for index, samples in enumerate(split_samples(list(self.dataset), self.workers)):
+                shard = TrainingShard(
+                    index=index,
+                    seed=setup._seed + index,
+                    model_file=model._model_file,
+                    template_cache=str(template_cache.cache_dir) if template_cache is not None else None,
+                    entries=list(model),
+                    settings_params=settings.params,
+                    settings_kw_params=settings.kw_params,
+                    samples=serialize_samples(samples, weights),
+                    batch_size=self.dataset._batch_size,
+                )
+
+                connection, worker_connection = context.Pipe()
+                process = context.Process(target=_run_worker, args=(worker_connection, shard, init_args), daemon=True)
+                process.start()
+                worker_connection.close()
+
+                self._connections.append(connection)
+                self._processes.append(process)
+
+            self._batches = [self._receive(connection) for connection in self._connections]
+        except BaseException:
+            # Workers blocked waiting for commands would never exit otherwise
+            self.close()
+            raise
+
+        self._weights = self.module.state_dict()["weights"]
+        return self
+
+    def train_epoch(self) -> float:
+        """Trains all replicas for one epoch on their shards, averaging the weights every ``sync_every`` steps and at
+        the end of the epoch.
+
+        Returns
+        -------
+        float
+            The mean error of all samples.
+        """
+        loss_sum, count = 0.0, 0
+        lr = self.module._settings.optimizer.lr
+
+        for start in range(0, self.steps_per_epoch, self.sync_every):
+            for connection in self._connections:
+                connection.send(("train", (self._weights, lr, start, self.sync_every)))
+
+            results = [self._receive(connection) for connection in self._connections]
+            loss_sum += sum(replica_loss_sum for replica_loss_sum, _, _ in results)
+            count += sum(replica_count for _, replica_count, _ in results)
+
+            self._weights = average_weights(
+                [weights for _, _, weights in results], [replica_count for _, replica_count, _ in results]
+            )
+            self.module.load_state_dict({"weights": self._weights})
+        return loss_sum / count if count != 0 else float("nan")
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        for connection in self._connections:
+            try:
+                connection.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+
+        for process in self._processes:
+            process.join()
+
+        self._connections.clear()
+        self._processes.clear()
+        self._batches.clear()
+
+    @staticmethod
+    def _receive(connection: Any) -> Any:
+        try:
+            status, payload = connection.recv()
+        except EOFError:
+            raise BackendError("A data-parallel training worker exited unexpectedly")
+
+        if status == "error":
+            raise BackendError(f"A data-parallel training worker failed:\n{payload}")
+        return payload
+
+    def __enter__(self) -> DataParallel:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Union
 
+import neuralogic.setup as setup
 from neuralogic.core.builder.dataset import BuiltDataset, GroundedDataset
-from neuralogic.core.neural_module import NeuralModule
+from neuralogic.core.builder.prefetch import Prefetcher
+from neuralogic.core.neural_module import EpochStatistics, NeuralModule
 from neuralogic.dataset import Dataset
 
 from neuralogic.nn.trainer.callbacks import (
@@ -17,6 +19,7 @@ from neuralogic.nn.trainer.callbacks import (
 from neuralogic.nn.trainer.helpers import _build_logs, _ensure_built, _mean, _unpack_results
 from neuralogic.nn.trainer.history import TrainerHistory
 from neuralogic.nn.trainer.metrics import Metric, _validate_metrics, compute_metrics
+from neuralogic.nn.trainer.parallel import DataParallel
 
 
 class Trainer:
@@ -39,6 +42,12 @@ class Trainer:
         metrics: Sequence[Union[str, Metric]] | None = None,
         silent: bool = False,
         callbacks: Sequence[TrainerCallback] | None = None,
+        workers: int = 1,
+        sync_every: int = 1,
+        chunk_size: int | None = None,
+        prefetch: int = 1,
+        balance_batches: bool = False,
+        stride: int = 1,
     ) -> TrainerHistory:
         """Run the training loop.
 
@@ -74,6 +83,42 @@ class Trainer:
             Additional callbacks to invoke.  Built-in callbacks (early
             stopping, checkpoint, progress) are appended automatically
             based on the other arguments.
+        workers : int
+            Number of worker processes training replicas of the model on
+            shards of the training data (see :class:`DataParallel`).
+            Training metrics are not collected with multiple workers.
+            The replicas train with the current (decayed) learning rate of
+            the model's optimizer.  Default 1 (training in this process).
+        sync_every : int
+            Number of mini-batch steps between averaging of the replicas'
+            weights when ``workers > 1``.  The weights are also averaged
+            at the end of every epoch.  Default 1.
+        chunk_size : int or None
+            If set, the raw training data are grounded and neuralized in
+            chunks of at most ``chunk_size`` samples every epoch, and the
+            model is trained chunk by chunk, so the whole built dataset is
+            never held in memory.  Default ``None``.
+        prefetch : int
+            Number of chunks built ahead in a background thread while the
+            current chunk trains (when ``chunk_size`` is set).  The
+            per-epoch producer and consumer stall times are recorded in
+            ``history.prefetch``.  Default 1.
+        balance_batches : bool
+            If ``True``, samples are ordered once into mini-batches of
+            samples with similar numbers of neurons, and the order of the
+            mini-batches is shuffled every epoch, so the threads training a
+            mini-batch in parallel (``training_threads`` of the model
+            settings) finish at about the same time.  The estimated
+            per-batch thread utilization is recorded in
+            ``history.batch_schedule``.
+            Default ``False``.
+        stride : int
+            Without metrics, validation, chunks, workers and balanced
+            batches, all epochs are trained by one backend call (the samples
+            are passed to the backend once), and the loss is collected and
+            callbacks are called every ``stride`` epochs (the learning rate
+            is decayed between strides).  Other training requires
+            ``stride=1``.  Default 1.
 
         Returns
         -------
@@ -83,11 +128,29 @@ class Trainer:
         metric_names = [str(m) for m in metrics] if metrics else []
         _validate_metrics(metric_names)
 
-        built_train = _ensure_built(self.model, train_dataset, batch_size)
-        built_val = _ensure_built(self.model, val_dataset, batch_size) if val_dataset is not None else None
+        strided = (
+            val_dataset is None and not metric_names and chunk_size is None and workers == 1 and not balance_batches
+        )
 
-        optimizer = self.model._settings.optimizer
-        lr_decay = optimizer._lr_decay if hasattr(optimizer, "_lr_decay") else None
+        if stride < 1:
+            raise ValueError(f"The epoch stride has to be positive, got {stride}")
+        if stride > 1 and not strided:
+            raise ValueError(
+                "Epoch strides require training without metrics, validation, chunks, workers and balancing"
+            )
+
+        if balance_batches and (chunk_size is not None or workers > 1):
+            raise ValueError("Balanced batches cannot be combined with chunked or data-parallel training")
+
+        if chunk_size is not None:
+            if isinstance(train_dataset, BuiltDataset):
+                raise ValueError("Chunked training requires a dataset that is not built yet")
+            if workers > 1:
+                raise ValueError("Chunked training cannot be combined with data-parallel training")
+            built_train = None
+        else:
+            built_train = _ensure_built(self.model, train_dataset, batch_size)
+        built_val = _ensure_built(self.model, val_dataset, batch_size) if val_dataset is not None else None
 
         cb_list: list[TrainerCallback] = []
 
@@ -103,6 +166,92 @@ class Trainer:
         history = TrainerHistory()
         self.stop_training = False
 
+        data_parallel: DataParallel | None = None
+        epoch_schedules = None
+
+        if balance_batches:
+            # Samples are bucketed once, only the order of the mini-batches is shuffled every epoch
+            epoch_schedules = built_train.epoch_schedules(
+                self.model._settings.training_threads, seed=setup.initial_seed()
+            )
+
+        def train_epoch() -> tuple[float, list, list]:
+            if data_parallel is not None:
+                return data_parallel.train_epoch(), [], []
+            if built_train is None:
+                return self._train_chunks(train_dataset, batch_size, chunk_size, prefetch, metric_names, history)
+
+            epoch_dataset = built_train
+            if epoch_schedules is not None:
+                epoch_dataset, history.batch_schedule = next(epoch_schedules)
+
+            # The Java list of samples of the built dataset is reused across epochs
+            if metric_names:
+                targets, outputs, errors = _unpack_results(self.model.train(epoch_dataset, epochs=1))
+                return _mean(errors), targets, outputs
+
+            # Without metrics, only the loss is transferred from the backend
+            return self.model.train_epochs(epoch_dataset, epochs=1).losses[0], [], []
+
+        if strided:
+            self._run_strided_epochs(history, built_train, epochs, stride, cb_list)
+            return history
+
+        try:
+            if workers > 1:
+                data_parallel = DataParallel(self.model, built_train, workers, sync_every=sync_every)
+                data_parallel.start()
+
+            self._run_epochs(history, train_epoch, built_val, epochs, metric_names, cb_list)
+        finally:
+            if data_parallel is not None:
+                data_parallel.close()
+
+        return history
+
+    def _train_chunks(
+        self,
+        dataset: Dataset | GroundedDataset,
+        batch_size: int,
+        chunk_size: int,
+        prefetch: int,
+        metric_names: list[str],
+        history: TrainerHistory,
+    ) -> tuple[float, list, list]:
+        chunks = self.model.build_dataset(
+            dataset, batch_size=batch_size, chunk_size=chunk_size, prefetch=max(prefetch, 0)
+        )
+        loss_sum, count = 0.0, 0
+        targets, outputs = [], []
+
+        try:
+            for chunk in chunks:
+                if metric_names:
+                    chunk_targets, chunk_outputs, errors = _unpack_results(self.model.train(chunk, epochs=1))
+                    targets.extend(chunk_targets)
+                    outputs.extend(chunk_outputs)
+                    loss = _mean(errors)
+                else:
+                    loss = self.model.train_epochs(chunk, epochs=1).losses[0]
+
+                loss_sum += loss * len(chunk)
+                count += len(chunk)
+        finally:
+            if isinstance(chunks, Prefetcher):
+                chunks.close()
+                history.prefetch.append(chunks.statistics)
+
+        return (loss_sum / count if count != 0 else float("nan")), targets, outputs
+
+    def _run_epochs(
+        self,
+        history: TrainerHistory,
+        train_epoch: Callable[[], tuple[float, list, list]],
+        built_val: BuiltDataset | None,
+        epochs: int,
+        metric_names: list[str],
+        cb_list: list[TrainerCallback],
+    ) -> None:
         for cb in cb_list:
             cb.on_train_begin(self)
 
@@ -111,48 +260,89 @@ class Trainer:
                 history.stopped_early = True
                 break
 
-            train_results = self.model.train(built_train, epochs=1)
-            train_targets, train_outputs, train_errors = _unpack_results(train_results)
-            train_loss = _mean(train_errors)
-            history.train_losses.append(train_loss)
-
-            val_loss: float | None = None
-            if built_val is not None:
-                state = self.model.state_dict()
-                val_results = self.model.train(built_val, epochs=1)
-                self.model.load_state_dict(state)
-                val_targets, val_outputs, val_errors = _unpack_results(val_results)
-                val_loss = _mean(val_errors)
-                history.val_losses.append(val_loss)
-
-                if val_loss < history.best_val_loss:
-                    history.best_val_loss = val_loss
-                    history.best_epoch = epoch
-
-            current_lr = optimizer.lr
-            history.learning_rates.append(current_lr)
-            if lr_decay is not None:
-                lr_decay.decay(epoch)
-
-            logs = _build_logs(train_loss, val_loss, current_lr)
-            if metric_names and train_outputs:
-                train_mets = compute_metrics(train_targets, train_outputs, metric_names)
-                for name, value in train_mets.items():
-                    history.train_metrics.setdefault(name, []).append(value)
-                    logs[f"train_{name}"] = value
-            if metric_names and built_val is not None and val_outputs:
-                val_mets = compute_metrics(val_targets, val_outputs, metric_names)  # type: ignore[possibly-unbound]
-                for name, value in val_mets.items():
-                    history.val_metrics.setdefault(name, []).append(value)
-                    logs[f"val_{name}"] = value
-
-            for cb in cb_list:
-                cb.on_epoch_end(self, epoch, logs)
+            train_loss, train_targets, train_outputs = train_epoch()
+
+            self._end_epoch(history, epoch, train_loss, train_targets, train_outputs, built_val, metric_names, cb_list)
 
         for cb in cb_list:
             cb.on_train_end(self)
 
-        return history
+    def _run_strided_epochs(
+        self,
+        history: TrainerHistory,
+        built_train: BuiltDataset,
+        epochs: int,
+        stride: int,
+        cb_list: list[TrainerCallback],
+    ) -> None:
+        last_epoch = -1
+
+        def on_stride(epoch: int, statistics: EpochStatistics) -> bool:
+            nonlocal last_epoch
+            stride_epochs = epoch - last_epoch
+            last_epoch = epoch
+
+            self._end_epoch(history, epoch, statistics.losses[-1], [], [], None, [], cb_list, stride_epochs)
+            return self.stop_training
+
+        for cb in cb_list:
+            cb.on_train_begin(self)
+
+        # The samples are passed to the backend once for all epochs
+        self.model.train_epochs(built_train, epochs, stride=stride, callback=on_stride)
+        history.stopped_early = self.stop_training and last_epoch < epochs - 1
+
+        for cb in cb_list:
+            cb.on_train_end(self)
+
+    def _end_epoch(
+        self,
+        history: TrainerHistory,
+        epoch: int,
+        train_loss: float,
+        train_targets: list,
+        train_outputs: list,
+        built_val: BuiltDataset | None,
+        metric_names: list[str],
+        cb_list: list[TrainerCallback],
+        stride_epochs: int = 1,
+    ) -> None:
+        optimizer = self.model._settings.optimizer
+        lr_decay = optimizer._lr_decay if hasattr(optimizer, "_lr_decay") else None
+
+        history.train_losses.append(train_loss)
+
+        val_loss: float | None = None
+        if built_val is not None:
+            val_results = self.model.evaluate(built_val)
+            val_targets, val_outputs, val_errors = _unpack_results(val_results)
+            val_loss = _mean(val_errors)
+            history.val_losses.append(val_loss)
+
+            if val_loss < history.best_val_loss:
+                history.best_val_loss = val_loss
+                history.best_epoch = epoch
+
+        current_lr = optimizer.lr
+        history.learning_rates.append(current_lr)
+        if lr_decay is not None:
+            for decayed_epoch in range(epoch - stride_epochs + 1, epoch + 1):
+                lr_decay.decay(decayed_epoch)
+
+        logs = _build_logs(train_loss, val_loss, current_lr)
+        if metric_names and train_outputs:
+            train_mets = compute_metrics(train_targets, train_outputs, metric_names)
+            for name, value in train_mets.items():
+                history.train_metrics.setdefault(name, []).append(value)
+                logs[f"train_{name}"] = value
+        if metric_names and built_val is not None and val_outputs:
+            val_mets = compute_metrics(val_targets, val_outputs, metric_names)  # type: ignore[possibly-unbound]
+            for name, value in val_mets.items():
+                history.val_metrics.setdefault(name, []).append(value)
+                logs[f"val_{name}"] = value
+
+        for cb in cb_list:
+            cb.on_epoch_end(self, epoch, logs)
 
     def test(
         self,
@@ -0,0 +1,9 @@
+from neuralogic.serving.metrics import ServingMetrics
+from neuralogic.serving.server import InferenceServer, decode_relation, decode_sample
+
+__all__ = [
+    "InferenceServer",
+    "ServingMetrics",
+    "decode_relation",
+    "decode_sample",
+]
@@ -0,0 +1,79 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+class ServingMetrics:
+    """
+    ServingMetrics collects latency and throughput counters of served requests. Latency percentiles are computed over
+    a sliding window of the most recent requests.
+    """
+
+    def __init__(self, window: int = 10000):
+        """
+        Parameters
+        ----------
+        window : int
+            The number of most recent request latencies to compute percentiles from. Default: 10000.
+        """
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._started = time.perf_counter()
+
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+
+    def record_batch(self, latencies: list[float], errors: int = 0) -> None:
+        """Records one evaluated micro-batch.
+
+        Parameters
+        ----------
+        latencies : list[float]
+            Latencies (in seconds) of requests in the batch, from submission to completion.
+        errors : int
+            The number of failed requests in the batch. Default: 0.
+        """
+        with self._lock:
+            self._latencies.extend(latencies)
+            self.requests += len(latencies)
+            self.errors += errors
+            self.batches += 1
+
+    def reset(self) -> None:
+        """Resets all counters."""
+        with self._lock:
+            self._latencies.clear()
+            self._started = time.perf_counter()
+
+            self.requests = 0
+            self.errors = 0
+            self.batches = 0
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Returns the current values of the counters.
+
+        Returns
+        -------
+        dict[str, float | int]
+            The counters - the number of requests, errors and batches, the mean batch size, the throughput
+            (requests per second), and p50/p99 latencies (in milliseconds).
+        """
+        with self._lock:
+            latencies = np.array(self._latencies, dtype=np.float64)
+            elapsed = time.perf_counter() - self._started
+            requests, errors, batches = self.requests, self.errors, self.batches
+
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000 if len(latencies) != 0 else (0.0, 0.0)
+
+        return {
+            "requests": requests,
+            "errors": errors,
+            "batches": batches,
+            "mean_batch_size": requests / batches if batches != 0 else 0.0,
+            "throughput": requests / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_ms": float(p50),
+            "latency_p99_ms": float(p99),
+        }
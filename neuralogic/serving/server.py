@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from neuralogic.core.constructs.factories import R
+from neuralogic.core.constructs.relation import BaseRelation
+from neuralogic.core.neural_module import NeuralModule
+from neuralogic.dataset import Dataset, Sample
+from neuralogic.exceptions import ModelError
+from neuralogic.serving.metrics import ServingMetrics
+
+Decoder = Callable[[Any], Sample]
+
+
+def decode_relation(payload: dict[str, Any]) -> BaseRelation:
+    """
+    Decodes a relation from a JSON payload of the form ``{"name": "edge", "terms": [1, 2], "value": 0.5}``, where
+    ``terms`` and ``value`` are optional.
+
+    Parameters
+    ----------
+    payload : dict[str, Any]
+        The relation payload.
+
+    Returns
+    -------
+    BaseRelation
+        The decoded relation.
+    """
+    relation = R.get(payload["name"])
+    terms = payload.get("terms", [])
+
+    if len(terms) != 0:
+        relation = relation(*terms)
+    if "value" in payload:
+        relation = relation[payload["value"]]
+    return relation
+
+
+def decode_sample(payload: dict[str, Any]) -> Sample:
+    """
+    Decodes a sample from a JSON payload of the form ``{"query": relation, "example": [relation, ...]}`` with
+    relations encoded as in :func:`decode_relation`.
+
+    Parameters
+    ----------
+    payload : dict[str, Any]
+        The sample payload.
+
+    Returns
+    -------
+    Sample
+        The decoded sample.
+    """
+    query = payload.get("query")
+    example = [decode_relation(fact) for fact in payload.get("example", [])]
+
+    return Sample(None if query is None else decode_relation(query), example)
+
+
+@dataclass
+class _Request:
+    sample: Sample
+    future: Future = field(default_factory=Future)
+    submitted: float = field(default_factory=time.perf_counter)
+
+
+class InferenceServer:
+    """
+    InferenceServer serves predictions of one warm (built) model. Concurrently submitted samples are collected into
+    micro-batches which are grounded, neuralized, and evaluated together by a single evaluation thread. Samples can be
+    submitted directly (:meth:`submit`, :meth:`predict`) or over HTTP:
+
+    - ``POST /predict`` with a sample payload (or a list of payloads) responds with ``{"output": ...}``
+      (or ``{"outputs": [...]}``),
+    - ``GET /metrics`` responds with latency and throughput counters (see :class:`ServingMetrics`),
+    - ``GET /health`` responds with ``{"status": "ok"}``.
+    """
+
+    def __init__(
+        self,
+        model: NeuralModule,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        decoder: Decoder = decode_sample,
+        request_timeout: float | None = 30.0,
+        metrics_window: int = 10000,
+    ):
+        """
+        Parameters
+        ----------
+        model : NeuralModule
+            The built model to serve. While the server is running, the model should not be used from other threads.
+        host : str
+            The host to bind the HTTP server to. Default: ``"127.0.0.1"``.
+        port : int
+            The port to bind the HTTP server to (0 picks a free port). Default: 0.
+        max_batch_size : int
+            The maximum number of samples in one micro-batch. Default: 64.
+        max_wait : float
+            The maximum time (in seconds) to wait for more samples after the first sample of a micro-batch arrives.
+            Default: 0.002.
+        decoder : Decoder
+            The function decoding HTTP JSON payloads into samples. Default: :func:`decode_sample`.
+        request_timeout : float, optional
+            The maximum time (in seconds) an HTTP request waits for its result. Default: 30.0.
+        metrics_window : int
+            The number of most recent request latencies to compute percentiles from. Default: 10000.
+        """
+        if model._neural_model is None:
+            raise ModelError("The model must be built before serving. Call model.build() first.")
+
+        if max_batch_size < 1:
+            raise ValueError(f"Maximum batch size has to be positive, got {max_batch_size}")
+
+        self.model = model
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.decoder = decoder
+        self.request_timeout = request_timeout
+        self.metrics = ServingMetrics(metrics_window)
+
+        self._queue: queue.Queue[_Request | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._http_server: ThreadingHTTPServer | None = None
+        self._http_thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The address (host, port) the HTTP server is bound to."""
+        if self._http_server is None:
+            raise RuntimeError("The server is not running")
+        return self._http_server.server_address[:2]
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is running."""
+        return self._worker is not None
+
+    def start(self, http: bool = True) -> InferenceServer:
+        """Starts the evaluation thread and (optionally) the HTTP server.
+
+        Parameters
+        ----------
+        http : bool
+            Whether to start the HTTP server. Default: True.
+
+        Returns
+        -------
+        InferenceServer
+            The started server (self).
+        """
+        if self.running:
+            raise RuntimeError("The server is already running")
+
+        self._worker = threading.Thread(target=self._evaluation_loop, name="neuralogic-serving", daemon=True)
+        self._worker.start()
+
+        if http:
+            self._http_server = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+            self._http_server.daemon_threads = True
+            self._http_server.inference_server = self
+
+            self._http_thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+            self._http_thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the HTTP server and the evaluation thread. Samples submitted before stopping are still evaluated."""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_thread.join()
+
+            self._http_server = None
+            self._http_thread = None
+
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def submit(self, sample: Sample) -> Future:
+        """Submits a sample for evaluation.
+
+        Parameters
+        ----------
+        sample : Sample
+            The sample to evaluate.
+
+        Returns
+        -------
+        Future
+            The future of the output of the sample (a float or a nested list of floats).
+        """
+        if not self.running:
+            raise RuntimeError("The server is not running")
+
+        request = _Request(sample)
+        self._queue.put(request)
+
+        return request.future
+
+    def predict(self, sample: Sample, timeout: float | None = None) -> Any:
+        """Evaluates the sample (as a part of a micro-batch) and waits for the output.
+
+        Parameters
+        ----------
+        sample : Sample
+            The sample to evaluate.
+        timeout : float, optional
+            The maximum time (in seconds) to wait for the output. Default: None (no limit).
+
+        Returns
+        -------
+        Any
+            The output of the sample (a float or a nested list of floats).
+        """
+        return self.submit(sample).result(timeout)
+
+    def _evaluation_loop(self) -> None:
+        stopping = False
+
+        while not stopping:
+            request = self._queue.get()
+
+            if request is None:
+                break
+
+            # Requests cancelled by their clients while queued are dropped
+            if not request.future.set_running_or_notify_cancel():
+                continue
+
+            batch = [request]
+            deadline = time.perf_counter() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+
+                if request is None:
+                    stopping = True
+                    break
+
+                if request.future.set_running_or_notify_cancel():
+                    batch.append(request)
+
+            try:
+                self._evaluate(batch)
+            except Exception as e:
+                # An unexpected error fails only the requests of this batch, the thread keeps serving later requests
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _evaluate(self, batch: list[_Request]) -> None:
+        try:
+            outputs = self._predict([request.sample for request in batch])
+            errors: list[BaseException | None] = [None] * len(batch)
+        except Exception:
+            # Evaluate one by one, so that one invalid sample does not fail the whole batch
+            outputs, errors = [], []
+
+            for request in batch:
+                try:
+                    outputs.extend(self._predict([request.sample]))
+                    errors.append(None)
+                except Exception as e:
+                    outputs.append(None)
+                    errors.append(e)
+
+        finished = time.perf_counter()
+
+        for request, output, error in zip(batch, outputs, errors):
+            if error is None:
+                request.future.set_result(output)
+            else:
+                request.future.set_exception(error)
+
+        latencies = [finished - request.submitted for request in batch]
+        self.metrics.record_batch(latencies, sum(error is not None for error in errors))
+
+    def _predict(self, samples: list[Sample]) -> list[Any]:
+        built_dataset = self.model.build_dataset(Dataset(samples))
+
+        if len(built_dataset) != len(samples):
+            raise ValueError(f"Expected {len(samples)} built samples, got {len(built_dataset)}")
+        return [output.tolist() for output in self.model.predict(built_dataset)]
+
+    def __enter__(self) -> InferenceServer:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: Any
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self._respond(200, self.server.inference_server.metrics.snapshot())
+        elif self.path == "/health":
+            self._respond(200, {"status": "ok"})
+        else:
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/predict":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        inference_server: InferenceServer = self.server.inference_server
+
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            payloads = payload if isinstance(payload, list) else [payload]
+            samples = [inference_server.decoder(sample_payload) for sample_payload in payloads]
+        except Exception as e:
+            self._respond(400, {"error": f"Invalid payload: {e}"})
+            return
+
+        try:
+            futures = [inference_server.submit(sample) for sample in samples]
+            outputs = [future.result(inference_server.request_timeout) for future in futures]
+        except Exception as e:
+            self._respond(500, {"error": str(e)})
+            return
+
+        if isinstance(payload, list):
+            self._respond(200, {"outputs": outputs})
+        else:
+            self._respond(200, {"output": outputs[0]})
+
+    def _respond(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
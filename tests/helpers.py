@@ -0,0 +1,42 @@
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.dataset import Dataset
+
+
+def graph_model(settings: Settings | None = None, **kwargs) -> Model:
+    """Returns a model aggregating node features over edges into a graph prediction (built if settings are passed)"""
+    model = Model(**kwargs)
+    model.add_rules(
+        [
+            R.h(V.X)[1, 1] <= (R.feature(V.Y)[1, 1], R._edge(V.Y, V.X)),
+            R.predict[1, 1] <= R.h(V.X),
+        ]
+    )
+
+    if settings is not None:
+        model.build(settings)
+    return model
+
+
+def graph_dataset(samples: int) -> Dataset:
+    """Returns a dataset of two-node graphs for the graph model, differing in the feature of the first node"""
+    dataset = Dataset()
+    for i in range(samples):
+        dataset.add(R.predict[i % 2], [R.edge(1, 2), R.edge(2, 1), R.feature(1)[0.1 * i], R.feature(2)[-0.5]])
+    return dataset
+
+
+def xor_model(settings: Settings) -> tuple[Model, Dataset]:
+    """Returns a built model with a hidden layer learning XOR, and the XOR dataset"""
+    model = Model()
+    model.add_rules(
+        [
+            R.xor[1, 8] <= R.hidden,
+            R.hidden[8, 2] <= R.input,
+        ]
+    )
+    model.build(settings)
+
+    dataset = Dataset()
+    for a, b in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        dataset.add(R.xor[a ^ b], [R.input[[a, b]]])
+    return model, dataset
@@ -0,0 +1,82 @@
+import pytest
+
+from neuralogic.core import R, Settings
+from neuralogic.core.builder import batch_statistics, schedule_batches, shuffle_batches
+from neuralogic.dataset import Dataset
+from neuralogic.nn.optim import SGD
+from neuralogic.nn.trainer import Trainer
+from tests.helpers import graph_model
+
+
+def test_batch_statistics() -> None:
+    """Tests the estimated thread utilization of mini-batches processed by work stealing threads"""
+    statistics = batch_statistics([100, 10, 10, 10], 2)
+
+    assert statistics.makespan == 100
+    assert statistics.threads == 2
+    assert statistics.utilization == pytest.approx(130 / 200)
+
+    assert batch_statistics([5, 5, 5, 5], 2).utilization == pytest.approx(1.0)
+    assert batch_statistics([7], 4).threads == 1
+
+    with pytest.raises(ValueError):
+        batch_statistics([1], 0)
+
+
+def test_schedule_batches() -> None:
+    """Tests that size-aware bucketing groups samples of similar sizes and improves the utilization"""
+    work = [1000, 10, 10, 10, 1000, 10, 10, 10]
+
+    unbalanced = schedule_batches(work, 4, 2, balance=False)
+    balanced = schedule_batches(work, 4, 2)
+
+    assert unbalanced.order == list(range(8))
+    assert sorted(balanced.order) == list(range(8))
+    assert {work[index] for index in balanced.order[:2]} == {1000}
+    assert balanced.utilization > unbalanced.utilization
+    assert balanced.makespan < unbalanced.makespan
+
+    shuffled = schedule_batches(list(range(20)), 2, 2, seed=1)
+    assert sorted(shuffled.order) == list(range(20))
+    assert all(abs(shuffled.order[i] - shuffled.order[i + 1]) == 1 for i in range(0, 20, 2))
+
+    reshuffled, permutation = shuffle_batches(schedule_batches(list(range(20)), 2, 2), 2, 1)
+    assert reshuffled == shuffled
+    assert sorted(permutation) == list(range(10))
+
+    with pytest.raises(ValueError):
+        schedule_batches(work, 0)
+
+
+def test_balanced_training() -> None:
+    """Tests scheduling of a built dataset by neuron counts and training with balanced mini-batches"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+
+    dataset = Dataset()
+    for i in range(6):
+        nodes = 2 + 3 * (i % 3)
+        edges = [R.edge(j, (j + 1) % nodes) for j in range(nodes)]
+        dataset.add(R.predict[i % 2], [*edges, *(R.feature(j)[0.1 * i] for j in range(nodes))])
+
+    built = model.build_dataset(dataset, batch_size=2)
+    scheduled, schedule = built.schedule(2, seed=0)
+
+    counts = [sample.neuron_count for sample in scheduled]
+    assert sorted(counts) == sorted(sample.neuron_count for sample in built)
+    assert all(counts[i] == counts[i + 1] for i in range(0, len(counts), 2))
+    assert schedule.utilization == pytest.approx(1.0)
+
+    epoch_schedules = built.epoch_schedules(2, seed=0)
+    first, first_schedule = next(epoch_schedules)
+    second, second_schedule = next(epoch_schedules)
+
+    assert first_schedule == schedule
+    assert [sample.neuron_count for sample in first] == counts
+    assert second_schedule == built.schedule(2, seed=1)[1]
+    assert list(second._get_java_samples()) == [sample._java_sample for sample in second]
+
+    history = Trainer(model).fit(built, epochs=2, balance_batches=True, silent=True)
+
+    assert len(history.train_losses) == 2
+    assert history.batch_schedule is not None
+    assert len(history.batch_schedule.batches) == 3
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from neuralogic.core import Settings
+from neuralogic.dataset import Dataset
+from neuralogic.nn.optim import SGD
+from neuralogic.nn.optim.lr_scheduler import GeometricLR
+from neuralogic.nn.trainer import DataParallel, Trainer
+from neuralogic.nn.trainer.parallel import average_weights, split_samples
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_split_and_average() -> None:
+    """Tests balanced contiguous shards and averaging of replica weights weighted by shard sizes"""
+    assert split_samples(list(range(7)), 3) == [[0, 1], [2, 3], [4, 5, 6]]
+    assert split_samples(list(range(2)), 4) == [[0], [1]]
+
+    averaged = average_weights([{0: 1.0, 1: [1.0, 2.0]}, {0: 4.0, 1: [4.0, 8.0]}], [2, 1])
+
+    assert averaged[0] == pytest.approx(2.0)
+    assert np.allclose(averaged[1], [2.0, 4.0])
+
+
+def test_data_parallel_training() -> None:
+    """Tests that training replicas in workers updates the model weights, also within Trainer.fit"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(6)
+
+    built = model.build_dataset(dataset, batch_size=3)
+    state = model.state_dict()
+
+    with DataParallel(model, built, 2) as data_parallel:
+        assert data_parallel.steps_per_epoch == 1
+        losses = [data_parallel.train_epoch() for _ in range(3)]
+
+    assert len(losses) == 3
+    assert model.state_dict() != state
+
+    history = Trainer(model).fit(built, built, epochs=2, workers=2, sync_every=2, silent=True)
+    assert len(history.train_losses) == len(history.val_losses) == 2
+
+
+def test_single_worker_matches_serial_training() -> None:
+    """Tests that one worker trained with full-batch SGD ends with the same weights as serial training"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(4)
+
+    built = model.build_dataset(dataset, batch_size=len(dataset))
+    state = model.state_dict()
+
+    with DataParallel(model, built, 1) as data_parallel:
+        for _ in range(3):
+            data_parallel.train_epoch()
+    parallel_weights = model.state_dict()["weights"]
+
+    model.load_state_dict(state)
+    model.train_epochs(built, 3)
+    serial_weights = model.state_dict()["weights"]
+
+    for index, weight in serial_weights.items():
+        assert np.allclose(parallel_weights[index], weight)
+
+
+def test_identical_replicas_match_serial_mini_batch_training() -> None:
+    """Tests that replicas synchronized every mini-batch step on identical shards match serial mini-batch training"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+
+    shard = model.build_dataset(graph_dataset(4), batch_size=2)
+    doubled = model.build_dataset(Dataset([*graph_dataset(4).samples, *graph_dataset(4).samples]), batch_size=2)
+    state = model.state_dict()
+
+    with DataParallel(model, doubled, 2) as data_parallel:
+        assert data_parallel.steps_per_epoch == 2
+
+        for _ in range(3):
+            data_parallel.train_epoch()
+    parallel_weights = model.state_dict()["weights"]
+
+    model.load_state_dict(state)
+    model.train_epochs(shard, 3)
+    serial_weights = model.state_dict()["weights"]
+
+    for index, weight in serial_weights.items():
+        assert np.allclose(parallel_weights[index], weight)
+
+
+class _Connection:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message) -> None:
+        self.sent.append(message)
+
+    def recv(self):
+        return "ok", (1.0, 1, {0: 0.0})
+
+
+def test_replicas_train_with_current_learning_rate() -> None:
+    """Tests that every training command sends the current learning rate of the model's optimizer to the replicas"""
+    optimizer = SGD(0.1)
+    module = SimpleNamespace(
+        _dataset_builder=SimpleNamespace(model=object()),
+        _torch_module=None,
+        _settings=SimpleNamespace(optimizer=optimizer),
+        load_state_dict=lambda state: None,
+    )
+
+    data_parallel = DataParallel(module, None, 2)
+    data_parallel._connections = [_Connection(), _Connection()]
+    data_parallel._batches = [1, 1]
+
+    data_parallel.train_epoch()
+    optimizer.lr = 0.05
+    data_parallel.train_epoch()
+
+    for connection in data_parallel._connections:
+        assert [lr for _, (_, lr, _, _) in connection.sent] == [0.1, 0.05]
+
+
+def test_data_parallel_learning_rate_decay() -> None:
+    """Tests that replicas trained by Trainer.fit with a decayed learning rate match serial training"""
+    model = graph_model(Settings(optimizer=SGD(0.1, lr_decay=GeometricLR(0.5, 1))))
+
+    shard = model.build_dataset(graph_dataset(4), batch_size=4)
+    doubled = model.build_dataset(Dataset([*graph_dataset(4).samples, *graph_dataset(4).samples]), batch_size=4)
+    state = model.state_dict()
+
+    parallel_history = Trainer(model).fit(doubled, epochs=3, workers=2, silent=True)
+    parallel_weights = model.state_dict()["weights"]
+
+    serial_model = graph_model(Settings(optimizer=SGD(0.1, lr_decay=GeometricLR(0.5, 1))))
+    serial_model.load_state_dict(state)
+    serial_history = Trainer(serial_model).fit(shard, epochs=3, silent=True)
+    serial_weights = serial_model.state_dict()["weights"]
+
+    assert parallel_history.learning_rates == pytest.approx(serial_history.learning_rates)
+    for index, weight in serial_weights.items():
+        assert np.allclose(parallel_weights[index], weight)
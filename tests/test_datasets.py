@@ -1,6 +1,8 @@
 import numpy as np
 import torch
 
+from neuralogic.core.constructs.java_objects import JavaFactory
+from neuralogic.core.constructs.relation import TensorRelation
 from neuralogic.dataset import Data
 
 
@@ -270,3 +272,49 @@ def test_data_edge_features_from_python_lists() -> None:
 
     for a, b in zip(expected_examples, example):
         assert str(a) == str(b)
+
+
+def test_data_tensor_form() -> None:
+    """Tests that the tensor form of data expands to the same facts as the logic form"""
+
+    features = np.array([[0.0, 1.0], [1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    edges = torch.tensor([[0, 2], [1, 3]])
+    edge_features = np.array([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+
+    data = Data(x=features, edge_index=edges, edge_attr=edge_features, y=[0, 1, 2, 3], y_mask=[1, 2])
+    query, example = data.to_tensor_form()
+
+    expected_examples = [
+        "<[0.0, 1.0, 2.0]> edge(0, 1).",
+        "<[3.0, 4.0, 5.0]> edge(2, 3).",
+        "<[0.0, 1.0]> node_feature(0).",
+        "<[1.0, 0.0]> node_feature(1).",
+        "<[1.0, 0.0]> node_feature(2).",
+        "<[0.0, 1.0]> node_feature(3).",
+    ]
+
+    assert [str(q) for q in query] == ["1.0 predict(1).", "2.0 predict(2)."]
+    assert len(example) == 2
+    assert [str(relation) for tensor in example for relation in tensor.to_relations()] == expected_examples
+
+    expected_examples = [
+        "<1> feat_0(1).",
+        "<1> feat_0(2).",
+        "<1> feat_1(0).",
+        "<1> feat_1(3).",
+    ]
+
+    _, example = data.to_tensor_form(feature_name="feat", one_hot_decode_features=True)
+    assert [str(relation) for tensor in example[1:] for relation in tensor.to_relations()] == expected_examples
+
+
+def test_learnable_tensor_facts() -> None:
+    """Tests that learnable facts of a tensor relation are converted with their own unfixed weights"""
+    relation = TensorRelation("edge", np.array([[0, 1, 2], [1, 2, 0]]))
+    java_factory = JavaFactory()
+
+    fixed = java_factory.get_tensor_facts(relation, is_example=True)
+    learnable = java_factory.get_tensor_facts(relation, is_example=False)
+
+    assert [str(fact.originalString) for fact in fixed] == ["<1.0> edge(0, 1)", "<1.0> edge(1, 2)", "<1.0> edge(2, 0)"]
+    assert [str(fact.originalString) for fact in learnable] == ["1.0 edge(0, 1)", "1.0 edge(1, 2)", "1.0 edge(2, 0)"]
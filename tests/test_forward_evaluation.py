@@ -0,0 +1,33 @@
+import pytest
+
+from neuralogic.core import Settings
+from neuralogic.nn.loss import MSE
+from neuralogic.nn.optim import Adam
+from neuralogic.nn.trainer import Trainer
+from tests.helpers import xor_model
+
+
+def test_evaluate_without_updates() -> None:
+    """Tests that the forward-only evaluation matches outputs of test and does not change weights"""
+    model, dataset = xor_model(Settings(optimizer=Adam(0.1), error_function=MSE()))
+    built = model.build_dataset(dataset)
+
+    state = model.state_dict()
+    results = model.evaluate(built)
+
+    assert model.state_dict() == state
+    assert [output for _, output, _ in results] == model.test(built)
+    assert [target for target, _, _ in results] == [0, 1, 1, 0]
+    assert all(error >= 0 for _, _, error in results)
+
+
+def test_fit_validation_without_updates() -> None:
+    """Tests that validation in fit does not train the model on the validation dataset"""
+    model, dataset = xor_model(Settings(optimizer=Adam(0.1), error_function=MSE()))
+    built = model.build_dataset(dataset)
+
+    history = Trainer(model).fit(built, built, epochs=3, silent=True)
+    errors = [error for _, _, error in model.evaluate(built)]
+
+    assert len(history.val_losses) == 3
+    assert history.val_losses[-1] == pytest.approx(sum(errors) / len(errors))
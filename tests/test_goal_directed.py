@@ -0,0 +1,48 @@
+from neuralogic.core import C, Model, R, V
+from neuralogic.core.grounding import magic_sets
+
+
+def test_magic_sets_rewrite() -> None:
+    """Tests the magic sets rewrite of a recursive template for a query with a bound first term"""
+    rules = [
+        R.reachable(V.X, V.Y) <= R.edge(V.X, V.Y),
+        R.reachable(V.X, V.Y) <= (R.edge(V.X, V.Z), R.reachable(V.Z, V.Y)),
+        R.edge(1, 2),
+    ]
+
+    rewritten = magic_sets(rules, R.reachable(C.a, V.Y))
+
+    assert [str(entry) for entry in rewritten] == [
+        "edge(1, 2).",
+        "magic__reachable_2_bf(a).",
+        "reachable(X, Y) :- magic__reachable_2_bf(X), edge(X, Y).",
+        "magic__reachable_2_bf(Z) :- magic__reachable_2_bf(X), edge(X, Z).",
+        "reachable(X, Y) :- magic__reachable_2_bf(X), edge(X, Z), reachable(Z, Y).",
+    ]
+
+    assert magic_sets(rules, R.reachable(V.X, V.Y)) is None
+    assert magic_sets(rules, R.edge(1, V.Y)) is None
+    assert magic_sets([R.h(V.X) <= (R.e(V.X), ~R.g(V.X)), R.g(V.X) <= R.e(V.X)], R.h(1)) is None
+
+
+def test_goal_directed_query() -> None:
+    """Tests that goal-directed queries answer the same as full grounding while deriving fewer atoms"""
+    model = Model()
+    model.add_rules(
+        [
+            R.reachable(V.X, V.Y) <= R.edge(V.X, V.Y),
+            R.reachable(V.X, V.Y) <= (R.edge(V.X, V.Z), R.reachable(V.Z, V.Y)),
+        ]
+    )
+
+    examples = [R.edge(i, i + 1) for i in range(20)]
+
+    for query in [R.reachable(15, 18), R.reachable(18, 15), R.reachable(15, V.Y), R.reachable(V.X, 3)]:
+        expected = sorted(model.query(query, examples), key=str)
+        assert sorted(model.query(query, examples, goal_directed=True), key=str) == expected
+
+    derived = model.derivable_queries(examples)
+    goal_derived = model.goal_directed(R.reachable(15, V.Y)).derivable_queries(examples)
+
+    assert len([atom for atom in goal_derived if atom.predicate.name == "reachable"]) == 15
+    assert len(goal_derived) < len(derived)
@@ -0,0 +1,79 @@
+import pytest
+
+from neuralogic.core import Model, R, V
+from neuralogic.core.builder import DatasetBuilder
+from neuralogic.core.grounding import GroundingReport, RuleProfile, profile_rules
+from neuralogic.core.grounding.explain import relation_facts
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_profile_rules() -> None:
+    """Tests counts of tried substitutions, produced groundings, and peak sizes of joins"""
+    facts = relation_facts([R.edge(1, 2), R.edge(2, 3), R.edge(2, 4), R.edge(3, 3)])
+    rules = [
+        R.path(V.X, V.Z) <= (R.edge(V.X, V.Y), R.edge(V.Y, V.Z)),
+        R.loop(V.X) <= (R.edge(V.X, V.Y), R.special.neq(V.X, V.Y)),
+        R.edge(1, 2),
+    ]
+
+    path, loop = profile_rules(rules, facts)
+
+    assert (path.substitutions, path.groundings, path.peak_size) == (4 + 2 + 1 + 0 + 1, 4, 4)
+    assert (loop.substitutions, loop.groundings, loop.peak_size) == (4, 3, 4)
+
+
+def test_profile_rules_budget() -> None:
+    """Tests that joins exceeding the budget are aborted with truncated profiles"""
+    facts = relation_facts([R.edge(i, j) for i in range(20) for j in range(20)])
+    rules = [R.path(V.X, V.Z) <= (R.edge(V.X, V.Y), R.edge(V.Y, V.Z)), R.node(V.X) <= R.edge(V.X, V.X)]
+
+    path, node = profile_rules(rules, facts, max_substitutions=1000)
+
+    assert path.truncated and not node.truncated
+    assert 1000 < path.substitutions <= 1000 + 20
+    assert node.groundings == 20
+
+    report = GroundingReport([path, node], profiled_examples=1, total_examples=1)
+    assert report.truncated
+    assert str(report).splitlines()[-1].startswith("Profiling of rules marked with +")
+
+    assert all(profile.truncated for profile in profile_rules(rules, facts, max_time=0.0))
+
+
+def test_grounding_report_estimate() -> None:
+    """Tests extrapolation of the profiled costs to the whole dataset"""
+    report = GroundingReport(
+        [RuleProfile("a", 10, 4, 3, 0.5), RuleProfile("b", 2, 2, 1, 0.25)],
+        profiled_examples=2,
+        total_examples=10,
+        grounding_time=1.0,
+    )
+
+    assert report.estimate() == {"substitutions": 60, "groundings": 30, "time": 3.75, "grounding_time": 5.0}
+    assert str(report).splitlines()[2].endswith("a")
+
+
+def test_explain_grounding() -> None:
+    """Tests that the grounding of a dataset is explained per rule of the template"""
+    model = graph_model()
+    report = model.explain_grounding(graph_dataset(6), sample_size=3)
+
+    assert (report.profiled_examples, report.total_examples) == (3, 6)
+    assert [rule.groundings for rule in report.rules] == [6, 6]
+    assert not report.truncated
+
+
+def test_explain_grounding_error(monkeypatch) -> None:
+    """Tests that errors of grounding are raised instead of reporting zero costs"""
+    model = Model()
+    model.add_rules([R.h(V.X) <= R.edge(V.X, V.Y)])
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("grounding failed")
+
+    monkeypatch.setattr(DatasetBuilder, "ground_dataset", fail)
+
+    with pytest.raises(RuntimeError, match="grounding failed"):
+        model.explain_grounding([R.edge(1, 2)])
+
+    assert model.query(R.h(V.X), [R.edge(1, 2)]) == {}
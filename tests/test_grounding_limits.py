@@ -0,0 +1,141 @@
+import time
+
+import pytest
+
+from neuralogic.core import R, Settings
+from neuralogic.core.builder.parallel import GroundingWorker, ShardTask
+from neuralogic.core.grounding import GroundingLimits
+from neuralogic.core.grounding.limits import GroundingMeasurement, apply_limits
+from neuralogic.dataset import Dataset, Sample
+from neuralogic.exceptions import GroundingLimitError
+from tests.helpers import graph_model
+
+
+class _Stream:
+    def __init__(self, items: list):
+        self.items = items
+        self.pulled = 0
+        self.closed = False
+
+    def next(self, timeout: float | None) -> GroundingMeasurement:
+        if self.pulled == len(self.items):
+            raise StopIteration
+
+        item = self.items[self.pulled]
+        self.pulled += 1
+
+        if isinstance(item, type) and issubclass(item, Exception):
+            raise item
+        return item
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _measurement(edges: int, elapsed: float = 0.0) -> GroundingMeasurement:
+    return GroundingMeasurement(edges, {"path(X, Z) :- edge(X, Y), edge(Y, Z).": max(0, edges - 1)}, elapsed)
+
+
+def test_apply_limits_policies() -> None:
+    """Tests that samples exceeding per-sample limits are skipped, flagged, or raise, and rules are reported"""
+    measurements = [_measurement(2), _measurement(10), _measurement(3)]
+
+    stream = _Stream(measurements)
+    kept, diagnostics = apply_limits(stream, GroundingLimits(max_atoms=5))
+
+    assert kept == [0, 2]
+    assert stream.closed
+    assert diagnostics.skipped == [1]
+    assert diagnostics.violations[0].limit == "max_atoms"
+    assert diagnostics.violations[0].rules[0].groundings == 9
+
+    kept, diagnostics = apply_limits(_Stream(measurements), GroundingLimits(max_rule_groundings=1, policy="flag"))
+
+    assert kept == [0, 1, 2]
+    assert diagnostics.flagged == [1, 2]
+
+    with pytest.raises(GroundingLimitError) as error:
+        apply_limits(_Stream(measurements), GroundingLimits(max_atoms=5, policy="raise"))
+    assert error.value.diagnostics.violations[0].sample == 1
+
+    with pytest.raises(ValueError):
+        GroundingLimits(policy="ignore")
+
+
+def test_apply_limits_timeout_and_memory() -> None:
+    """Tests that samples timed out or out of memory are skipped and grounding continues with the next sample"""
+    stream = _Stream([_measurement(2), TimeoutError, MemoryError, _measurement(3, 0.5)])
+    kept, diagnostics = apply_limits(stream, GroundingLimits(max_time=1.0))
+
+    assert kept == [0, 3]
+    assert diagnostics.skipped == [1, 2]
+    assert not diagnostics.aborted
+    assert [violation.limit for violation in diagnostics.violations] == ["max_time", "max_memory"]
+    assert "ran out of memory" in str(diagnostics.violations[1])
+    assert diagnostics.time == pytest.approx(1.5)
+
+    stream = _Stream([_measurement(2, 0.5), TimeoutError, _measurement(3)])
+    kept, diagnostics = apply_limits(stream, GroundingLimits(max_time=1.0, max_total_time=0.8))
+
+    assert kept == [0]
+    assert stream.pulled == 2
+    assert diagnostics.aborted
+    assert diagnostics.violations[0].limit == "max_total_time"
+
+    with pytest.raises(GroundingLimitError):
+        apply_limits(_Stream([TimeoutError]), GroundingLimits(max_time=0.1, policy="raise"))
+
+
+def test_apply_limits_abort() -> None:
+    """Tests that grounding stops pulling samples once a per-dataset limit is exceeded"""
+    stream = _Stream([_measurement(edges) for edges in [2, 3, 4, 5]])
+    kept, diagnostics = apply_limits(stream, GroundingLimits(max_total_atoms=4))
+
+    assert kept == [0, 1]
+    assert stream.pulled == 2
+    assert diagnostics.aborted
+    assert diagnostics.violations[0].limit == "max_total_atoms"
+
+
+def _measure_slowly(task: ShardTask, connection, init_args: tuple) -> None:
+    connection.send(None)
+
+    for sample in task.samples:
+        if str(sample.query) == "hub.":
+            time.sleep(60)
+        connection.send(_measurement(len(sample.example)))
+
+
+def test_grounding_worker_timeout() -> None:
+    """Tests that a worker grounding a sample for too long is killed and the next sample is grounded by a new worker"""
+    samples = [Sample(R.a, [R.edge(1, 2)]), Sample(R.hub, [R.edge(1, 2)]), Sample(R.b, [R.edge(1, 2), R.edge(2, 3)])]
+    task = ShardTask(0, 0, 0, None, None, [], {}, {}, samples)
+
+    worker = GroundingWorker(task, target=_measure_slowly)
+    kept, diagnostics = apply_limits(worker, GroundingLimits(max_time=2.0))
+
+    assert kept == [0, 2]
+    assert diagnostics.skipped == [1]
+    assert diagnostics.atoms == 3
+    assert worker._process is None
+
+
+def test_ground_with_limits() -> None:
+    """Tests that samples of a built model exceeding the limits are skipped from the grounded dataset"""
+    model = graph_model(Settings())
+
+    dataset = Dataset()
+    dataset.add(R.predict, [R.edge(1, 2), R.feature(1)])
+    dataset.add(R.predict, [*[R.edge(i, i + 1) for i in range(20)], *[R.feature(i) for i in range(20)]])
+
+    with pytest.warns(UserWarning):
+        grounded = model.ground(dataset, limits=GroundingLimits(max_atoms=20))
+
+    assert len(grounded) == 1
+    assert grounded.diagnostics.skipped == [1]
+
+    with pytest.warns(UserWarning):
+        grounded = model.ground(dataset, limits=GroundingLimits(max_rule_groundings=5))
+
+    assert len(grounded) == 1
+    assert {rule.rule for rule in grounded.diagnostics.violations[0].rules} <= {str(rule) for rule in model._model}
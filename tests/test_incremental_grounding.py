@@ -0,0 +1,125 @@
+from types import SimpleNamespace
+
+import pytest
+
+from neuralogic.core import R, Settings, V
+from neuralogic.core.grounding import DependencyGraph
+from neuralogic.core.grounding.incremental import DatasetSource, apply_fact_changes, flatten_samples
+from neuralogic.dataset import Dataset, Sample
+from neuralogic.exceptions import DatasetError
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_dependency_graph() -> None:
+    """Tests reachability of predicates in the dependency graph, ignoring hidden markers and special predicates"""
+    graph = DependencyGraph(
+        [
+            R.h(V.X) <= (R.feature(V.Y), R._edge(V.Y, V.X)),
+            R.g(V.X) <= (R.h(V.X), R.special.alldiff(V.X, V.Y), R.other(V.Y)),
+            R.predict <= R.g(V.X),
+            R.unrelated <= R.other(V.X),
+            R.feature(1)[1.0],
+        ]
+    )
+
+    assert graph.reachable_from([("edge", 2)]) == {("edge", 2), ("h", 1), ("g", 1), ("predict", 0)}
+    assert graph.reachable_from([("other", 1)]) == {("other", 1), ("g", 1), ("predict", 0), ("unrelated", 0)}
+    assert graph.required_by([("unrelated", 0)]) == {("unrelated", 0), ("other", 1)}
+    assert ("alldiff", 2) not in graph.dependents
+
+
+def test_apply_fact_changes() -> None:
+    """Tests that facts are removed regardless of their values and changed predicates are reported"""
+    example = [R.edge(1, 2), R.edge(2, 3), R.feature(1)[0.5]]
+    samples = flatten_samples([Sample([R.a(1), R.a(2)], example), Sample(R.b(1), [R.edge(1, 1)])])
+
+    assert [str(sample) for sample in samples] == ["a(1).", "a(2).", "b(1)."]
+    assert samples[0].example is samples[1].example
+
+    new_example, changed = apply_fact_changes(example, [R.feature(1)[0.7]], [R.edge(2, 3), R.feature(1)])
+
+    assert [str(fact) for fact in new_example] == ["edge(1, 2).", "0.7 feature(1)."]
+    assert changed == {("edge", 2), ("feature", 1)}
+    assert len(example) == 3
+
+
+def test_dataset_source_update_iterator() -> None:
+    """Tests that facts added to all examples by an iterator are added to every example, not only the first one"""
+    examples = [[R.edge(1, 2), R.feature(1)[0.1 * i]] for i in range(3)]
+    source = DatasetSource(
+        flatten_samples([Sample(R.predict, example) for example in examples]), SimpleNamespace(model=None), None
+    )
+
+    updated, rebuild = source.update((fact for fact in [R.label(1)]), None)
+
+    assert rebuild == [0, 1, 2]
+    assert all("label(1)." in [str(fact) for fact in sample.example] for sample in updated.samples)
+
+
+def test_built_dataset_update() -> None:
+    """Tests that an incrementally updated dataset evaluates the same as a fully rebuilt dataset"""
+    model = graph_model()
+    model.add_rule(R.other[1, 1] <= R.label(V.X))
+    model.build(Settings(optimizer=SGD(0.1)))
+
+    examples = [
+        [R.edge(1, 2), R.edge(2, 1), R.feature(1)[0.5], R.feature(2)[-0.5], R.label(1)],
+        [R.edge(1, 2), R.feature(1)[0.2], R.feature(2)[0.1], R.label(2)],
+    ]
+
+    dataset = Dataset()
+    for example in examples:
+        dataset.add([R.predict[1], R.other[0]], example)
+
+    with pytest.raises(DatasetError):
+        model.build_dataset(dataset).update({1: [R.feature(1)[0.9]]})
+
+    built = model.build_dataset(dataset, updatable=True)
+    grounding_mode = str(model._settings.settings.groundingMode)
+    updated = built.update({1: [R.feature(1)[0.9]]}, {1: [R.feature(1)]})
+
+    assert str(model._settings.settings.groundingMode) == grounding_mode
+
+    assert updated[0] is built[0]
+    assert updated[1] is built[1]
+    assert updated[3] is built[3]
+    assert updated[2] is not built[2]
+
+    expected_dataset = Dataset()
+    expected_dataset.add([R.predict[1], R.other[0]], examples[0])
+    expected_dataset.add([R.predict[1], R.other[0]], [*examples[1][:1], *examples[1][2:], R.feature(1)[0.9]])
+
+    expected = model.build_dataset(expected_dataset)
+    assert model.test(updated) == model.test(expected)
+
+
+def test_train_updated_dataset() -> None:
+    """Tests that rebuilt samples of an updated dataset do not collide with the reused samples in training"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(4)
+
+    built = model.build_dataset(dataset, updatable=True)
+    updated = built.update({1: [R.feature(1)[0.9]]}, {1: [R.feature(1)]})
+
+    sample_ids = [str(sample._java_sample.getId()) for sample in updated]
+    assert len(set(sample_ids)) == len(updated)
+
+    neuron_indices = [
+        int(neuron.index) for sample in updated for neuron in sample._java_sample.query.evidence.allNeuronsTopologic
+    ]
+    assert len(set(neuron_indices)) == sum(sample.neuron_count for sample in updated)
+
+    expected_dataset = graph_dataset(4)
+    expected_dataset.samples[1] = Sample(
+        R.predict[1], [R.edge(1, 2), R.edge(2, 1), R.feature(2)[-0.5], R.feature(1)[0.9]]
+    )
+    expected = model.build_dataset(expected_dataset)
+
+    state = model.state_dict()
+    model.train(updated, epochs=5)
+    updated_results = model.test(updated)
+
+    model.load_state_dict(state)
+    model.train(expected, epochs=5)
+    assert updated_results == model.test(expected)
@@ -0,0 +1,71 @@
+from neuralogic.core import C, Model, R, V
+from neuralogic.core.inference import match_substitutions
+
+
+def test_match_substitutions() -> None:
+    """Tests matching of query terms against grounded atoms, including repeated variables"""
+    assert match_substitutions(("X", "b"), ("a", "b")) == {"X": "a"}
+    assert match_substitutions(("X", "X"), ("a", "b")) is None
+    assert match_substitutions(("X", "X"), ("a", "a")) == {"X": "a"}
+    assert match_substitutions(("a", "Y"), ("b", "c")) is None
+
+
+def test_inference_session() -> None:
+    """Tests that a session answers the same as the model, memoizes results, and reflects fact changes"""
+    model = Model()
+    model.add_rules(
+        [
+            R.nearby(V.X, V.Y) <= R.connected(V.X, V.Y, V.L),
+            R.nearby(V.X, V.Y) <= (R.connected(V.X, V.Z, V.L), R.connected(V.Z, V.Y, V.L)),
+            R.line(V.L) <= R.connected(V.X, V.Y, V.L),
+        ]
+    )
+
+    knowledge = [
+        R.connected(C.bond_street, C.oxford_circus, C.central),
+        R.connected(C.oxford_circus, C.tottenham_court_road, C.central),
+        R.connected(C.bond_street, C.green_park, C.jubilee),
+        R.connected(C.green_park, C.charing_cross, C.jubilee),
+        R.connected(C.green_park, C.oxford_circus, C.victoria),
+    ]
+
+    session = model.session(knowledge, cache_size=2)
+
+    for query in [R.nearby(V.X, C.oxford_circus), R.nearby(C.bond_street, V.Y), R.line(V.L)]:
+        expected = sorted(model.query(query, knowledge), key=str)
+        assert sorted(session.query(query), key=str) == expected
+
+    assert session.groundings == 1
+    assert session.query(R.line(V.L))
+    assert session.hits == 1
+
+    session.add_facts([R.connected(C.oxford_circus, C.piccadilly_circus, C.bakerloo)])
+    assert {"L": "bakerloo"} in session.query(R.line(V.L))
+    assert session.groundings == 2
+
+    session.remove_facts([R.connected(C.bond_street, C.oxford_circus, C.central)])
+    assert session.query(R.nearby(C.bond_street, C.oxford_circus)) == {}
+    assert session.query(R.nearby(C.green_park, C.oxford_circus)) == [{}]
+
+
+def test_query_many() -> None:
+    """Tests that multiple queries are answered from one grounding in the order of the queries"""
+    model = Model()
+    model.add_rules(
+        [
+            R.reachable(V.X, V.Y) <= R.edge(V.X, V.Y),
+            R.reachable(V.X, V.Y) <= (R.edge(V.X, V.Z), R.reachable(V.Z, V.Y)),
+        ]
+    )
+
+    examples = [R.edge(1, 2), R.edge(2, 3), R.edge(3, 4)]
+    queries = [R.reachable(1, 4), R.reachable(4, 1), R.reachable(V.X, 3), R.reachable(1, 4)]
+
+    results = model.query_many(queries, examples)
+
+    assert len(results) == len(queries)
+    assert results[0] == results[3] == [{}]
+    assert results[1] == {}
+
+    for query, result in zip(queries, results):
+        assert sorted(result, key=str) == sorted(model.query(query, examples), key=str)
@@ -0,0 +1,41 @@
+from neuralogic.core import C, R, V
+from neuralogic.core.constructs.java_objects import InternCache, JavaFactory
+
+
+def test_intern_cache() -> None:
+    """Tests counting of hits and misses and eviction of the oldest entries of a bounded intern cache"""
+    cache = InternCache(max_size=2)
+
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "a" not in cache and len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+    disabled = InternCache(max_size=0)
+    disabled.put("a", 1)
+    assert len(disabled) == 0
+
+
+def test_java_factory_interning() -> None:
+    """Tests that repeated terms and predicates are converted once per factory"""
+    factory = JavaFactory()
+    variable_factory = factory.get_variable_factory()
+
+    first = factory.get_term("abc", variable_factory)
+    assert factory.get_term("abc", variable_factory) is first
+    assert factory.get_term(C.abc, variable_factory).toString() == first.toString()
+
+    assert factory.get_term(1, variable_factory).toString() == "1"
+    assert factory.get_term(1.0, variable_factory).toString() == "1.0"
+
+    assert factory.get_term("X", variable_factory).toString() == factory.get_term(V.X, variable_factory).toString()
+
+    factory.get_predicate(R.edge(1, 2).predicate)
+    factory.get_predicate(R.edge(2, 3).predicate)
+    assert (factory.predicate_cache.hits, factory.predicate_cache.misses) == (1, 1)
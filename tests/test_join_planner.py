@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from neuralogic.core import Combination, Metadata, Model, R, Settings, V
+from neuralogic.core.constructs.relation import TensorRelation
+from neuralogic.core.grounding import FactStatistics, plan_joins
+from neuralogic.exceptions import ModelError
+
+
+def test_fact_statistics() -> None:
+    """Tests cardinalities and distinct terms gathered from relations and tensor relations"""
+    examples = [
+        [TensorRelation("edge", np.array([[0, 0, 1], [1, 2, 2]])), R.feature(0), R.feature(1)],
+        [TensorRelation("edge", np.array([[0], [1]])), R.feature(0), R.feature(1), R.feature(2)],
+    ]
+    statistics = FactStatistics.from_examples(examples, [R.label(1)])
+
+    assert statistics.cardinality == {("edge", 2): 2.0, ("feature", 1): 2.5, ("label", 1): 1.0}
+    assert statistics.distinct[(("edge", 2), 0)] == 1.5
+    assert statistics.estimate(R.edge(V.X, V.Y), {"X"}) == 2.0 / 1.5
+
+
+def test_plan_joins() -> None:
+    """Tests that bodies are reordered to avoid cross products while keeping special relations in place"""
+    examples = [[*[R.edge(i, i + 1) for i in range(10)], *[R.feature(i) for i in range(11)]]]
+    statistics = FactStatistics.from_examples(examples)
+
+    cross = R.h(V.X) <= (R.feature(V.Y), R.feature(V.X), R.edge(V.Y, V.X))
+    special = R.g(V.X) <= (R.feature(V.Y), R.feature(V.X), R.special.alldiff(...), R.edge(V.Y, V.X), R.feature(V.Z))
+    product = (R.p(V.X) <= (R.feature(V.Y), R.feature(V.X), R.edge(V.Y, V.X))) | Metadata(
+        combination=Combination.PRODUCT
+    )
+
+    entries, changes = plan_joins([cross, special, product, R.feature(1)], statistics)
+
+    assert [original for original, _ in changes] == [cross]
+    assert str(entries[0]) == "h(X) :- edge(Y, X), feature(Y), feature(X)."
+    assert entries[1] is special
+    assert entries[2] is product
+
+    assert plan_joins([cross], statistics, Combination.CONCAT) == ([cross], [])
+    assert len(plan_joins([cross], statistics, Combination.MAX)[1]) == 1
+
+
+def test_plan_joins_default_combination() -> None:
+    """Tests that rules without their own combination are reordered only for an order-insensitive rule combination"""
+    model = Model()
+    model.add_rules([R.h(V.X) <= (R.feature(V.Y), R.feature(V.X), R.edge(V.Y, V.X))])
+    example = [*[R.edge(i, i + 1) for i in range(10)], *[R.feature(i) for i in range(11)]]
+
+    assert model.plan_joins(example, Settings(rule_combination=Combination.CONCAT)) == []
+    assert str(model._model[0]) == "h(X) :- feature(Y), feature(X), edge(Y, X)."
+
+    assert len(model.plan_joins(example, Settings(rule_combination=Combination.AVG))) == 1
+
+    with pytest.raises(ModelError):
+        model.build(Settings(rule_combination=Combination.CONCAT))
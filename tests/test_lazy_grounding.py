@@ -0,0 +1,46 @@
+import pytest
+
+from neuralogic.core import Settings
+from neuralogic.core.builder import LazyGroundedDataset
+from neuralogic.exceptions import DatasetError
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_lazy_grounded_dataset() -> None:
+    """Tests that a lazily grounded dataset neuralized in chunks evaluates the same as an eagerly built dataset"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(5)
+
+    lazy_dataset = model.ground(dataset, lazy=True)
+    assert isinstance(lazy_dataset, LazyGroundedDataset)
+
+    chunks = list(lazy_dataset.neuralize(chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    with pytest.raises(DatasetError):
+        list(lazy_dataset.neuralize(chunk_size=2))
+
+    built = model.build_dataset(dataset)
+    assert [result for chunk in chunks for result in model.test(chunk)] == model.test(built)
+
+    assert len(list(model.ground(dataset, lazy=True))) == len(built)
+
+
+def test_chunked_build_dataset() -> None:
+    """Tests that a dataset built in chunks evaluates and trains the same as a dataset built at once"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(7)
+
+    built = model.build_dataset(dataset)
+    chunks = list(model.build_dataset(dataset, chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert model.test(iter(chunks)) == model.test(built)
+
+    state = model.state_dict()
+    results = model.train(model.build_dataset(dataset, chunk_size=3))
+    assert len(results) == len(built)
+
+    model.load_state_dict(state)
+    assert [result for chunk in chunks for result in model.train(chunk)] == results
@@ -0,0 +1,35 @@
+from neuralogic.core import Settings
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_lean_build() -> None:
+    """Tests that the lean build mode evaluates the same and restores strings of rules lazily"""
+    dataset = graph_dataset(2)
+
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    lean_model = graph_model(Settings(optimizer=SGD(0.1), lean_build=True))
+    lean_model.load_state_dict(model.state_dict())
+
+    assert model.test(model.build_dataset(dataset)) == lean_model.test(lean_model.build_dataset(dataset))
+
+    java_factory = lean_model._dataset_builder.java_factory
+    java_rules = [java_rule for java_rule, _ in java_factory._lean_rules]
+
+    assert len(java_rules) == 2
+    assert all(java_rule.getOriginalString() is None for java_rule in java_rules)
+
+    lean_model.build_dataset(dataset)
+    assert len(java_factory._lean_rules) == 2
+
+    java_factory.restore_debug_strings()
+    assert [str(java_rule.getOriginalString()) for java_rule in java_rules] == [str(rule) for rule in lean_model]
+
+
+def test_lean_build_template_cache(tmp_path) -> None:
+    """Tests that a template compiled in the lean build mode is cached with the strings of its rules"""
+    compiled = graph_model(Settings(lean_build=True), template_cache=tmp_path)
+    cached = graph_model(Settings(lean_build=True), template_cache=tmp_path)
+
+    assert compiled._dataset_builder.java_factory._lean_rules == []
+    assert cached._dataset_builder.java_factory._lean_rules == []
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from neuralogic.core import R, Settings
+from neuralogic.core.builder import dataset_builder
+from neuralogic.core.builder.parallel import shard_samples
+from neuralogic.dataset import Data, Dataset, Sample, TensorDataset
+from neuralogic.exceptions import BackendError
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_shard_samples() -> None:
+    """Tests that shards are contiguous, balanced, and keep samples of one example together"""
+    shared_example = [R.edge(1, 2)]
+    samples = [Sample(R.a(1), shared_example)]
+    samples.extend(Sample(R.a(i), [R.edge(i, i)]) for i in range(2, 7))
+    samples.append(Sample(R.a(2), shared_example))
+
+    shards = shard_samples(samples, 3)
+
+    assert len(shards) == 3
+    assert [str(sample) for shard in shards for sample in shard] == [
+        "a(1).",
+        "a(2).",
+        *(f"a({i})." for i in range(2, 7)),
+    ]
+    assert shards[0] == [samples[0], samples[-1], samples[1]]
+
+    assert len(shard_samples(samples, 10, min_examples=2)) == 3
+    assert len(shard_samples(samples[:1], 4, min_examples=2)) == 1
+
+
+def test_build_dataset_in_workers() -> None:
+    """Tests that samples built in worker processes evaluate the same as serially built samples"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(6)
+
+    built = model.build_dataset(dataset)
+    built_in_workers = model.build_dataset(dataset, workers=2)
+
+    assert len(built) == len(built_in_workers)
+    assert model.test(built) == model.test(built_in_workers)
+
+    model.train(built, epochs=5)
+    assert model.test(built) == model.test(built_in_workers)
+
+    sample_ids = [str(sample._java_sample.getId()) for sample in built_in_workers]
+    assert sample_ids == [str(sample._java_sample.getId()) for sample in built]
+
+    neuron_indices = [
+        int(neuron.index)
+        for sample in built_in_workers
+        for neuron in sample._java_sample.query.evidence.allNeuronsTopologic
+    ]
+    assert len(set(neuron_indices)) == sum(sample.neuron_count for sample in built_in_workers)
+
+
+def test_build_in_workers_fallback(monkeypatch) -> None:
+    """Tests that the dataset is built serially if samples built in workers cannot be serialized"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(4)
+
+    def build_shards_in_workers(tasks, workers):
+        raise BackendError("Cannot serialize samples of shard 0")
+
+    monkeypatch.setattr(dataset_builder, "build_shards_in_workers", build_shards_in_workers)
+
+    with pytest.warns(UserWarning, match="building serially"):
+        built = model.build_dataset(dataset, workers=2)
+
+    assert len(built) == 4
+
+
+def test_build_tensor_dataset_in_workers() -> None:
+    """Tests that a tensor dataset built in workers evaluates the same as the serially built dataset"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = TensorDataset(
+        [Data(x=np.array([[0.1 * i], [-0.5]]), edge_index=np.array([[0, 1], [1, 0]]), y=i % 2) for i in range(4)],
+        feature_name="feature",
+    )
+
+    built = model.build_dataset(dataset)
+    built_in_workers = model.build_dataset(dataset, workers=2)
+
+    assert model.test(built) == model.test(built_in_workers)
+
+
+def test_build_in_workers_unsplittable() -> None:
+    """Tests that a dataset with examples and queries added separately is built serially"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+
+    dataset = Dataset()
+    for i in range(4):
+        dataset.add_example([R.edge(1, 2), R.edge(2, 1), R.feature(1)[0.1 * i], R.feature(2)[-0.5]])
+        dataset.add_query(R.predict[i % 2])
+
+    assert model._dataset_builder.build_samples_in_workers(dataset, 2) is None
+    assert model.test(model.build_dataset(dataset, workers=2)) == model.test(model.build_dataset(dataset))
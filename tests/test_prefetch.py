@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from neuralogic.core import Settings
+from neuralogic.core.builder import Prefetcher
+from neuralogic.nn.optim import SGD
+from neuralogic.nn.trainer import Trainer
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_prefetcher() -> None:
+    """Tests that the prefetcher yields all items in order, keeps the statistics and propagates errors"""
+    with Prefetcher(range(5), 2) as prefetcher:
+        assert list(prefetcher) == [0, 1, 2, 3, 4]
+
+    assert prefetcher.statistics.produced == 5
+    assert prefetcher.statistics.consumed == 5
+
+    def slow():
+        for i in range(3):
+            time.sleep(0.02)
+            yield i
+
+    prefetcher = Prefetcher(slow())
+    assert list(prefetcher) == [0, 1, 2]
+    assert prefetcher.statistics.consumer_stall > 0.0
+
+    def failing():
+        yield 0
+        raise RuntimeError("failed")
+
+    prefetcher = Prefetcher(failing())
+    assert next(prefetcher) == 0
+
+    with pytest.raises(RuntimeError, match="failed"):
+        next(prefetcher)
+
+    with pytest.raises(ValueError):
+        Prefetcher(range(5), 0)
+
+
+def test_prefetcher_close() -> None:
+    """Tests that closing a prefetcher that is not consumed to the end stops the producer"""
+    prefetcher = Prefetcher(iter(range(1000)), 1)
+    assert next(prefetcher) == 0
+
+    prefetcher.close()
+
+    assert not prefetcher._thread.is_alive()
+    assert prefetcher.statistics.produced < 1000
+
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+def test_prefetched_chunked_training() -> None:
+    """Tests that chunks are built ahead while training and that Trainer.fit trains chunk by chunk"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(5)
+
+    with pytest.raises(ValueError):
+        model.build_dataset(dataset, prefetch=1)
+
+    chunks = model.build_dataset(dataset, chunk_size=2, prefetch=1)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks.statistics.produced == 3
+
+    history = Trainer(model).fit(dataset, epochs=2, chunk_size=2, prefetch=1, silent=True)
+
+    assert len(history.train_losses) == 2
+    assert len(history.prefetch) == 2
+    assert all(statistics.consumed == 3 for statistics in history.prefetch)
@@ -118,3 +118,32 @@ def test_model_evaluation_from_logic():
 
     assert len(output[0]) == 3
     assert len(output[1]) == 3
+
+
+def test_model_evaluation_from_tensor_matches_logic():
+    data = Data(
+        edge_index=[
+            [0, 1, 1, 2, 2, 0],
+            [1, 0, 2, 1, 0, 2],
+        ],
+        x=[[0], [1], [-1]],
+        y=[[1], [0], [1]],
+        y_mask=[0, 1, 2],
+    )
+
+    dataset = TensorDataset(data=[data, data])
+
+    model = Model()
+    model.add_module(
+        GCNConv(in_channels=1, out_channels=5, output_name="h0", feature_name="node_feature", edge_name="edge")
+    )
+    model.add_module(GCNConv(in_channels=5, out_channels=1, output_name="predict", feature_name="h0", edge_name="edge"))
+
+    model.build(Settings(optimizer=SGD(0.01)))
+
+    tensor_outputs = model.test(model.build_dataset(dataset))
+    logic_outputs = model.test(model.build_dataset(dataset.to_dataset()))
+
+    assert len(tensor_outputs) == len(logic_outputs) == 6
+    for tensor_output, logic_output in zip(tensor_outputs, logic_outputs):
+        assert abs(tensor_output - logic_output) < 1e-9
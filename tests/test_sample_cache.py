@@ -0,0 +1,75 @@
+import os
+import time
+
+import numpy as np
+
+from neuralogic.core import R, Settings
+from neuralogic.core.builder.cache import SampleCache, dataset_fingerprint, settings_fingerprint
+from neuralogic.dataset import Data, Dataset, TensorDataset
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_dataset_fingerprint() -> None:
+    """Tests that the dataset fingerprint depends only on the dataset content"""
+    first = Dataset().add(R.predict[1], [R.edge(1, 2), R.feature(1)[0.5]])
+    second = Dataset().add(R.predict[1], [R.edge(1, 2), R.feature(1)[0.5]])
+    third = Dataset().add(R.predict[1], [R.edge(1, 2), R.feature(1)[0.6]])
+
+    assert dataset_fingerprint(first) == dataset_fingerprint(second)
+    assert dataset_fingerprint(first) != dataset_fingerprint(third)
+
+    data = Data(x=np.array([[0.0], [1.0]]), edge_index=np.array([[0], [1]]), y=1)
+    changed_data = Data(x=np.array([[0.0], [2.0]]), edge_index=np.array([[0], [1]]), y=1)
+
+    assert dataset_fingerprint(TensorDataset([data])) == dataset_fingerprint(TensorDataset([data]))
+    assert dataset_fingerprint(TensorDataset([data])) != dataset_fingerprint(TensorDataset([changed_data]))
+
+
+def test_settings_fingerprint() -> None:
+    """Tests that the settings fingerprint changes with settings set by key, but not with the optimizer"""
+    settings = Settings()
+    fingerprint = settings_fingerprint(settings.create_disconnected_proxy())
+
+    assert settings_fingerprint(Settings(optimizer=SGD(0.5)).create_disconnected_proxy()) == fingerprint
+    assert settings_fingerprint(Settings(chain_pruning=False).create_disconnected_proxy()) != fingerprint
+
+    settings["squishLastLayer"] = True
+    assert settings_fingerprint(settings.create_disconnected_proxy()) != fingerprint
+
+
+def test_sample_cache_eviction(tmp_path) -> None:
+    """Tests eviction of cache entries by age and by size, and explicit invalidation"""
+    cache = SampleCache(tmp_path, max_size=250, max_age=100)
+    now = time.time()
+
+    for i, age in enumerate([200, 30, 20, 10]):
+        path = tmp_path / f"{i}{SampleCache.suffix}"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age, now - age))
+
+    cache.evict()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"2{SampleCache.suffix}", f"3{SampleCache.suffix}"]
+    assert cache.size() == 200
+
+    cache.invalidate("2")
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_build_dataset_with_cache(tmp_path) -> None:
+    """Tests that samples loaded from the cache evaluate the same as freshly built samples"""
+    model = graph_model(Settings(optimizer=SGD(0.1)))
+    dataset = graph_dataset(2)
+
+    built = model.build_dataset(dataset, cache_dir=tmp_path)
+    assert len(SampleCache(tmp_path)) == 1
+
+    cached = model.build_dataset(dataset, cache_dir=tmp_path)
+    assert model.test(built) == model.test(cached)
+
+    model.train(built, epochs=5)
+    assert model.test(built) == model.test(cached)
@@ -0,0 +1,123 @@
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from neuralogic.core import R, Settings
+from neuralogic.dataset import Dataset, Sample
+from neuralogic.serving import InferenceServer, ServingMetrics, decode_sample
+from tests.helpers import graph_model
+
+
+def test_decode_sample() -> None:
+    """Tests decoding of samples from JSON payloads"""
+    sample = decode_sample(
+        {
+            "query": {"name": "predict"},
+            "example": [{"name": "edge", "terms": [1, 2]}, {"name": "feature", "terms": [1], "value": 0.5}],
+        }
+    )
+
+    assert str(sample.query) == "predict."
+    assert [str(fact) for fact in sample.example] == ["edge(1, 2).", "0.5 feature(1)."]
+
+
+def test_serving_metrics() -> None:
+    """Tests latency percentiles and counters of serving metrics"""
+    metrics = ServingMetrics(window=100)
+    metrics.record_batch([0.001 * i for i in range(1, 101)], errors=1)
+    metrics.record_batch([0.5])
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["requests"] == 101
+    assert snapshot["batches"] == 2
+    assert snapshot["errors"] == 1
+    assert snapshot["mean_batch_size"] == 50.5
+    assert 50 < snapshot["latency_p50_ms"] < 53
+    assert 99 < snapshot["latency_p99_ms"] < 500
+
+    metrics.reset()
+    assert metrics.snapshot()["requests"] == 0
+
+
+def test_inference_server() -> None:
+    """Tests that the server returns the same outputs as the model, both directly and over HTTP on localhost"""
+    model = graph_model(Settings())
+
+    examples = [[R.edge(1, 2), R.edge(2, 1), R.feature(1)[0.1 * i], R.feature(2)[-0.5]] for i in range(4)]
+    expected = [model.test(Dataset([Sample(R.predict, example)]))[0] for example in examples]
+
+    payloads = [
+        {
+            "query": {"name": "predict"},
+            "example": [
+                {"name": "edge", "terms": [1, 2]},
+                {"name": "edge", "terms": [2, 1]},
+                {"name": "feature", "terms": [1], "value": 0.1 * i},
+                {"name": "feature", "terms": [2], "value": -0.5},
+            ],
+        }
+        for i in range(4)
+    ]
+
+    with InferenceServer(model, max_batch_size=4, max_wait=0.05) as server:
+        futures = [server.submit(Sample(R.predict, example)) for example in examples]
+        assert [future.result(30) for future in futures] == expected
+
+        host, port = server.address
+        request = urllib.request.Request(
+            f"http://{host}:{port}/predict",
+            data=json.dumps(payloads).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        with urllib.request.urlopen(request, timeout=30) as response:
+            assert json.loads(response.read())["outputs"] == expected
+
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=30) as response:
+            metrics = json.loads(response.read())
+
+        assert metrics["requests"] == 8
+        assert metrics["batches"] < 8
+
+
+def test_inference_server_cancelled_and_failed_requests(monkeypatch) -> None:
+    """Tests that requests cancelled while queued are dropped and unexpected errors fail only their batch"""
+    model = graph_model(Settings())
+    sample = Sample(R.predict, [R.edge(1, 2), R.feature(1)[0.5]])
+
+    server = InferenceServer(model, max_batch_size=1, max_wait=0.0)
+    evaluating, release = threading.Event(), threading.Event()
+    evaluate = server._evaluate
+
+    def predict(samples: list[Sample]) -> list[float]:
+        evaluating.set()
+        release.wait(30)
+        return [0.0] * len(samples)
+
+    def fail_once(batch: list) -> None:
+        monkeypatch.setattr(server, "_evaluate", evaluate)
+        raise RuntimeError("Unexpected error")
+
+    monkeypatch.setattr(server, "_predict", predict)
+    server.start(http=False)
+
+    try:
+        first = server.submit(sample)
+        assert evaluating.wait(30)
+
+        cancelled = server.submit(sample)
+        assert cancelled.cancel()
+
+        release.set()
+        assert first.result(30) == 0.0
+
+        monkeypatch.setattr(server, "_evaluate", fail_once)
+        with pytest.raises(RuntimeError, match="Unexpected error"):
+            server.submit(sample).result(30)
+
+        assert server.submit(sample).result(30) == 0.0
+    finally:
+        server.stop()
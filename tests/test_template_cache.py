@@ -0,0 +1,21 @@
+from neuralogic.core import Settings
+from neuralogic.core.builder import TemplateCache
+from neuralogic.nn.optim import SGD
+from tests.helpers import graph_dataset, graph_model
+
+
+def test_template_cache(tmp_path) -> None:
+    """Tests that a template loaded from the cache evaluates the same as a freshly compiled template"""
+    dataset = graph_dataset(2)
+
+    compiled = graph_model(Settings(optimizer=SGD(0.1)), template_cache=tmp_path)
+    assert len(TemplateCache(tmp_path)) == 1
+
+    cached = graph_model(Settings(optimizer=SGD(0.1)), template_cache=tmp_path)
+    assert len(TemplateCache(tmp_path)) == 1
+
+    cached.load_state_dict(compiled.state_dict())
+    assert compiled.test(compiled.build_dataset(dataset)) == cached.test(cached.build_dataset(dataset))
+
+    graph_model(Settings(optimizer=SGD(0.1), chain_pruning=False), template_cache=tmp_path)
+    assert len(TemplateCache(tmp_path)) == 2
@@ -0,0 +1,44 @@
+from neuralogic.core import Model, R, Transformation, V
+from neuralogic.core.grounding import prune_entries
+from neuralogic.dataset import Dataset
+
+
+def test_prune_entries() -> None:
+    """Tests that entries of predicates the queries do not depend on are removed"""
+    entries = [
+        R.h(V.X) <= (R.feature(V.Y), R._edge(V.Y, V.X)),
+        R.predict <= R.h(V.X),
+        R.other <= R.label(V.X),
+        R.label(1)[0.5],
+        R.feature(1)[0.5],
+        R.other / 0 | [Transformation.SIGMOID],
+    ]
+
+    kept, report = prune_entries(entries, [R.predict])
+
+    assert kept == entries[:2] + entries[4:5]
+    assert report.removed == [entries[2], entries[3], entries[5]]
+    assert report.predicates == {("predict", 0), ("h", 1), ("feature", 1), ("edge", 2)}
+
+    kept, _ = prune_entries(entries, [R.combined], [R.combined <= (R.predict, R.other)])
+    assert kept == entries
+
+
+def test_model_prune() -> None:
+    """Tests pruning of the model for the queries of a dataset"""
+    model = Model()
+    model.add_rules(
+        [
+            R.h(V.X) <= (R.feature(V.Y), R._edge(V.Y, V.X)),
+            R.predict <= R.h(V.X),
+            R.other <= R.label(V.X),
+        ]
+    )
+
+    dataset = Dataset()
+    dataset.add(R.predict[1], [R.edge(1, 2), R.feature(1), R.label(1)])
+
+    report = model.prune(dataset)
+
+    assert len(report.removed) == 1
+    assert str(model) == "h(X) :- feature(Y), *edge(Y, X).\npredict :- h(X)."
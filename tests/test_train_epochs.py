@@ -0,0 +1,48 @@
+import pytest
+
+from neuralogic.core import Settings
+from neuralogic.nn.optim import SGD
+from neuralogic.nn.trainer import Trainer, TrainerCallback
+from tests.helpers import xor_model
+
+
+def test_train_epochs_statistics() -> None:
+    """Tests statistics collected on an epoch stride and stopping by the callback"""
+    model, dataset = xor_model(Settings(optimizer=SGD(0.1)))
+    built = model.build_dataset(dataset)
+
+    statistics = model.train_epochs(built, 5, stride=2, outputs=True)
+
+    assert statistics.epochs == [1, 3, 4]
+    assert len(statistics.loss_sums) == len(statistics.losses) == 3
+    assert [outputs.shape for outputs in statistics.outputs] == [(4,)] * 3
+
+    stopped = model.train_epochs(built, 10, callback=lambda epoch, _: epoch == 2)
+    assert stopped.epochs == [0, 1, 2]
+    assert stopped.outputs is None
+
+
+def test_fit_with_epoch_stride() -> None:
+    """Tests that Trainer.fit trains all epochs in one backend call, calling callbacks every stride"""
+    model, dataset = xor_model(Settings(optimizer=SGD(0.1)))
+    built = model.build_dataset(dataset)
+
+    assert built._get_java_samples() is built._get_java_samples()
+
+    class StopAfter(TrainerCallback):
+        def __init__(self) -> None:
+            self.epochs: list[int] = []
+
+        def on_epoch_end(self, trainer: Trainer, epoch: int, logs: dict) -> None:
+            self.epochs.append(epoch)
+            trainer.stop_training = epoch >= 5
+
+    callback = StopAfter()
+    history = Trainer(model).fit(built, epochs=10, stride=3, callbacks=[callback], silent=True)
+
+    assert callback.epochs == [2, 5]
+    assert len(history.train_losses) == len(history.learning_rates) == 2
+    assert history.stopped_early
+
+    with pytest.raises(ValueError):
+        Trainer(model).fit(built, built, epochs=2, stride=2, silent=True)
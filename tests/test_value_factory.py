@@ -0,0 +1,62 @@
+import numpy as np
+
+from neuralogic.core import Model, R, Settings, V
+from neuralogic.core.constructs.java_objects import ValueFactory
+from neuralogic.dataset import Dataset, Sample
+
+
+def test_value_factory_bulk_conversion() -> None:
+    """Tests round trips of scalars, vectors, and matrices through the bulk conversion paths"""
+    value_factory = ValueFactory()
+
+    vector = np.array([0.5, -1.0, 2.0])
+    matrix = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    _, vector_value = value_factory.get_value(vector)
+    _, row_value = value_factory.get_value(vector.reshape(1, 3))
+    _, matrix_value = value_factory.get_value(matrix)
+    _, list_matrix_value = value_factory.get_value(matrix.tolist())
+
+    assert np.array_equal(ValueFactory.to_numpy(vector_value), vector)
+    assert np.array_equal(ValueFactory.to_numpy(row_value).reshape(-1), vector)
+    assert np.array_equal(ValueFactory.to_numpy(matrix_value), matrix)
+    assert ValueFactory.from_java(list_matrix_value) == matrix.tolist()
+
+    ValueFactory.set_value(vector_value, -vector)
+    ValueFactory.set_value(matrix_value, (matrix * 2).tolist())
+
+    assert np.array_equal(ValueFactory.to_numpy(vector_value), -vector)
+    assert np.array_equal(ValueFactory.to_numpy(matrix_value), matrix * 2)
+
+    _, scalar_value = value_factory.get_value(1.5)
+    ValueFactory.set_value(scalar_value, 3.0)
+    assert ValueFactory.from_java(scalar_value) == 3.0
+
+
+def test_predict() -> None:
+    """Tests that batched prediction returns the same outputs as testing, stacked into one array"""
+    model = Model()
+    model.add_rules(
+        [
+            R.h(V.X)[2, 1] <= (R.feature(V.Y)[1, 1], R._edge(V.Y, V.X)),
+            R.predict[1, 2] <= R.h(V.X),
+            R.vector(V.X)[2, 1] <= R.feature(V.X),
+        ]
+    )
+    model.build(Settings())
+
+    dataset = Dataset()
+    for i in range(5):
+        dataset.add(R.predict, [R.edge(1, 2), R.edge(2, 1), R.feature(1)[0.1 * i], R.feature(2)[-0.5]])
+
+    built = model.build_dataset(dataset)
+    outputs = model.predict(built, batch_size=2)
+
+    assert outputs.shape == (5,)
+    assert outputs.tolist() == model.test(built)
+
+    vector_dataset = Dataset([Sample(R.vector(1), [R.feature(1)[0.1 * i]]) for i in range(3)])
+    vector_outputs = model.predict(vector_dataset)
+
+    assert vector_outputs.shape == (3, 2)
+    assert vector_outputs.tolist() == model.test(vector_dataset)